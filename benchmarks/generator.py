@@ -0,0 +1,164 @@
+'''
+Seeded generator of realistic scheduling instances, used by the benchmarks.
+
+A generated university has one degree per 1000 students, each with three years of five courses.
+Every course has theoretical (T), theoretical-practical (TP) and practical-laboratory (PL) shifts,
+with enough seats for the course's students, and 2-hour classes between 8:00 and 20:00 in rooms
+shared by the whole campus. No room is double-booked, and the theoretical classes of a year don't
+overlap with any other class of that year. Most students are enrolled in the courses of their
+year, but some also retake courses from previous years.
+'''
+
+import datetime
+import math
+import random
+
+from scheduler.types import Course, Room, Shift, ShiftType, Student, Timeslot, Weekday
+
+STUDENTS_PER_DEGREE = 1000
+YEARS = 3
+COURSES_PER_YEAR = 5
+RETAKE_PROBABILITY = 0.2
+
+# Type of shift: (seats of the rooms used, weekly classes per shift)
+_SHIFT_KINDS = {
+    ShiftType.T: ((100, 300), 2),
+    ShiftType.TP: ((30, 60), 1),
+    ShiftType.PL: ((20, 40), 1)
+}
+
+_DAY_SLOTS = [(day, hour) for day in Weekday for hour in range(8, 20, 2)]
+
+# Random (room, time slots) choices tried before looking for the free ones
+_BOOKING_ATTEMPTS = 100
+
+def generate(students: int, seed: int = 0) -> list[Student]:
+    '''
+    Generates an instance with a given number of students.
+
+    :param students: Number of students.
+    :param seed:     Seed of the random number generator. The same seed always generates the same
+                     instance.
+
+    :raises ValueError: There aren't enough free rooms for the classes of the instance.
+    '''
+
+    rng = random.Random(seed)
+    degrees = max(1, math.ceil(students / STUDENTS_PER_DEGREE))
+
+    rooms = {
+        shift_type: [
+            Room(f'Building {degree}', f'{shift_type}.{i}', rng.randrange(*seats))
+            for degree in range(degrees)
+            for i in range(10)
+        ]
+        for shift_type, (seats, _) in _SHIFT_KINDS.items()
+    }
+
+    used_slots: set[tuple[int, Weekday, int]] = set()
+    result: list[Student] = []
+    for degree in range(degrees):
+        degree_students = min(STUDENTS_PER_DEGREE, students - degree * STUDENTS_PER_DEGREE)
+        year_students = math.ceil(degree_students / YEARS)
+
+        # Each year of the degree has its own time slots for theoretical classes
+        slots = rng.sample(_DAY_SLOTS, len(_DAY_SLOTS))
+        slots_per_year = COURSES_PER_YEAR * _SHIFT_KINDS[ShiftType.T][1]
+        years = [
+            _generate_year(
+                rng,
+                rooms,
+                used_slots,
+                slots[year * slots_per_year:(year + 1) * slots_per_year],
+                f'D{degree}Y{year}',
+                year_students
+            )
+            for year in range(YEARS)
+        ]
+
+        for i in range(degree_students):
+            year = i % YEARS
+            courses = list(years[year])
+            if year > 0 and rng.random() < RETAKE_PROBABILITY:
+                courses.append(rng.choice(years[rng.randrange(year)]))
+
+            result.append(Student(f'A{degree:03}{i:04}', courses))
+
+    return result
+
+def _generate_year(
+        rng: random.Random,
+        rooms: dict[ShiftType, list[Room]],
+        used_slots: set[tuple[int, Weekday, int]],
+        theoretical_slots: list[tuple[Weekday, int]],
+        name: str,
+        year_students: int
+    ) -> list[Course]:
+
+    # All theoretical shifts of a course are taught at the same time, in different rooms. Other
+    # classes of the year are outside of these time slots.
+    classes_t = _SHIFT_KINDS[ShiftType.T][1]
+    practical_slots = [slot for slot in _DAY_SLOTS if slot not in theoretical_slots]
+    courses = []
+
+    for i in range(COURSES_PER_YEAR):
+        course = Course(f'{name} Course {i}')
+        course_slots = theoretical_slots[i * classes_t:(i + 1) * classes_t]
+
+        for shift_type, (_, classes) in _SHIFT_KINDS.items():
+            seats = 0
+            number = 0
+
+            # Leave some slack for students retaking the course
+            while seats < year_students * (1 + RETAKE_PROBABILITY):
+                number += 1
+                room, slots = _book_room(
+                    rng,
+                    rooms[shift_type],
+                    used_slots,
+                    course_slots if shift_type == ShiftType.T else practical_slots,
+                    classes
+                )
+
+                timeslots = [
+                    Timeslot(day, datetime.time(hour), datetime.time(hour + 2), room)
+                    for day, hour in slots
+                ]
+                course.add_shift(Shift(shift_type, number, timeslots))
+                seats += room.capacity or 0
+
+        courses.append(course)
+
+    return courses
+
+def _book_room(
+        rng: random.Random,
+        rooms: list[Room],
+        used_slots: set[tuple[int, Weekday, int]],
+        slots: list[tuple[Weekday, int]],
+        classes: int
+    ) -> tuple[Room, list[tuple[Weekday, int]]]:
+
+    # Rooms are identified by id() in used_slots, as rooms with the same name are equal
+    for _ in range(_BOOKING_ATTEMPTS):
+        room = rng.choice(rooms)
+        chosen_slots = rng.sample(slots, classes)
+        keys = [(id(room), day, hour) for day, hour in chosen_slots]
+
+        if not any(key in used_slots for key in keys):
+            used_slots.update(keys)
+            return room, chosen_slots
+
+    # Most rooms are busy: choose among those that are still free often enough
+    free_slots = {
+        id(room): [(day, hour) for day, hour in slots if (id(room), day, hour) not in used_slots]
+        for room in rooms
+    }
+    free_rooms = [room for room in rooms if len(free_slots[id(room)]) >= classes]
+    if not free_rooms:
+        raise ValueError(f'No room is free for {classes} more classes')
+
+    room = rng.choice(free_rooms)
+    chosen_slots = rng.sample(free_slots[id(room)], classes)
+    used_slots.update((id(room), day, hour) for day, hour in chosen_slots)
+    return room, chosen_slots
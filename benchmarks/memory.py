@@ -0,0 +1,89 @@
+'''
+Measures the memory used by the objects in :mod:`scheduler.types`, for a graph with the size of a
+university degree. Run with ``python -m benchmarks.memory``.
+
+The graph is built one layer at a time (rooms, timeslots, shifts, courses and then students), and
+the memory allocated by each layer, measured with :mod:`tracemalloc`, is divided by the number of
+objects in it. This includes the memory of the collections owned by each object, but not of the
+objects they reference.
+'''
+
+import argparse
+import datetime
+import random
+import tracemalloc
+
+from scheduler.types import Course, Room, Shift, ShiftType, Student, Timeslot, Weekday
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure the memory used by scheduler types')
+    parser.add_argument('--students', type=int, default=5000, help='Number of students')
+    parser.add_argument('--years', type=int, default=3, help='Number of years in the degree')
+    parser.add_argument('--courses', type=int, default=10, help='Number of courses per year')
+    parser.add_argument('--rooms', type=int, default=150, help='Number of rooms in campus')
+    parser.add_argument('--seed', type=int, default=0, help='Random number generator seed')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    layers: list[tuple[str, int, int]] = []
+
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    rooms = [
+        Room(f'CP{i % 5 + 1}', f'{i // 30}.{i % 30:02}', rng.randrange(20, 200))
+        for i in range(args.rooms)
+    ]
+    layers.append(('Room', len(rooms), tracemalloc.get_traced_memory()[0] - before))
+
+    # Every course has 1 T, 4 TP and 8 PL shifts, with two weekly 2-hour classes each
+    shift_kinds = [ShiftType.T] + [ShiftType.TP] * 4 + [ShiftType.PL] * 8
+    n_shifts = args.years * args.courses * len(shift_kinds)
+
+    before = tracemalloc.get_traced_memory()[0]
+    timeslots: list[list[Timeslot]] = []
+    for _ in range(n_shifts):
+        days = rng.sample(list(Weekday), 2)
+        hours = [rng.randrange(8, 18) for _ in days]
+        timeslots.append([
+            Timeslot(day, datetime.time(hour), datetime.time(hour + 2), rng.choice(rooms))
+            for day, hour in zip(days, hours)
+        ])
+    layers.append(('Timeslot', 2 * n_shifts, tracemalloc.get_traced_memory()[0] - before))
+
+    before = tracemalloc.get_traced_memory()[0]
+    shifts: list[Shift] = []
+    for i in range(n_shifts):
+        shift_type = shift_kinds[i % len(shift_kinds)]
+        number = shift_kinds[:i % len(shift_kinds) + 1].count(shift_type)
+        shifts.append(Shift(shift_type, number, timeslots[i]))
+    layers.append(('Shift', len(shifts), tracemalloc.get_traced_memory()[0] - before))
+
+    before = tracemalloc.get_traced_memory()[0]
+    courses = [
+        Course(f'Course {i}', shifts[i * len(shift_kinds):(i + 1) * len(shift_kinds)])
+        for i in range(args.years * args.courses)
+    ]
+    layers.append(('Course', len(courses), tracemalloc.get_traced_memory()[0] - before))
+
+    before = tracemalloc.get_traced_memory()[0]
+    students = [
+        Student(
+            f'A{100000 + i}',
+            courses[(i % args.years) * args.courses:(i % args.years + 1) * args.courses]
+        )
+        for i in range(args.students)
+    ]
+    layers.append(('Student', len(students), tracemalloc.get_traced_memory()[0] - before))
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{"Type":<10} {"Objects":>10} {"Bytes":>12} {"Bytes/object":>14}')
+    for name, count, size in layers:
+        print(f'{name:<10} {count:>10} {size:>12} {size / max(count, 1):>14.1f}')
+    print(f'{"Total":<10} {"":>10} {sum(size for _, _, size in layers):>12}')
+    print(f'Peak traced memory: {peak} bytes')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+'''
+Times the scheduler on synthetic instances (see :mod:`benchmarks.generator`). Run with
+``python -m benchmarks.suite``.
+
+The following benchmarks are available:
+
+* ``generate`` - building the graph of rooms, timeslots, shifts, courses and students;
+* ``timeslot_overlaps`` - calls to :meth:`~scheduler.types.timeslot.Timeslot.overlaps`;
+* ``shift_overlaps`` - calls to :meth:`~scheduler.types.shift.Shift.overlaps`;
+* ``model_build`` - building a :class:`~scheduler.solver.model.Model` for all students;
+* ``solve`` - solving the instance with :func:`~scheduler.solver.decomposition.solve_components`;
+* ``solve_<backend>`` - the same, with each installed solver backend
+  (:func:`~scheduler.solver.backends.available_backends`), to compare their times;
+* ``heuristic`` - solving the instance with :func:`~scheduler.solver.heuristic.solve_heuristic`.
+
+Each benchmark is run ``--repeat`` times, and its best time is kept. Results can be saved as JSON
+with ``--output``, and compared with a previously saved file with ``--baseline``. When any
+benchmark becomes slower than its baseline by more than ``--tolerance``, the program exits with
+status 1.
+'''
+
+from collections.abc import Callable
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from scheduler.solver import (
+    Model,
+    available_backends,
+    get_backend,
+    solve_components,
+    solve_heuristic
+)
+from scheduler.types import Shift, Student
+
+from .generator import generate
+
+SCALES = {'1k': 1000, '10k': 10000, '100k': 100000}
+
+# Number of pairs of objects tested by the overlap benchmarks
+OVERLAP_PAIRS = 200000
+
+def _overlap_pairs(students: list[Student], seed: int) -> list[tuple[Shift, Shift]]:
+    # Courses are identified by id(), as courses with the same name are equal
+    courses = {id(course): course for s in students for course in s.courses.values()}
+    shifts = [shift for course in courses.values() for shift in course.shifts.values()]
+
+    rng = random.Random(seed)
+    return [(rng.choice(shifts), rng.choice(shifts)) for _ in range(OVERLAP_PAIRS)]
+
+def _benchmarks(
+        students: int,
+        seed: int
+    ) -> dict[str, tuple[Callable[[], object], Callable[[], int]]]:
+
+    # Lazily generated instance, shared by all benchmarks but the one that times generation
+    instance: list[list[Student]] = []
+    pairs: list[list[tuple[Shift, Shift]]] = []
+
+    def get_instance() -> list[Student]:
+        if not instance:
+            instance.append(generate(students, seed))
+        return instance[0]
+
+    def get_pairs() -> list[tuple[Shift, Shift]]:
+        if not pairs:
+            pairs.append(_overlap_pairs(get_instance(), seed))
+        return pairs[0]
+
+    def timeslot_overlaps() -> int:
+        for shift1, shift2 in get_pairs():
+            shift1.timeslots[0].overlaps(shift2.timeslots[0])
+        return OVERLAP_PAIRS
+
+    def shift_overlaps() -> int:
+        for shift1, shift2 in get_pairs():
+            shift1.overlaps(shift2)
+        return OVERLAP_PAIRS
+
+    def solve_backend(name: str) -> Callable[[], int]:
+        return lambda: len(
+            solve_components(get_instance(), compress=False, backend=get_backend(name))
+        )
+
+    # Each benchmark has a setup function, called before timing, and a function to time, that
+    # returns the number of operations performed.
+    benchmarks: dict[str, tuple[Callable[[], object], Callable[[], int]]] = {
+        'generate': (lambda: None, lambda: len(generate(students, seed))),
+        'timeslot_overlaps': (get_pairs, timeslot_overlaps),
+        'shift_overlaps': (get_pairs, shift_overlaps),
+        'model_build': (get_instance, lambda: len(Model(get_instance()).objective)),
+        'solve': (
+            get_instance,
+            lambda: len(solve_components(get_instance(), compress=False))
+        ),
+        'heuristic': (get_instance, lambda: len(solve_heuristic(get_instance())))
+    }
+
+    for name in available_backends():
+        benchmarks[f'solve_{name}'] = (get_instance, solve_backend(name))
+
+    return benchmarks
+
+def run(
+        students: int,
+        seed: int = 0,
+        names: None | list[str] = None,
+        repeat: int = 1
+    ) -> dict[str, dict[str, float]]:
+    '''
+    Runs benchmarks on a synthetic instance.
+
+    :param students: Number of students in the instance.
+    :param seed:     Seed of the instance generator.
+    :param names:    Names of the benchmarks to run. ``None`` runs all of them.
+    :param repeat:   Number of times each benchmark is run. Only the best time is kept.
+
+    :return: For each benchmark, its best time (``seconds``), the number of operations it performed
+             (``operations``), and the number of operations per second (``throughput``).
+    '''
+
+    benchmarks = _benchmarks(students, seed)
+    results: dict[str, dict[str, float]] = {}
+
+    for name in names or list(benchmarks):
+        setup, function = benchmarks[name]
+        setup()
+
+        best = float('inf')
+        operations = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            operations = function()
+            best = min(best, time.perf_counter() - start)
+
+        results[name] = {
+            'seconds': best,
+            'operations': operations,
+            'throughput': operations / best if best > 0 else float('inf')
+        }
+
+    return results
+
+def compare(
+        results: dict[str, dict[str, float]],
+        baseline: dict[str, dict[str, float]],
+        tolerance: float
+    ) -> list[tuple[str, float, float, bool]]:
+    '''
+    Compares benchmark results with a baseline. Only benchmarks present in both are compared.
+
+    :param results:   Results of :func:`run`.
+    :param baseline:  Previous results of :func:`run`.
+    :param tolerance: Maximum accepted slowdown, as a fraction of the baseline time.
+
+    :return: For each benchmark, its name, its baseline and current times, and whether it
+             regressed.
+    '''
+
+    return [
+        (
+            name,
+            baseline[name]['seconds'],
+            result['seconds'],
+            result['seconds'] > baseline[name]['seconds'] * (1 + tolerance)
+        )
+        for name, result in results.items()
+        if name in baseline
+    ]
+
+def main() -> None:
+    names = list(_benchmarks(0, 0))
+
+    parser = argparse.ArgumentParser(description='Time the scheduler on synthetic instances')
+    parser.add_argument('--scale', choices=SCALES, default='1k', help='Number of students')
+    parser.add_argument('--seed', type=int, default=0, help='Random number generator seed')
+    parser.add_argument(
+        '--benchmarks',
+        nargs='+',
+        choices=names,
+        default=names,
+        help='Benchmarks to run (default: all)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Runs of each benchmark')
+    parser.add_argument('--output', help='JSON file to write results to')
+    parser.add_argument('--baseline', help='JSON file with results to compare against')
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.1,
+        help='Accepted slowdown relative to the baseline (default: 0.1)'
+    )
+    args = parser.parse_args()
+
+    results = run(SCALES[args.scale], args.seed, args.benchmarks, args.repeat)
+
+    print(f'{"Benchmark":<20} {"Seconds":>12} {"Operations":>12} {"Operations/s":>14}')
+    for name, result in results.items():
+        print(
+            f'{name:<20} {result["seconds"]:>12.4f} {result["operations"]:>12.0f} '
+            f'{result["throughput"]:>14.1f}'
+        )
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(
+                {
+                    'scale': args.scale,
+                    'seed': args.seed,
+                    'python': platform.python_version(),
+                    'results': results
+                },
+                file,
+                indent=4
+            )
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        if (baseline['scale'], baseline['seed']) != (args.scale, args.seed):
+            print('Baseline was obtained with a different scale or seed', file=sys.stderr)
+            sys.exit(2)
+
+        comparison = compare(results, baseline['results'], args.tolerance)
+
+        print()
+        print(f'{"Benchmark":<20} {"Baseline":>12} {"Current":>12} {"Change":>10}')
+        for name, before, after, regressed in comparison:
+            marker = ' REGRESSION' if regressed else ''
+            print(f'{name:<20} {before:>12.4f} {after:>12.4f} {after / before - 1:>+10.1%}{marker}')
+
+        if any(regressed for *_, regressed in comparison):
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,286 @@
+import argparse
+import asyncio
+import json
+import sys
+
+from .io import (
+    TIMETABLE_FORMATS,
+    Loader,
+    LoaderError,
+    SnapshotError,
+    TimetableError,
+    export_timetables,
+    read_rows,
+    read_snapshot,
+    write_snapshot
+)
+from .service import QueryService, QueryServiceError, serve as serve_queries
+from .solver import (
+    BACKEND_NAMES,
+    BackendError,
+    HeuristicError,
+    ModelError,
+    RaceBackend,
+    available_backends,
+    check_feasibility,
+    get_backend,
+    solve_components,
+    solve_heuristic,
+    validate
+)
+from .tracing import Tracer, set_tracer, span
+from .types import Student
+
+def load_tables(args: argparse.Namespace) -> Loader:
+    loader = Loader()
+    loader.load_rooms(read_rows(args.rooms))
+    loader.load_timeslots(read_rows(args.timeslots))
+    loader.load_enrollments(read_rows(args.enrollments))
+    return loader
+
+def load_students(args: argparse.Namespace) -> list[Student]:
+    if args.snapshot is not None:
+        return read_snapshot(args.snapshot)[0]
+    else:
+        return list(load_tables(args).students.values())
+
+def snapshot(args: argparse.Namespace) -> None:
+    loader = load_tables(args)
+    with span('export'):
+        write_snapshot(args.output, loader.students.values(), loader.courses.values())
+
+def check(students: list[Student], soft_overlaps: bool) -> None:
+    report = check_feasibility(students, soft_overlaps)
+    if report.unknown_capacity:
+        print(
+            f'Warning: {len(report.unknown_capacity)} shifts of unknown capacity',
+            file=sys.stderr
+        )
+
+    if not report.feasible:
+        problems = [
+            f'{course} {shift_type}: {enrolled} students, {capacity} seats'
+            for course, shift_type, enrolled, capacity in report.under_capacity
+        ] + [
+            f'{course} {shift_type}: {enrolled} students also in {other}, {capacity} seats '
+            'compatible with it'
+            for course, shift_type, other, enrolled, capacity in report.conflicting
+        ]
+        raise ModelError('No valid assignment exists:\n  ' + '\n  '.join(problems))
+
+def solve(args: argparse.Namespace) -> None:
+    students = load_students(args)
+    if not args.no_check:
+        check(students, args.soft_overlaps)
+
+    if args.heuristic:
+        assignment = solve_heuristic(students)
+    elif args.race:
+        # Racing processes can't be started from worker processes, so components are solved one
+        # at a time
+        names = args.backend or available_backends()
+        backend = RaceBackend([get_backend(name) for name in names])
+        assignment = solve_components(
+            students,
+            args.soft_overlaps,
+            args.compress,
+            args.time_limit,
+            1,
+            backend
+        )
+    else:
+        assignment = solve_components(
+            students,
+            args.soft_overlaps,
+            args.compress,
+            args.time_limit,
+            backend=get_backend(args.backend[0] if args.backend else 'highs')
+        )
+
+    report = validate(students, assignment)
+    if not report.valid:
+        print(
+            'Warning: invalid assignment: '
+            f'{len(report.unknown)} unknown shifts, '
+            f'{len(report.missing)} missing shifts, '
+            f'{len(report.repeated)} repeated shift types, '
+            f'{len(report.overlaps)} overlaps, '
+            f'{len(report.over_capacity)} shifts over capacity, '
+            f'{len(report.double_booked)} double-booked rooms',
+            file=sys.stderr
+        )
+
+    with span('export'):
+        if args.output is None:
+            json.dump(assignment, sys.stdout, indent=4)
+            print()
+        else:
+            with open(args.output, 'w', encoding='utf-8') as file:
+                json.dump(assignment, file, indent=4)
+
+    if args.timetables is not None:
+        export_timetables(args.timetables, assignment, students, args.timetable_format)
+
+def serve(args: argparse.Namespace) -> None:
+    students = load_students(args)
+    with open(args.assignment, encoding='utf-8') as file:
+        try:
+            assignment = json.load(file)
+            service = QueryService(students, assignment, cache_size=args.cache_size)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            # Malformed JSON, or an assignment of unknown courses or shifts
+            raise QueryServiceError(f'Invalid assignment in {args.assignment!r}: {e!r}') from e
+    print(f'Serving on http://{args.host}:{args.port}', file=sys.stderr)
+    try:
+        asyncio.run(serve_queries(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
 def main() -> None:
-    print('Hello, world!')
+    parser = argparse.ArgumentParser(prog='scheduler', description='Schedule generator')
+    parser.add_argument('--trace', help='File to write a trace of the program\'s phases to')
+    parser.add_argument(
+        '--trace-format',
+        choices=('json', 'chrome'),
+        default='json',
+        help='Format of the trace (default: json)'
+    )
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Measure the peak memory of each phase (slow)'
+    )
+    subparsers = parser.add_subparsers(required=True)
+
+    snapshot_parser = subparsers.add_parser(
+        'snapshot',
+        help='Convert tables to a snapshot, that can be loaded faster'
+    )
+    snapshot_parser.add_argument('rooms', help='Room table')
+    snapshot_parser.add_argument('timeslots', help='Timeslot table')
+    snapshot_parser.add_argument('enrollments', help='Enrollment table')
+    snapshot_parser.add_argument('output', help='Snapshot file to write')
+    snapshot_parser.set_defaults(command=snapshot)
+
+    solve_parser = subparsers.add_parser('solve', help='Attribute shifts to students')
+    solve_parser.add_argument('rooms', nargs='?', help='Room table')
+    solve_parser.add_argument('timeslots', nargs='?', help='Timeslot table')
+    solve_parser.add_argument('enrollments', nargs='?', help='Enrollment table')
+    solve_parser.add_argument('--snapshot', help='Snapshot to load instead of the tables')
+    solve_parser.add_argument('-o', '--output', help='JSON file to write the assignment to')
+    solve_parser.add_argument(
+        '--timetables',
+        help='Directory to write the timetable of each student to'
+    )
+    solve_parser.add_argument(
+        '--timetable-format',
+        choices=TIMETABLE_FORMATS,
+        default='ics',
+        help='Format of the timetables (default: ics)'
+    )
+    solve_parser.add_argument(
+        '--heuristic',
+        action='store_true',
+        help='Use a greedy heuristic instead of solving an integer program'
+    )
+    solve_parser.add_argument(
+        '--soft-overlaps',
+        action='store_true',
+        help='Allow overlapping shifts, at a cost'
+    )
+    solve_parser.add_argument(
+        '--compress',
+        action='store_true',
+        help='Group students enrolled in the same courses'
+    )
+    solve_parser.add_argument(
+        '--no-check',
+        action='store_true',
+        help='Don\'t check for too few seats before solving'
+    )
+    solve_parser.add_argument(
+        '--time-limit',
+        type=float,
+        help='Time limit of the solver, in seconds'
+    )
+    solve_parser.add_argument(
+        '--backend',
+        action='append',
+        choices=BACKEND_NAMES,
+        help='Integer programming solver (default: highs). Can be repeated with --race'
+    )
+    solve_parser.add_argument(
+        '--race',
+        action='store_true',
+        help='Run the solvers given with --backend (default: all installed) in parallel, keeping '
+             'the first optimal solution. Independent parts of the problem are then solved one at '
+             'a time, instead of in parallel'
+    )
+    solve_parser.set_defaults(command=solve)
+
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Answer queries about an assignment over HTTP'
+    )
+    serve_parser.add_argument('rooms', nargs='?', help='Room table')
+    serve_parser.add_argument('timeslots', nargs='?', help='Timeslot table')
+    serve_parser.add_argument('enrollments', nargs='?', help='Enrollment table')
+    serve_parser.add_argument('--snapshot', help='Snapshot to load instead of the tables')
+    serve_parser.add_argument(
+        '-a',
+        '--assignment',
+        required=True,
+        help='JSON file with the assignment (see solve)'
+    )
+    serve_parser.add_argument(
+        '--host',
+        default='localhost',
+        help='Address to listen on (default: localhost)'
+    )
+    serve_parser.add_argument(
+        '--port',
+        type=int,
+        default=8080,
+        help='Port to listen on (default: 8080)'
+    )
+    serve_parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=1024,
+        help='Maximum number of cached timetables (default: 1024)'
+    )
+    serve_parser.set_defaults(command=serve)
+
+    args = parser.parse_args()
+    if args.command is solve and (args.snapshot is None) == (args.enrollments is None):
+        solve_parser.error('either three tables or --snapshot are required')
+    if args.command is solve and not args.race and args.backend and len(args.backend) > 1:
+        solve_parser.error('--backend can only be repeated with --race')
+    if args.command is serve and (args.snapshot is None) == (args.enrollments is None):
+        serve_parser.error('either three tables or --snapshot are required')
+
+    tracer = None
+    if args.trace is not None:
+        tracer = Tracer(args.trace_memory)
+        set_tracer(tracer)
+
+    try:
+        args.command(args)
+    except (
+        BackendError,
+        HeuristicError,
+        LoaderError,
+        ModelError,
+        OSError,
+        QueryServiceError,
+        SnapshotError,
+        TimetableError
+    ) as e:
+        sys.exit(f'scheduler: error: {e}')
+    finally:
+        if tracer is not None:
+            set_tracer(None)
+            tracer.write(args.trace, args.trace_format)
 
 if __name__ == '__main__':
     main()
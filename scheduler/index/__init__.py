@@ -0,0 +1,36 @@
+'''
+Indexes
+~~~~~~~
+
+The datatypes in :mod:`scheduler.types` only point downwards, from students to rooms, and answering
+questions about the whole object graph requires walking it. This module contains indexes that are
+built once from the object graph, and that answer those questions without repeating that walk:
+
+* :class:`~conflicts.ShiftConflictIndex` - Which shifts overlap with each other.
+* :class:`~calendar.RoomCalendar` - When each room is occupied.
+* :class:`~inverted.InvertedIndex` - Which timeslots are in each room or at each instant, which
+  courses each shift belongs to, and which students are enrolled in each course. Kept up to date
+  when the object graph grows.
+* :class:`~symbols.GraphSymbols` - Dense integer identifiers of students, courses, shifts and
+  rooms, so that they can be used as positions in arrays.
+'''
+
+import sys
+
+from .calendar import RoomCalendar, RoomCalendarError
+from .conflicts import ShiftConflictIndex, ShiftConflictIndexError
+from .inverted import InvertedIndex, InvertedIndexError
+from .symbols import GraphSymbols, SymbolTable, SymbolTableError
+
+if 'sphinx' not in sys.modules: # pragma: no cover
+    __all__ = [
+        'GraphSymbols',
+        'InvertedIndex',
+        'InvertedIndexError',
+        'RoomCalendar',
+        'RoomCalendarError',
+        'ShiftConflictIndex',
+        'ShiftConflictIndexError',
+        'SymbolTable',
+        'SymbolTableError'
+    ]
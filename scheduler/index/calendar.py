@@ -0,0 +1,168 @@
+from __future__ import annotations
+from collections.abc import Iterable
+import datetime
+
+from ..tracing import traced
+from ..types.timeslot import Timeslot
+from ..types.weekday import Weekday
+
+class RoomCalendarError(Exception):
+    '''Type of exception thrown by :class:`RoomCalendar`.'''
+    pass
+
+class RoomCalendar:
+    '''
+    Occupation of every room in campus. The day is split into buckets of fixed width, and, for each
+    room (identified by :attr:`~.room.Room.name`) and :class:`~.weekday.Weekday`, a bitmap (a Python
+    integer) tells which buckets are occupied. Availability and double booking queries are then
+    answered with bitwise operations.
+
+    A bucket is occupied if any part of it is occupied. Because of that, timeslots that don't start
+    or end at a multiple of the bucket width make the calendar conservative: a room may be reported
+    busy or double-booked when two classes only share a bucket, but not an instant.
+
+    The same :class:`~.timeslot.Timeslot` object (for example, one shared by two shifts) is only
+    added once.
+
+    :param timeslots:      Timeslots occupying rooms.
+    :param bucket_minutes: Width of each bucket, in minutes. Must divide a day evenly.
+
+    :raises RoomCalendarError: Invalid ``bucket_minutes``.
+
+    >>> calendar = RoomCalendar(timeslots, bucket_minutes=30)
+    >>> calendar.is_free('CP1 0.08', Weekday.MONDAY, time(9, 0), time(11, 0))
+    False
+    >>> calendar.double_booked()
+    {}
+    '''
+
+    __slots__ = ('__bucket_minutes', '__occupied', '__double_booked', '__timeslots')
+
+    @traced('index build')
+    def __init__(self, timeslots: Iterable[Timeslot] = (), bucket_minutes: int = 15) -> None:
+        if bucket_minutes <= 0 or (24 * 60) % bucket_minutes != 0:
+            raise RoomCalendarError(f'Bucket width must divide a day: {bucket_minutes!r}')
+
+        self.__bucket_minutes = bucket_minutes
+        self.__occupied: dict[str, dict[Weekday, int]] = {}
+        self.__double_booked: dict[str, dict[Weekday, int]] = {}
+        # Added timeslots, by id(). References are kept so that ids aren't reused
+        self.__timeslots: dict[int, Timeslot] = {}
+
+        for timeslot in timeslots:
+            self.add_timeslot(timeslot)
+
+    def add_timeslot(self, timeslot: Timeslot) -> None:
+        '''
+        Marks the room of a timeslot as occupied during the timeslot.
+
+        :param timeslot: Timeslot to be added to the calendar.
+        '''
+
+        if id(timeslot) in self.__timeslots:
+            return
+        self.__timeslots[id(timeslot)] = timeslot
+
+        room = timeslot.room.name
+        mask = self.__mask(timeslot.start, timeslot.end)
+
+        room_occupied = self.__occupied.setdefault(room, {})
+        occupied = room_occupied.get(timeslot.day, 0)
+        if occupied & mask:
+            room_double_booked = self.__double_booked.setdefault(room, {})
+            room_double_booked[timeslot.day] = (
+                room_double_booked.get(timeslot.day, 0) | (occupied & mask)
+            )
+
+        room_occupied[timeslot.day] = occupied | mask
+
+    def is_free(self, room: str, day: Weekday, start: datetime.time, end: datetime.time) -> bool:
+        '''
+        Checks if a room is free during a period of time. Rooms that were never occupied are free.
+
+        :param room:  Name of the room (:attr:`~.room.Room.name`).
+        :param day:   Day of the period.
+        :param start: Start of the period.
+        :param end:   End of the period.
+
+        :raises RoomCalendarError: ``end <= start``.
+        '''
+
+        mask = self.__mask(start, end)
+        return not self.__occupied.get(room, {}).get(day, 0) & mask
+
+    def free_rooms(self, day: Weekday, start: datetime.time, end: datetime.time) -> list[str]:
+        '''
+        Gets the names of the rooms in the calendar that are free during a period of time.
+
+        :param day:   Day of the period.
+        :param start: Start of the period.
+        :param end:   End of the period.
+
+        :raises RoomCalendarError: ``end <= start``.
+        '''
+
+        mask = self.__mask(start, end)
+        return [room for room, days in self.__occupied.items() if not days.get(day, 0) & mask]
+
+    def double_booked(self) -> dict[str, list[tuple[Weekday, datetime.time, datetime.time]]]:
+        '''
+        Gets the rooms that are occupied by more than one timeslot at the same time, and the
+        periods when that happens. Periods are rounded to the bucket width.
+
+        >>> calendar.double_booked()
+        {'CP1 0.08': [(Weekday.MONDAY, datetime.time(9, 0), datetime.time(10, 0))]}
+        '''
+
+        return {
+            room: [
+                (day, start, end)
+                for day, mask in days.items()
+                for start, end in self.__periods(mask)
+            ]
+            for room, days in self.__double_booked.items()
+        }
+
+    @property
+    def bucket_minutes(self) -> int:
+        '''Width of each bucket, in minutes.'''
+
+        return self.__bucket_minutes
+
+    def __mask(self, start: datetime.time, end: datetime.time) -> int:
+        if end <= start:
+            raise RoomCalendarError(f'Period\'s start ({start!r}) must precede its end ({end!r})')
+
+        start_minute = start.hour * 60 + start.minute
+        end_minute = end.hour * 60 + end.minute + (1 if end.second or end.microsecond else 0)
+
+        first = start_minute // self.__bucket_minutes
+        last = -(-end_minute // self.__bucket_minutes)
+        return ((1 << (last - first)) - 1) << first
+
+    def __periods(self, mask: int) -> Iterable[tuple[datetime.time, datetime.time]]:
+        # Runs of consecutive set bits, converted to times
+        bucket = 0
+        while mask:
+            if mask & 1:
+                start = bucket
+                while mask & 1:
+                    mask >>= 1
+                    bucket += 1
+
+                yield self.__time(start), self.__time(bucket)
+            else:
+                skip = (mask & -mask).bit_length() - 1
+                mask >>= skip
+                bucket += skip
+
+    def __time(self, bucket: int) -> datetime.time:
+        minutes = min(bucket * self.__bucket_minutes, 24 * 60 - 1)
+        return datetime.time(minutes // 60, minutes % 60)
+
+    def __repr__(self) -> str:
+        return (
+            'RoomCalendar('
+            f'rooms={len(self.__occupied)!r}, '
+            f'bucket_minutes={self.__bucket_minutes!r})'
+        )
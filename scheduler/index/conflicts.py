@@ -0,0 +1,142 @@
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from ..tracing import traced
+from ..types.course import Course
+from ..types.shift import Shift
+from ..types.weekday import Weekday
+
+class ShiftConflictIndexError(Exception):
+    '''Type of exception thrown by :class:`ShiftConflictIndex`.'''
+    pass
+
+class ShiftConflictIndex:
+    '''
+    Precomputed table of which shifts overlap (:meth:`~.shift.Shift.overlaps`) with each other.
+    Every shift of every course is given a dense integer identifier, its position in
+    :attr:`shifts`, and the overlap between every pair of shifts is stored in a boolean matrix.
+
+    Shifts are identified by object identity, not by equality, as shifts from different courses
+    can have the same :attr:`~.shift.Shift.name`. A shift that is part of more than one course is
+    only indexed once.
+
+    The index is not updated when the courses or their shifts are modified, and must be rebuilt.
+
+    :param courses: Courses whose shifts are indexed.
+
+    >>> course = Course('Computer Graphics', [shift1, shift2])
+    >>> index = ShiftConflictIndex([course])
+    >>> index.conflicts(shift1, shift2) == shift1.overlaps(shift2)
+    True
+    '''
+
+    @traced('index build')
+    def __init__(self, courses: Iterable[Course]) -> None:
+        self.__shifts: list[Shift] = []
+        self.__ids: dict[int, int] = {}
+
+        for course in courses:
+            for shift in course.shifts.values():
+                if id(shift) not in self.__ids:
+                    self.__ids[id(shift)] = len(self.__shifts)
+                    self.__shifts.append(shift)
+
+        self.__matrix: npt.NDArray[np.bool_] = ShiftConflictIndex.__build_matrix(self.__shifts)
+        self.__matrix.flags.writeable = False
+
+    @staticmethod
+    def __build_matrix(shifts: Sequence[Shift]) -> npt.NDArray[np.bool_]:
+        # One row per timeslot: the shift it belongs to and its starting and ending minutes
+        rows: dict[Weekday, list[tuple[int, int, int]]] = {}
+        for shift_id, shift in enumerate(shifts):
+            for timeslot in shift.timeslots:
+                rows.setdefault(timeslot.day, []).append(
+                    (shift_id, timeslot.start_minute, timeslot.end_minute)
+                )
+
+        matrix = np.zeros((len(shifts), len(shifts)), dtype=np.bool_)
+        for day_rows in rows.values():
+            array = np.array(day_rows, dtype=np.int64)
+            owners, starts, ends = array[:, 0], array[:, 1], array[:, 2]
+
+            overlapping = (starts[:, None] < ends[None, :]) & (starts[None, :] < ends[:, None])
+            i, j = np.nonzero(overlapping)
+            matrix[owners[i], owners[j]] = True
+
+        return matrix
+
+    def id_of(self, shift: Shift) -> int:
+        '''
+        Gets the dense integer identifier of a shift.
+
+        :param shift: Shift to get the identifier of.
+
+        :raises ShiftConflictIndexError: ``shift`` is not part of the index.
+
+        >>> index = ShiftConflictIndex([Course('Computer Graphics', [shift1, shift2])])
+        >>> index.id_of(shift2)
+        1
+        '''
+
+        try:
+            return self.__ids[id(shift)]
+        except KeyError:
+            raise ShiftConflictIndexError(f'Shift not in index: {shift.name!r}') from None
+
+    def conflicts(self, a: Shift, b: Shift) -> bool:
+        '''
+        Checks if two shifts overlap. Equivalent to :meth:`~.shift.Shift.overlaps`, but answered in
+        constant time.
+
+        :param a: First shift to test for overlap.
+        :param b: Second shift to test for overlap.
+
+        :raises ShiftConflictIndexError: ``a`` or ``b`` are not part of the index.
+        '''
+
+        return bool(self.__matrix[self.id_of(a), self.id_of(b)])
+
+    def conflicts_of(self, shift: Shift) -> npt.NDArray[np.bool_]:
+        '''
+        Gets the shifts that overlap with ``shift``, as a read-only boolean vector indexed by
+        shift identifier. Note that a shift with timeslots overlaps with itself.
+
+        :param shift: Shift to get the overlapping shifts of.
+
+        :raises ShiftConflictIndexError: ``shift`` is not part of the index.
+
+        >>> index = ShiftConflictIndex([Course('Computer Graphics', [shift1, shift2])])
+        >>> [index.shifts[i] for i in np.flatnonzero(index.conflicts_of(shift1))]
+        [shift1]
+        '''
+
+        row: npt.NDArray[np.bool_] = self.__matrix[self.id_of(shift)]
+        return row
+
+    @property
+    def shifts(self) -> Sequence[Shift]:
+        '''
+        Indexed shifts, in identifier order.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__shifts
+
+    @property
+    def matrix(self) -> npt.NDArray[np.bool_]:
+        '''
+        Read-only symmetric boolean matrix, where the element in row ``i`` and column ``j`` tells
+        whether the shifts with identifiers ``i`` and ``j`` overlap.
+        '''
+
+        return self.__matrix
+
+    def __len__(self) -> int:
+        return len(self.__shifts)
+
+    def __repr__(self) -> str:
+        return f'ShiftConflictIndex(shifts={len(self.__shifts)!r})'
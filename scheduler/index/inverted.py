@@ -0,0 +1,224 @@
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+import datetime
+
+from ..tracing import traced
+from ..types.course import Course
+from ..types.shift import Shift
+from ..types.student import Student
+from ..types.timeslot import Timeslot
+from ..types.weekday import WEEKDAY_INDICES, Weekday
+
+class InvertedIndexError(Exception):
+    '''Type of exception thrown by :class:`InvertedIndex`.'''
+    pass
+
+class InvertedIndex:
+    '''
+    Reverse mappings of the object graph reachable from a set of students, built in a single pass
+    over it: from rooms (identified by :attr:`~.room.Room.name`) to their timeslots, from shifts to
+    their courses, from courses to their students, and from instants of the week to the timeslots
+    taking place at them.
+
+    Unlike other indexes, this one is kept up to date when the indexed objects are modified: new
+    courses of indexed students (:meth:`~.student.Student.add_course`), new shifts of indexed
+    courses (:meth:`~.course.Course.add_shift`), and new timeslots of indexed shifts
+    (:meth:`~.shift.Shift.add_timeslot`) are indexed as soon as they are added. Use
+    :meth:`add_student` for new students.
+
+    Shifts, courses and students are identified by object identity, as, for example, shifts from
+    different courses can have the same :attr:`~.shift.Shift.name`. Each object is indexed only
+    once, even if it is reachable from many others.
+
+    :param students:       Students whose object graph is indexed.
+    :param bucket_minutes: Width, in minutes, of the buckets of the week the timeslots are grouped
+                           by, for :meth:`active_timeslots`. Must divide a day evenly.
+
+    :raises InvertedIndexError: Invalid ``bucket_minutes``.
+
+    >>> index = InvertedIndex(students)
+    >>> index.course_students(course)
+    [Student(number='A104000', ...), Student(number='A104001', ...)]
+    >>> index.active_timeslots(Weekday.MONDAY, time(10, 30))
+    [Timeslot(day=Weekday.MONDAY, start=datetime.time(10, 0), ...)]
+    '''
+
+    __slots__ = ('__bucket_minutes', '__room_timeslots', '__shift_courses', '__course_students',
+                 '__bucket_timeslots', '__students', '__indexed', '__weakref__')
+
+    @traced('index build')
+    def __init__(self, students: Iterable[Student] = (), bucket_minutes: int = 60) -> None:
+        if bucket_minutes <= 0 or (24 * 60) % bucket_minutes != 0:
+            raise InvertedIndexError(f'Bucket width must divide a day: {bucket_minutes!r}')
+
+        self.__bucket_minutes = bucket_minutes
+        self.__room_timeslots: dict[str, list[Timeslot]] = {}
+        self.__shift_courses: dict[int, list[Course]] = {}
+        self.__course_students: dict[int, list[Student]] = {}
+        self.__bucket_timeslots: dict[int, list[Timeslot]] = {}
+        self.__students: list[Student] = []
+
+        # Students and timeslots already indexed, by id()
+        self.__indexed: set[int] = set()
+
+        for student in students:
+            self.add_student(student)
+
+    def add_student(self, student: Student) -> None:
+        '''
+        Adds a student, and the courses, shifts and timeslots it references, to the index. Adding a
+        student more than once does nothing.
+
+        :param student: Student to be added.
+        '''
+
+        if id(student) in self.__indexed:
+            return
+        self.__indexed.add(id(student))
+
+        self.__students.append(student)
+        student._add_observer(self)
+        for course in student.courses.values():
+            self._course_added(student, course)
+
+    def _course_added(self, student: Student, course: Course) -> None:
+        '''
+        Indexes a course of an indexed student. For internal use by :class:`~.student.Student`.
+
+        :param student: Student enrolled in the course.
+        :param course:  Course added to the student.
+        '''
+
+        course_students = self.__course_students.get(id(course))
+        if course_students is None:
+            course_students = self.__course_students[id(course)] = []
+
+            course._add_observer(self)
+            for shift in course.shifts.values():
+                self._shift_added(course, shift)
+
+        course_students.append(student)
+
+    def _shift_added(self, course: Course, shift: Shift) -> None:
+        '''
+        Indexes a shift of an indexed course. For internal use by :class:`~.course.Course`.
+
+        :param course: Course the shift was added to.
+        :param shift:  Shift added to the course.
+        '''
+
+        shift_courses = self.__shift_courses.get(id(shift))
+        if shift_courses is None:
+            shift_courses = self.__shift_courses[id(shift)] = []
+
+            shift._add_observer(self)
+            for timeslot in shift.timeslots:
+                self._timeslot_added(shift, timeslot)
+
+        shift_courses.append(course)
+
+    def _timeslot_added(self, shift: Shift, timeslot: Timeslot) -> None:
+        '''
+        Indexes a timeslot of an indexed shift. For internal use by :class:`~.shift.Shift`.
+
+        :param shift:    Shift the timeslot was added to.
+        :param timeslot: Timeslot added to the shift.
+        '''
+
+        if id(timeslot) in self.__indexed:
+            return
+        self.__indexed.add(id(timeslot))
+
+        self.__room_timeslots.setdefault(timeslot.room.name, []).append(timeslot)
+
+        first_bucket = timeslot.start_minute // self.__bucket_minutes
+        last_bucket = (timeslot.end_minute - 1) // self.__bucket_minutes
+        for bucket in range(first_bucket, last_bucket + 1):
+            self.__bucket_timeslots.setdefault(bucket, []).append(timeslot)
+
+    def room_timeslots(self, room: str) -> Sequence[Timeslot]:
+        '''
+        Gets the timeslots in a room, in the order they were indexed.
+
+        :param room: Name of the room (see :attr:`~.room.Room.name`).
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__room_timeslots.get(room, [])
+
+    def shift_courses(self, shift: Shift) -> Sequence[Course]:
+        '''
+        Gets the courses a shift belongs to. Shifts usually belong to a single course.
+
+        :param shift: Indexed shift.
+
+        :raises InvertedIndexError: ``shift`` is not indexed.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        courses = self.__shift_courses.get(id(shift))
+        if courses is None:
+            raise InvertedIndexError(f'Shift not indexed: {shift!r}')
+
+        return courses
+
+    def course_students(self, course: Course) -> Sequence[Student]:
+        '''
+        Gets the students enrolled in a course, in the order they were indexed.
+
+        :param course: Indexed course.
+
+        :raises InvertedIndexError: ``course`` is not indexed.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        students = self.__course_students.get(id(course))
+        if students is None:
+            raise InvertedIndexError(f'Course not indexed: {course!r}')
+
+        return students
+
+    def active_timeslots(self, day: Weekday, time: datetime.time) -> list[Timeslot]:
+        '''
+        Gets the timeslots taking place at an instant of the week (``start <= time < end``). Only
+        the timeslots in the bucket of ``time`` are checked.
+
+        :param day:  Day of the week.
+        :param time: Time of the day. Seconds are not considered, like in
+                     :class:`~.timeslot.Timeslot`.
+        '''
+
+        minute = WEEKDAY_INDICES[day] * 24 * 60 + time.hour * 60 + time.minute
+        bucket = self.__bucket_timeslots.get(minute // self.__bucket_minutes, [])
+        return [
+            timeslot for timeslot in bucket
+            if timeslot.start_minute <= minute < timeslot.end_minute
+        ]
+
+    @property
+    def students(self) -> Sequence[Student]:
+        '''
+        Indexed students, in the order they were added.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__students
+
+    @property
+    def bucket_minutes(self) -> int:
+        '''Width, in minutes, of the buckets the timeslots are grouped by.'''
+
+        return self.__bucket_minutes
+
+    def __repr__(self) -> str:
+        return (
+            'InvertedIndex('
+            f'students={len(self.__students)!r}, '
+            f'courses={len(self.__course_students)!r}, '
+            f'shifts={len(self.__shift_courses)!r}, '
+            f'rooms={len(self.__room_timeslots)!r})'
+        )
@@ -0,0 +1,183 @@
+from __future__ import annotations
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Generic, TypeVar
+
+from ..tracing import traced
+from ..types.course import Course
+from ..types.room import Room
+from ..types.shift import Shift
+from ..types.student import Student
+
+T = TypeVar('T')
+
+class SymbolTableError(Exception):
+    '''Type of exception thrown by :class:`SymbolTable`.'''
+    pass
+
+class SymbolTable(Generic[T]):
+    '''
+    Association between objects and dense integer identifiers, from ``0`` to ``len(table) - 1``,
+    given in the order objects are added. Identifiers never change once given, so they can be used
+    as positions in arrays.
+
+    Objects are identified by object identity, not by equality, as, for example, shifts from
+    different courses can have the same :attr:`~.shift.Shift.name`.
+
+    :param objects: Initial objects of the table.
+
+    >>> table = SymbolTable([room1, room2])
+    >>> table.add(room3)
+    2
+    >>> table.id_of(room2)
+    1
+    >>> table[2] is room3
+    True
+    '''
+
+    __slots__ = ('__objects', '__ids')
+
+    def __init__(self, objects: Iterable[T] = ()) -> None:
+        self.__objects: list[T] = []
+        self.__ids: dict[int, int] = {}
+
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj: T) -> int:
+        '''
+        Adds an object to the table, if it isn't already in it.
+
+        :param obj: Object to be added.
+
+        :return: Identifier of the object.
+        '''
+
+        object_id = self.__ids.get(id(obj))
+        if object_id is None:
+            object_id = self.__ids[id(obj)] = len(self.__objects)
+            self.__objects.append(obj)
+
+        return object_id
+
+    def id_of(self, obj: T) -> int:
+        '''
+        Gets the identifier of an object in the table.
+
+        :param obj: Object in the table.
+
+        :raises SymbolTableError: ``obj`` is not in the table.
+        '''
+
+        object_id = self.__ids.get(id(obj))
+        if object_id is None:
+            raise SymbolTableError(f'Object not in symbol table: {obj!r}')
+
+        return object_id
+
+    @property
+    def objects(self) -> Sequence[T]:
+        '''
+        Objects in the table, in identifier order.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__objects
+
+    def __getitem__(self, object_id: int) -> T:
+        return self.__objects[object_id]
+
+    def __contains__(self, obj: object) -> bool:
+        return id(obj) in self.__ids
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__objects)
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def __repr__(self) -> str:
+        return f'SymbolTable(objects={self.__objects!r})'
+
+class GraphSymbols:
+    '''
+    Symbol tables (:class:`SymbolTable`) of every student, course, shift and room in the object
+    graph reachable from a set of students. Students keep their order, and the other objects are
+    numbered in the order they are first found.
+
+    The tables are not updated when the object graph is modified. Use :meth:`add_student` for
+    students added later.
+
+    :param students: Students whose object graph is indexed.
+
+    >>> symbols = GraphSymbols(students)
+    >>> symbols.courses.id_of(students[0].courses['Computer Graphics'])
+    0
+    '''
+
+    __slots__ = ('__students', '__courses', '__shifts', '__rooms')
+
+    @traced('index build')
+    def __init__(self, students: Iterable[Student] = ()) -> None:
+        self.__students: SymbolTable[Student] = SymbolTable()
+        self.__courses: SymbolTable[Course] = SymbolTable()
+        self.__shifts: SymbolTable[Shift] = SymbolTable()
+        self.__rooms: SymbolTable[Room] = SymbolTable()
+
+        for student in students:
+            self.add_student(student)
+
+    def add_student(self, student: Student) -> int:
+        '''
+        Adds a student, and the courses, shifts and rooms it references, to the tables.
+
+        :param student: Student to be added.
+
+        :return: Identifier of the student.
+        '''
+
+        for course in student.courses.values():
+            if course not in self.__courses:
+                self.__courses.add(course)
+
+                for shift in course.shifts.values():
+                    if shift not in self.__shifts:
+                        self.__shifts.add(shift)
+
+                        for timeslot in shift.timeslots:
+                            self.__rooms.add(timeslot.room)
+
+        return self.__students.add(student)
+
+    @property
+    def students(self) -> SymbolTable[Student]:
+        '''Symbol table of students.'''
+
+        return self.__students
+
+    @property
+    def courses(self) -> SymbolTable[Course]:
+        '''Symbol table of courses.'''
+
+        return self.__courses
+
+    @property
+    def shifts(self) -> SymbolTable[Shift]:
+        '''Symbol table of shifts.'''
+
+        return self.__shifts
+
+    @property
+    def rooms(self) -> SymbolTable[Room]:
+        '''Symbol table of rooms.'''
+
+        return self.__rooms
+
+    def __repr__(self) -> str:
+        return (
+            'GraphSymbols('
+            f'students={len(self.__students)!r}, '
+            f'courses={len(self.__courses)!r}, '
+            f'shifts={len(self.__shifts)!r}, '
+            f'rooms={len(self.__rooms)!r})'
+        )
@@ -0,0 +1,67 @@
+'''
+Input and Output
+~~~~~~~~~~~~~~~~
+
+This module reads and writes the scheduler's data types (see :mod:`scheduler.types`) from and to
+files:
+
+* :class:`~loader.Loader` - Builds the object graph from room, timeslot and enrollment rows.
+* :func:`~snapshot.write_snapshot` and :func:`~snapshot.read_snapshot` - Save and reload the object
+  graph as a binary snapshot, much faster than reading its tables again.
+* :class:`~columnar.ColumnarStore` - Memory-mapped columns of the object graph, from which objects
+  are created on demand.
+* :func:`~timetable.export_timetables` - Writes the timetable of each student to its own iCalendar,
+  CSV or HTML file.
+
+Input Formats
+-------------
+
+Input files are tables, where each row is a record. They can be stored in CSV files (with a header),
+JSON files (an array of objects), or JSON Lines files (one object per line), chosen by the file's
+extension (``.csv``, ``.json`` or ``.jsonl``). The following tables are supported:
+
+* **Rooms** - columns ``building``, ``room`` and ``capacity``. The capacity may be empty when it is
+  unknown.
+* **Timeslots** - columns ``course``, ``shift`` (a :attr:`~scheduler.types.Shift.name`), ``day``
+  (a :class:`~scheduler.types.Weekday`), ``start`` and ``end`` (``HH:MM``), ``building`` and
+  ``room``. Each row is a class of a shift.
+* **Enrollments** - columns ``student`` and ``course``.
+
+Rooms and courses referenced before being defined are created on the fly, so the tables can be
+loaded in any order.
+'''
+
+import sys
+
+from .columnar import ColumnarStore, ColumnarStoreError
+from .loader import LoadStatistics, Loader, LoaderError, read_rows
+from .snapshot import SnapshotError, read_snapshot, write_snapshot
+from .timetable import (
+    TIMETABLE_FORMATS,
+    TimetableClass,
+    TimetableError,
+    export_timetables,
+    format_timetable,
+    timetables,
+    write_timetable
+)
+
+if 'sphinx' not in sys.modules: # pragma: no cover
+    __all__ = [
+        'TIMETABLE_FORMATS',
+        'ColumnarStore',
+        'ColumnarStoreError',
+        'LoadStatistics',
+        'Loader',
+        'LoaderError',
+        'SnapshotError',
+        'TimetableClass',
+        'TimetableError',
+        'export_timetables',
+        'format_timetable',
+        'read_rows',
+        'read_snapshot',
+        'timetables',
+        'write_snapshot',
+        'write_timetable'
+    ]
@@ -0,0 +1,384 @@
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+from typing import Any
+import datetime
+import os
+
+import numpy as np
+import numpy.typing as npt
+
+from ..types.course import Course
+from ..types.room import Room
+from ..types.shift import SHIFT_TYPE_INDICES, SHIFT_TYPES, Shift
+from ..types.student import Student
+from ..types.timeslot import Timeslot
+from ..types.weekday import WEEKDAYS
+from .snapshot import _StringTable
+
+class ColumnarStoreError(Exception):
+    '''Type of exception thrown by :class:`ColumnarStore`.'''
+    pass
+
+# Columns of the store, each in a .npy file in the store's directory
+_COLUMNS = (
+    'strings',
+    'string_offsets',
+    'student_numbers',
+    'enrollment_students',
+    'enrollment_courses',
+    'enrollment_offsets',
+    'course_names',
+    'course_shift_offsets',
+    'shift_types',
+    'shift_numbers',
+    'shift_timeslot_offsets',
+    'timeslot_starts',
+    'timeslot_ends',
+    'timeslot_rooms',
+    'room_buildings',
+    'room_names',
+    'room_capacities'
+)
+
+class ColumnarStore:
+    '''
+    On-disk columnar representation of the object graph, whose columns are memory-mapped
+    (:class:`numpy.memmap`) instead of being read. Python objects are only created when they are
+    requested (:meth:`student`, :meth:`course`, *etc.*), and then cached, so that every course and
+    room is represented by a single object, as in :class:`~.loader.Loader`.
+
+    Because the operating system's page cache is shared, many processes can open the same store
+    with almost no additional memory per process. Pickling a store only pickles the path to its
+    directory, so sending it to a worker process opens it again instead of copying its data.
+
+    The store holds the following columns, that can be used directly in vectorized code:
+
+    * Students - :attr:`enrollment_offsets` delimits the rows of each student in the enrollment
+      columns.
+    * Enrollments - :attr:`enrollment_students` and :attr:`enrollment_courses` are (student,
+      course) pairs, sorted by student.
+    * Timeslots - :attr:`timeslot_starts` and :attr:`timeslot_ends` (minutes since the start of the
+      week, see :attr:`~.timeslot.Timeslot.start_minute`) and :attr:`timeslot_rooms`.
+
+    Like timeslots themselves, the store has a resolution of one minute: the seconds of the start
+    and end of a timeslot are not stored.
+
+    :param directory: Directory written by :meth:`write`.
+
+    :raises ColumnarStoreError: A column is missing or invalid.
+
+    >>> ColumnarStore.write('store', loader.students.values(), loader.courses.values())
+    >>> store = ColumnarStore('store')
+    >>> store.student(store.student_index('A104000')).courses['Computer Graphics'].name
+    'Computer Graphics'
+    '''
+
+    __slots__ = (
+        '__directory',
+        '__columns',
+        '__rooms',
+        '__courses',
+        '__students',
+        '__course_indices',
+        '__student_indices'
+    )
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.__directory = os.fspath(directory)
+        self.__columns: dict[str, npt.NDArray[Any]] = {}
+
+        for column in _COLUMNS:
+            try:
+                self.__columns[column] = np.load(
+                    os.path.join(self.__directory, f'{column}.npy'),
+                    mmap_mode='r',
+                    allow_pickle=False
+                )
+            except (OSError, ValueError) as e:
+                raise ColumnarStoreError(f'Failed to open column {column!r}: {e}') from e
+
+        # Objects created so far, by index
+        self.__rooms: dict[int, Room] = {}
+        self.__courses: dict[int, Course] = {}
+        self.__students: dict[int, Student] = {}
+
+        # Lazily built name lookup tables
+        self.__course_indices: None | dict[str, int] = None
+        self.__student_indices: None | dict[str, int] = None
+
+    @staticmethod
+    def write(
+            directory: str | os.PathLike[str],
+            students: Iterable[Student],
+            courses: Iterable[Course] = ()
+        ) -> None:
+        '''
+        Writes the object graph reachable from a set of students to a directory, one column per
+        file. The directory is created if it doesn't exist.
+
+        :param directory: Directory to write the store to.
+        :param students:  Students to store.
+        :param courses:   Additional courses to store, that may not have any enrolled students.
+
+        :raises OSError: Failed to write the store.
+        '''
+
+        strings = _StringTable()
+        columns: dict[str, list[int]] = {
+            column: [] for column in _COLUMNS if column not in ('strings', 'string_offsets')
+        }
+        for column in ('enrollment_offsets', 'course_shift_offsets', 'shift_timeslot_offsets'):
+            columns[column].append(0)
+
+        # Objects are identified by id(), as objects of the same type may be equal
+        room_ids: dict[int, int] = {}
+        course_ids: dict[int, int] = {}
+
+        def add_room(room: Room) -> int:
+            room_id = room_ids.get(id(room))
+            if room_id is None:
+                room_id = room_ids[id(room)] = len(columns['room_buildings'])
+                columns['room_buildings'].append(strings.id_of(room.building))
+                columns['room_names'].append(strings.id_of(room.name_in_building))
+                columns['room_capacities'].append(-1 if room.capacity is None else room.capacity)
+
+            return room_id
+
+        def add_course(course: Course) -> int:
+            course_id = course_ids.get(id(course))
+            if course_id is None:
+                course_id = course_ids[id(course)] = len(columns['course_names'])
+                columns['course_names'].append(strings.id_of(course.name))
+
+                for shift in course.shifts.values():
+                    columns['shift_types'].append(SHIFT_TYPE_INDICES[shift.shift_type])
+                    columns['shift_numbers'].append(shift.number)
+
+                    for timeslot in shift.timeslots:
+                        columns['timeslot_starts'].append(timeslot.start_minute)
+                        columns['timeslot_ends'].append(timeslot.end_minute)
+                        columns['timeslot_rooms'].append(add_room(timeslot.room))
+
+                    columns['shift_timeslot_offsets'].append(len(columns['timeslot_starts']))
+                columns['course_shift_offsets'].append(len(columns['shift_types']))
+
+            return course_id
+
+        for student in students:
+            student_id = len(columns['student_numbers'])
+            columns['student_numbers'].append(strings.id_of(student.number))
+            for course in student.courses.values():
+                columns['enrollment_students'].append(student_id)
+                columns['enrollment_courses'].append(add_course(course))
+            columns['enrollment_offsets'].append(len(columns['enrollment_courses']))
+
+        for course in courses:
+            add_course(course)
+
+        os.makedirs(directory, exist_ok=True)
+        string_data, string_offsets = strings.arrays()
+        np.save(os.path.join(directory, 'strings.npy'), string_data, allow_pickle=False)
+        np.save(os.path.join(directory, 'string_offsets.npy'), string_offsets, allow_pickle=False)
+        for column, values in columns.items():
+            np.save(
+                os.path.join(directory, f'{column}.npy'),
+                np.array(values, dtype=np.int64),
+                allow_pickle=False
+            )
+
+    def student(self, index: int) -> Student:
+        '''
+        Gets a student, creating it and the courses it is enrolled in if they weren't requested
+        before.
+
+        :param index: Position of the student in the store.
+
+        :raises IndexError: Invalid student index.
+        '''
+
+        student = self.__students.get(index)
+        if student is None:
+            if not 0 <= index < len(self):
+                raise IndexError(f'Invalid student index: {index!r}')
+
+            offsets = self.__columns['enrollment_offsets']
+            courses = self.__columns['enrollment_courses'][offsets[index]:offsets[index + 1]]
+            student = self.__students[index] = Student(
+                self.__string(self.__columns['student_numbers'][index]),
+                [self.course(int(course)) for course in courses]
+            )
+
+        return student
+
+    def students(self) -> Iterator[Student]:
+        '''Lazily iterates over all students of the store, in order (see :meth:`student`).'''
+
+        for index in range(len(self)):
+            yield self.student(index)
+
+    def course(self, index: int) -> Course:
+        '''
+        Gets a course, creating it and its shifts, timeslots and rooms if they weren't requested
+        before.
+
+        :param index: Position of the course in the store.
+
+        :raises IndexError: Invalid course index.
+        '''
+
+        course = self.__courses.get(index)
+        if course is None:
+            names = self.__columns['course_names']
+            if not 0 <= index < len(names):
+                raise IndexError(f'Invalid course index: {index!r}')
+
+            shift_offsets = self.__columns['course_shift_offsets']
+            timeslot_offsets = self.__columns['shift_timeslot_offsets']
+            shifts = []
+            for shift in range(shift_offsets[index], shift_offsets[index + 1]):
+                timeslots = [
+                    self.__timeslot(timeslot)
+                    for timeslot in range(timeslot_offsets[shift], timeslot_offsets[shift + 1])
+                ]
+                shifts.append(Shift._from_valid_timeslots(
+                    SHIFT_TYPES[self.__columns['shift_types'][shift]],
+                    int(self.__columns['shift_numbers'][shift]),
+                    timeslots
+                ))
+
+            course = self.__courses[index] = Course(self.__string(names[index]), shifts)
+
+        return course
+
+    def student_index(self, number: str) -> int:
+        '''
+        Gets the position of a student in the store. A lookup table of all student numbers is built
+        on the first call.
+
+        :param number: Number of the student (:attr:`~.student.Student.number`).
+
+        :raises KeyError: Unknown student.
+        '''
+
+        if self.__student_indices is None:
+            self.__student_indices = {
+                self.__string(string): i
+                for i, string in enumerate(self.__columns['student_numbers'])
+            }
+
+        return self.__student_indices[number]
+
+    def course_index(self, name: str) -> int:
+        '''
+        Gets the position of a course in the store. A lookup table of all course names is built on
+        the first call.
+
+        :param name: Name of the course (:attr:`~.course.Course.name`).
+
+        :raises KeyError: Unknown course.
+        '''
+
+        if self.__course_indices is None:
+            self.__course_indices = {
+                self.__string(string): i
+                for i, string in enumerate(self.__columns['course_names'])
+            }
+
+        return self.__course_indices[name]
+
+    @property
+    def directory(self) -> str:
+        '''Directory of the store.'''
+
+        return self.__directory
+
+    @property
+    def course_count(self) -> int:
+        '''Number of courses in the store.'''
+
+        return len(self.__columns['course_names'])
+
+    @property
+    def enrollment_offsets(self) -> npt.NDArray[np.int64]:
+        '''
+        Read-only array where the enrollments of the student in position ``i`` are in positions
+        ``enrollment_offsets[i]`` to ``enrollment_offsets[i + 1]`` (exclusive) of the enrollment
+        columns.
+        '''
+
+        return self.__columns['enrollment_offsets']
+
+    @property
+    def enrollment_students(self) -> npt.NDArray[np.int64]:
+        '''Read-only array with the student position of every enrollment.'''
+
+        return self.__columns['enrollment_students']
+
+    @property
+    def enrollment_courses(self) -> npt.NDArray[np.int64]:
+        '''Read-only array with the course position of every enrollment.'''
+
+        return self.__columns['enrollment_courses']
+
+    @property
+    def timeslot_starts(self) -> npt.NDArray[np.int64]:
+        '''
+        Read-only array with the starting minute of every timeslot, since the start of the week
+        (see :attr:`~.timeslot.Timeslot.start_minute`). Timeslots are sorted by course and shift.
+        '''
+
+        return self.__columns['timeslot_starts']
+
+    @property
+    def timeslot_ends(self) -> npt.NDArray[np.int64]:
+        '''
+        Read-only array with the ending minute of every timeslot, since the start of the week (see
+        :attr:`~.timeslot.Timeslot.end_minute`).
+        '''
+
+        return self.__columns['timeslot_ends']
+
+    @property
+    def timeslot_rooms(self) -> npt.NDArray[np.int64]:
+        '''Read-only array with the room position of every timeslot.'''
+
+        return self.__columns['timeslot_rooms']
+
+    def __timeslot(self, index: int) -> Timeslot:
+        room_index = int(self.__columns['timeslot_rooms'][index])
+        room = self.__rooms.get(room_index)
+        if room is None:
+            capacity = int(self.__columns['room_capacities'][room_index])
+            room = self.__rooms[room_index] = Room(
+                self.__string(self.__columns['room_buildings'][room_index]),
+                self.__string(self.__columns['room_names'][room_index]),
+                None if capacity < 0 else capacity
+            )
+
+        day, start = divmod(int(self.__columns['timeslot_starts'][index]), 24 * 60)
+        end = int(self.__columns['timeslot_ends'][index]) - day * 24 * 60
+        return Timeslot(
+            WEEKDAYS[day],
+            datetime.time(start // 60, start % 60),
+            datetime.time(end // 60, end % 60),
+            room
+        )
+
+    def __string(self, index: int) -> str:
+        offsets = self.__columns['string_offsets']
+        return bytes(self.__columns['strings'][offsets[index]:offsets[index + 1]]).decode('utf-8')
+
+    def __len__(self) -> int:
+        return len(self.__columns['student_numbers'])
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Worker processes map the same files again, instead of receiving a copy of the data
+        return (ColumnarStore, (self.__directory,))
+
+    def __repr__(self) -> str:
+        return (
+            'ColumnarStore('
+            f'directory={self.__directory!r}, '
+            f'students={len(self)!r}, '
+            f'courses={self.course_count!r})'
+        )
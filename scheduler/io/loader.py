@@ -0,0 +1,280 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator, Mapping
+import csv
+import datetime
+import json
+import os
+import time
+
+from ..tracing import count as count_event, span
+from ..types.course import Course, CourseError
+from ..types.room import Room, RoomError
+from ..types.shift import Shift, ShiftError
+from ..types.student import Student, StudentError
+from ..types.timeslot import Timeslot, TimeslotError
+from ..types.weekday import Weekday
+
+Row = Mapping[str, object]
+'''A record read from an input table, associating column names to values.'''
+
+class LoaderError(Exception):
+    '''Type of exception thrown by :class:`Loader` and :func:`read_rows`.'''
+    pass
+
+def read_rows(path: str | os.PathLike[str]) -> Iterator[Row]:
+    '''
+    Lazily reads the rows of a table from a file. The file's format is chosen by its extension (see
+    :mod:`scheduler.io`). CSV and JSON Lines files are streamed, while JSON files are parsed all at
+    once.
+
+    :param path: Path to the file to be read.
+
+    :raises LoaderError: Unknown file extension, or invalid JSON.
+    :raises OSError:     Failed to read the file.
+
+    >>> for row in read_rows('enrollments.csv'):
+    ...     print(row)
+    {'student': 'A104000', 'course': 'Computer Graphics'}
+    '''
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ('.csv', '.json', '.jsonl'):
+        raise LoaderError(f'Unknown table file extension: {extension!r}')
+
+    with open(path, newline='', encoding='utf-8') as file:
+        try:
+            if extension == '.csv':
+                yield from csv.DictReader(file)
+            elif extension == '.jsonl':
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+            else:
+                rows = json.load(file)
+                if not isinstance(rows, list):
+                    raise LoaderError('JSON table must be an array of objects')
+
+                yield from rows
+        except json.JSONDecodeError as e:
+            raise LoaderError(f'Invalid JSON in {os.fspath(path)!r}: {e}') from e
+
+class LoadStatistics:
+    '''
+    Throughput of a :class:`Loader`: number of rows loaded and time spent loading them.
+
+    :param rows:    Number of rows loaded.
+    :param seconds: Wall time spent loading, in seconds.
+    '''
+
+    __slots__ = ('__rows', '__seconds')
+
+    def __init__(self, rows: int = 0, seconds: float = 0.0) -> None:
+        self.__rows = rows
+        self.__seconds = seconds
+
+    @property
+    def rows(self) -> int:
+        '''Number of rows loaded.'''
+
+        return self.__rows
+
+    @property
+    def seconds(self) -> float:
+        '''Wall time spent loading, in seconds.'''
+
+        return self.__seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        '''
+        Loading throughput. A value of ``0.0`` means no time was spent loading.
+
+        >>> LoadStatistics(1000, 0.5).rows_per_second
+        2000.0
+        '''
+
+        return self.__rows / self.__seconds if self.__seconds > 0 else 0.0
+
+    def __add__(self, other: LoadStatistics) -> LoadStatistics:
+        return LoadStatistics(self.__rows + other.rows, self.__seconds + other.seconds)
+
+    def __repr__(self) -> str:
+        return f'LoadStatistics(rows={self.__rows!r}, seconds={self.__seconds!r})'
+
+class Loader:
+    '''
+    Builds the object graph (:class:`~.student.Student` → :class:`~.course.Course` →
+    :class:`~.shift.Shift` → :class:`~.timeslot.Timeslot` → :class:`~.room.Room`) from streams of
+    rows, in a single pass over each of them. Rooms, courses, shifts and students are deduplicated
+    through lookup tables, so that every entity is represented by a single object.
+
+    >>> loader = Loader()
+    >>> loader.load_rooms(read_rows('rooms.csv'))
+    >>> loader.load_timeslots(read_rows('timeslots.csv'))
+    >>> loader.load_enrollments(read_rows('enrollments.csv'))
+    >>> loader.students['A104000'].courses['Computer Graphics'].shifts['PL1'].capacity
+    30
+    '''
+
+    __slots__ = ('__rooms', '__courses', '__students', '__statistics')
+
+    def __init__(self) -> None:
+        self.__rooms: dict[str, Room] = {}
+        self.__courses: dict[str, Course] = {}
+        self.__students: dict[str, Student] = {}
+        self.__statistics = LoadStatistics()
+
+    def load_rooms(self, rows: Iterable[Row]) -> None:
+        '''
+        Loads rows from a room table. Rooms that were already referenced by timeslots get their
+        capacity updated.
+
+        :param rows: Rows of the table.
+
+        :raises LoaderError: Invalid row, or room defined more than once with different capacities.
+        '''
+
+        def load_row(row: Row) -> None:
+            capacity_value = Loader.__get(row, 'capacity', True)
+            capacity = int(capacity_value) if capacity_value else None
+
+            room = self.__get_room(Loader.__get(row, 'building'), Loader.__get(row, 'room'))
+            if room.capacity is not None and room.capacity != capacity:
+                raise LoaderError(f'Room defined with different capacities: {room.name!r}')
+
+            room.capacity = capacity
+
+        self.__load(rows, load_row)
+
+    def load_timeslots(self, rows: Iterable[Row]) -> None:
+        '''
+        Loads rows from a timeslot table, creating the courses and shifts they reference.
+
+        :param rows: Rows of the table.
+
+        :raises LoaderError: Invalid row, or overlapping timeslots in the same shift.
+        '''
+
+        def load_row(row: Row) -> None:
+            course = self.__get_course(Loader.__get(row, 'course'))
+
+            # Shifts are stored under their canonical name (T01 becomes T1)
+            shift_type, number = Shift.parse_name(Loader.__get(row, 'shift'))
+            shift = course.shifts.get(f'{shift_type}{number}')
+            if shift is None:
+                shift = Shift(shift_type, number)
+                course.add_shift(shift)
+
+            room = self.__get_room(Loader.__get(row, 'building'), Loader.__get(row, 'room'))
+            shift.add_timeslot(Timeslot(
+                Weekday(Loader.__get(row, 'day')),
+                datetime.time.fromisoformat(Loader.__get(row, 'start')),
+                datetime.time.fromisoformat(Loader.__get(row, 'end')),
+                room
+            ))
+
+        self.__load(rows, load_row)
+
+    def load_enrollments(self, rows: Iterable[Row]) -> None:
+        '''
+        Loads rows from an enrollment table, creating the students and courses they reference.
+
+        :param rows: Rows of the table.
+
+        :raises LoaderError: Invalid row, or student enrolled in the same course more than once.
+        '''
+
+        def load_row(row: Row) -> None:
+            number = Loader.__get(row, 'student')
+            student = self.__students.get(number)
+            if student is None:
+                student = self.__students[number] = Student(number)
+
+            student.add_course(self.__get_course(Loader.__get(row, 'course')))
+
+        self.__load(rows, load_row)
+
+    @property
+    def rooms(self) -> Mapping[str, Room]:
+        '''
+        Association between room names (:attr:`~.room.Room.name`) and loaded rooms.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__rooms
+
+    @property
+    def courses(self) -> Mapping[str, Course]:
+        '''
+        Association between course names (:attr:`~.course.Course.name`) and loaded courses.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__courses
+
+    @property
+    def students(self) -> Mapping[str, Student]:
+        '''
+        Association between student numbers (:attr:`~.student.Student.number`) and loaded students.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__students
+
+    @property
+    def statistics(self) -> LoadStatistics:
+        '''Throughput of all the loads performed so far.'''
+
+        return self.__statistics
+
+    def __load(self, rows: Iterable[Row], load_row: Callable[[Row], None]) -> None:
+        start = time.perf_counter()
+        count = 0
+
+        try:
+            with span('load'):
+                for count, row in enumerate(rows, 1):
+                    try:
+                        load_row(row)
+                    except (
+                        CourseError,
+                        LoaderError,
+                        RoomError,
+                        ShiftError,
+                        StudentError,
+                        TimeslotError,
+                        ValueError
+                    ) as e:
+                        raise LoaderError(f'Row {count}: {e}') from e
+        finally:
+            self.__statistics += LoadStatistics(count, time.perf_counter() - start)
+            count_event('rows loaded', count)
+
+    def __get_room(self, building: str, name_in_building: str) -> Room:
+        room = self.__rooms.get(f'{building} {name_in_building}')
+        if room is None:
+            room = Room(building, name_in_building)
+            self.__rooms[room.name] = room
+
+        return room
+
+    def __get_course(self, name: str) -> Course:
+        course = self.__courses.get(name)
+        if course is None:
+            course = self.__courses[name] = Course(name)
+
+        return course
+
+    @staticmethod
+    def __get(row: Row, column: str, optional: bool = False) -> str:
+        value = row.get(column)
+        if value is None:
+            if optional:
+                return ''
+
+            raise LoaderError(f'Missing column: {column!r}')
+
+        return str(value).strip()
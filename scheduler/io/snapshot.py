@@ -0,0 +1,256 @@
+from __future__ import annotations
+from collections.abc import Iterable
+from typing import Any, BinaryIO
+import datetime
+import os
+
+import numpy as np
+import numpy.typing as npt
+
+from ..tracing import traced
+from ..types.course import Course, CourseError
+from ..types.room import Room, RoomError
+from ..types.shift import SHIFT_TYPE_INDICES, SHIFT_TYPES, Shift
+from ..types.student import Student, StudentError
+from ..types.timeslot import Timeslot, TimeslotError
+from ..types.weekday import WEEKDAY_INDICES, WEEKDAYS
+
+class SnapshotError(Exception):
+    '''Type of exception thrown by :func:`read_snapshot`.'''
+    pass
+
+_MAGIC = b'SCHEDULER SNAPSHOT'
+_VERSION = 1
+
+class _StringTable:
+    '''Deduplicated strings, identified by integers, for :func:`write_snapshot`.'''
+
+    __slots__ = ('__ids', '__strings')
+
+    def __init__(self) -> None:
+        self.__ids: dict[str, int] = {}
+        self.__strings: list[bytes] = []
+
+    def id_of(self, string: str) -> int:
+        string_id = self.__ids.get(string)
+        if string_id is None:
+            string_id = self.__ids[string] = len(self.__strings)
+            self.__strings.append(string.encode('utf-8'))
+
+        return string_id
+
+    def arrays(self) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]:
+        offsets = np.zeros(len(self.__strings) + 1, dtype=np.int64)
+        np.cumsum([len(string) for string in self.__strings], out=offsets[1:])
+        return np.frombuffer(b''.join(self.__strings), dtype=np.uint8), offsets
+
+def write_snapshot(
+        path: str | os.PathLike[str],
+        students: Iterable[Student],
+        courses: Iterable[Course] = ()
+    ) -> None:
+    '''
+    Writes the object graph reachable from a set of students to a binary snapshot, that can be
+    loaded much faster than the tables it was built from (see :func:`read_snapshot`).
+
+    Every object shared in the graph (a room used by many timeslots, a course many students are
+    enrolled in, *etc.*) is stored only once, and referenced by its position in a table of objects
+    of its type. These tables are stored as columns of integers, and strings are deduplicated.
+
+    :param path:     Path to the file to write.
+    :param students: Students to store.
+    :param courses:  Additional courses to store, that may not have any enrolled students.
+
+    :raises OSError: Failed to write the file.
+
+    >>> loader = Loader()
+    >>> ...
+    >>> write_snapshot('graph.snapshot', loader.students.values(), loader.courses.values())
+    '''
+
+    strings = _StringTable()
+
+    # Objects are identified by id(), as objects of the same type may be equal
+    room_ids: dict[int, int] = {}
+    room_columns: tuple[list[int], list[int], list[int]] = ([], [], [])
+    timeslot_ids: dict[int, int] = {}
+    timeslot_columns: tuple[list[int], list[int], list[int], list[int]] = ([], [], [], [])
+    shift_ids: dict[int, int] = {}
+    shift_columns: tuple[list[int], list[int], list[int], list[int]] = ([], [], [0], [])
+    course_ids: dict[int, int] = {}
+    course_columns: tuple[list[int], list[int], list[int]] = ([], [0], [])
+    student_columns: tuple[list[int], list[int], list[int]] = ([], [0], [])
+
+    def add_room(room: Room) -> int:
+        room_id = room_ids.get(id(room))
+        if room_id is None:
+            room_id = room_ids[id(room)] = len(room_columns[0])
+            room_columns[0].append(strings.id_of(room.building))
+            room_columns[1].append(strings.id_of(room.name_in_building))
+            room_columns[2].append(-1 if room.capacity is None else room.capacity)
+
+        return room_id
+
+    def add_timeslot(timeslot: Timeslot) -> int:
+        timeslot_id = timeslot_ids.get(id(timeslot))
+        if timeslot_id is None:
+            timeslot_id = timeslot_ids[id(timeslot)] = len(timeslot_columns[0])
+            timeslot_columns[0].append(WEEKDAY_INDICES[timeslot.day])
+            timeslot_columns[1].append(_time_to_microseconds(timeslot.start))
+            timeslot_columns[2].append(_time_to_microseconds(timeslot.end))
+            timeslot_columns[3].append(add_room(timeslot.room))
+
+        return timeslot_id
+
+    def add_shift(shift: Shift) -> int:
+        shift_id = shift_ids.get(id(shift))
+        if shift_id is None:
+            shift_id = shift_ids[id(shift)] = len(shift_columns[0])
+            shift_columns[0].append(SHIFT_TYPE_INDICES[shift.shift_type])
+            shift_columns[1].append(shift.number)
+            shift_columns[3].extend(add_timeslot(timeslot) for timeslot in shift.timeslots)
+            shift_columns[2].append(len(shift_columns[3]))
+
+        return shift_id
+
+    def add_course(course: Course) -> int:
+        course_id = course_ids.get(id(course))
+        if course_id is None:
+            course_id = course_ids[id(course)] = len(course_columns[0])
+            course_columns[0].append(strings.id_of(course.name))
+            course_columns[2].extend(add_shift(shift) for shift in course.shifts.values())
+            course_columns[1].append(len(course_columns[2]))
+
+        return course_id
+
+    for student in students:
+        student_columns[0].append(strings.id_of(student.number))
+        student_columns[2].extend(add_course(course) for course in student.courses.values())
+        student_columns[1].append(len(student_columns[2]))
+
+    for course in courses:
+        add_course(course)
+
+    string_data, string_offsets = strings.arrays()
+    arrays: list[npt.NDArray[Any]] = [
+        string_data,
+        string_offsets,
+        *(np.array(column, dtype=np.int64) for column in room_columns),
+        *(np.array(column, dtype=np.int64) for column in timeslot_columns),
+        *(np.array(column, dtype=np.int64) for column in shift_columns),
+        *(np.array(column, dtype=np.int64) for column in course_columns),
+        *(np.array(column, dtype=np.int64) for column in student_columns)
+    ]
+
+    with open(path, 'wb') as file:
+        file.write(_MAGIC)
+        file.write(_VERSION.to_bytes(4, 'little'))
+        for array in arrays:
+            np.lib.format.write_array(file, array, allow_pickle=False)
+
+@traced('load')
+def read_snapshot(path: str | os.PathLike[str]) -> tuple[list[Student], list[Course]]:
+    '''
+    Reads a snapshot written by :func:`write_snapshot`. The graph is rebuilt in bulk, one type of
+    object at a time, without checking again for overlapping timeslots in shifts.
+
+    :param path: Path to the file to read.
+
+    :return: The stored students, in the order they were written, and all stored courses.
+
+    :raises SnapshotError: The file isn't a valid snapshot.
+    :raises OSError:       Failed to read the file.
+
+    >>> students, courses = read_snapshot('graph.snapshot')
+    '''
+
+    with open(path, 'rb') as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise SnapshotError(f'Not a snapshot: {os.fspath(path)!r}')
+
+        version = int.from_bytes(file.read(4), 'little')
+        if version != _VERSION:
+            raise SnapshotError(f'Unsupported snapshot version: {version!r}')
+
+        try:
+            return _read_graph(file)
+        except (
+            CourseError,
+            IndexError,
+            RoomError,
+            StudentError,
+            TimeslotError,
+            ValueError
+        ) as e:
+            raise SnapshotError(f'Invalid snapshot {os.fspath(path)!r}: {e}') from e
+
+def _read_graph(file: BinaryIO) -> tuple[list[Student], list[Course]]:
+    def read() -> list[int]:
+        array: npt.NDArray[np.int64] = np.lib.format.read_array(file, allow_pickle=False)
+        return array.tolist() # type: ignore
+
+    string_data = np.lib.format.read_array(file, allow_pickle=False).tobytes()
+    string_offsets = read()
+    strings = [
+        string_data[start:end].decode('utf-8')
+        for start, end in zip(string_offsets, string_offsets[1:])
+    ]
+
+    room_buildings, room_names, room_capacities = read(), read(), read()
+    rooms = [
+        Room(strings[building], strings[name], None if capacity < 0 else capacity)
+        for building, name, capacity in zip(room_buildings, room_names, room_capacities)
+    ]
+
+    timeslot_days, timeslot_starts, timeslot_ends, timeslot_rooms = read(), read(), read(), read()
+    times = {
+        microseconds: _microseconds_to_time(microseconds)
+        for microseconds in set(timeslot_starts) | set(timeslot_ends)
+    }
+    timeslots = [
+        Timeslot(WEEKDAYS[day], times[start], times[end], rooms[room])
+        for day, start, end, room in zip(
+            timeslot_days,
+            timeslot_starts,
+            timeslot_ends,
+            timeslot_rooms
+        )
+    ]
+
+    shift_types, shift_numbers, shift_offsets, shift_timeslots = read(), read(), read(), read()
+    shifts = [
+        Shift._from_valid_timeslots(
+            SHIFT_TYPES[shift_type],
+            number,
+            [timeslots[i] for i in shift_timeslots[start:end]]
+        )
+        for shift_type, number, start, end in zip(
+            shift_types,
+            shift_numbers,
+            shift_offsets,
+            shift_offsets[1:]
+        )
+    ]
+
+    course_names, course_offsets, course_shifts = read(), read(), read()
+    courses = [
+        Course(strings[name], [shifts[i] for i in course_shifts[start:end]])
+        for name, start, end in zip(course_names, course_offsets, course_offsets[1:])
+    ]
+
+    student_numbers, student_offsets, student_courses = read(), read(), read()
+    students = [
+        Student(strings[number], [courses[i] for i in student_courses[start:end]])
+        for number, start, end in zip(student_numbers, student_offsets, student_offsets[1:])
+    ]
+
+    return students, courses
+
+def _time_to_microseconds(time: datetime.time) -> int:
+    return ((time.hour * 60 + time.minute) * 60 + time.second) * 1000000 + time.microsecond
+
+def _microseconds_to_time(microseconds: int) -> datetime.time:
+    seconds, microsecond = divmod(microseconds, 1000000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return datetime.time(hour, minute, second, microsecond)
@@ -0,0 +1,322 @@
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+import concurrent.futures
+import csv
+import datetime
+import html
+import io
+import itertools
+import os
+
+from ..solver.assignment import Assignment
+from ..tracing import count as count_event, traced
+from ..types.student import Student
+from ..types.weekday import WEEKDAY_INDICES, Weekday
+
+class TimetableError(Exception):
+    '''Type of exception thrown by :func:`write_timetable` and :func:`export_timetables`.'''
+    pass
+
+TimetableClass = tuple[str, str, Weekday, datetime.time, datetime.time, str]
+'''
+A class in a student's timetable: the names of its course and shift, its day, its starting and
+ending hours, and the name of its room. Only strings and times are used, so that timetables can be
+cheaply sent to worker processes.
+
+>>> cls: TimetableClass = ('Lógica', 'T1', Weekday.MONDAY, time(9, 0), time(11, 0), 'CP1 0.08')
+'''
+
+TIMETABLE_FORMATS = ('csv', 'html', 'ics')
+'''Formats supported by :func:`write_timetable`, which are also the extensions of written files.'''
+
+def timetables(assignment: Assignment, students: Iterable[Student]) -> Iterator[
+        tuple[str, list[TimetableClass]]
+    ]:
+    '''
+    Lazily builds the timetable of each student, from the timeslots of the shifts they were given.
+    Only one timetable is built at a time, so that memory use doesn't depend on the number of
+    students.
+
+    :param assignment: Assignment of shifts to students.
+    :param students:   Students whose timetables are built.
+
+    :return: The number of each student, and their classes sorted by day and starting hour.
+
+    :raises KeyError: ``assignment`` refers to a course the student isn't enrolled in, or to a
+                      shift that doesn't exist.
+
+    >>> next(timetables(assignment, students))
+    ('A104000', [('Lógica', 'T1', Weekday.MONDAY, time(9, 0), time(11, 0), 'CP1 0.08')])
+    '''
+
+    for student in students:
+        classes: list[TimetableClass] = []
+        for course_name, shift_names in assignment.get(student.number, {}).items():
+            course = student.courses[course_name]
+            for shift_name in shift_names:
+                for timeslot in course.shifts[shift_name].timeslots:
+                    classes.append((
+                        course_name,
+                        shift_name,
+                        timeslot.day,
+                        timeslot.start,
+                        timeslot.end,
+                        timeslot.room.name
+                    ))
+
+        classes.sort(key=lambda cls: (WEEKDAY_INDICES[cls[2]], cls[3], cls[4]))
+        yield student.number, classes
+
+def format_timetable(
+        number: str,
+        classes: Iterable[TimetableClass],
+        timetable_format: str,
+        week: datetime.date,
+        weeks: int = 1
+    ) -> str:
+    '''
+    Formats a student's timetable.
+
+    :param number:           Number of the student.
+    :param classes:          Classes of the student (see :func:`timetables`).
+    :param timetable_format: One of :data:`TIMETABLE_FORMATS`.
+    :param week:             Monday of the first week of classes. Only used by iCalendar.
+    :param weeks:            Number of weeks during which classes repeat. Only used by iCalendar.
+
+    :raises TimetableError: Unknown format.
+
+    >>> print(format_timetable('A104000', classes, 'csv', datetime.date(2025, 9, 15)))
+    course,shift,day,start,end,room
+    Lógica,T1,Monday,09:00,11:00,CP1 0.08
+    '''
+
+    if timetable_format == 'csv':
+        return _format_csv(classes)
+    elif timetable_format == 'html':
+        return _format_html(number, classes)
+    elif timetable_format == 'ics':
+        return _format_ics(number, classes, week, weeks)
+    else:
+        raise TimetableError(f'Unknown timetable format: {timetable_format!r}')
+
+def write_timetable(
+        directory: str | os.PathLike[str],
+        number: str,
+        classes: Iterable[TimetableClass],
+        timetable_format: str,
+        week: datetime.date,
+        weeks: int = 1
+    ) -> None:
+    '''
+    Writes a student's timetable to ``<directory>/<number>.<format>`` (see
+    :func:`format_timetable`).
+
+    :param directory:        Directory to write the timetable to. Must exist.
+    :param number:           Number of the student.
+    :param classes:          Classes of the student (see :func:`timetables`).
+    :param timetable_format: One of :data:`TIMETABLE_FORMATS`.
+    :param week:             See :func:`format_timetable`.
+    :param weeks:            See :func:`format_timetable`.
+
+    :raises TimetableError: Unknown format, or student number that isn't a valid file name.
+    :raises OSError:        Failed to write the file.
+    '''
+
+    if not number or number in ('.', '..') or os.sep in number or '/' in number:
+        raise TimetableError(f'Student number is not a valid file name: {number!r}')
+
+    contents = format_timetable(number, classes, timetable_format, week, weeks)
+    path = os.path.join(directory, f'{number}.{timetable_format}')
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        file.write(contents)
+
+def write_timetables(
+        directory: str | os.PathLike[str],
+        batch: list[tuple[str, list[TimetableClass]]],
+        timetable_format: str,
+        week: datetime.date,
+        weeks: int = 1
+    ) -> int:
+    '''
+    Writes a batch of timetables (see :func:`write_timetable`). Used by :func:`export_timetables`
+    in worker processes.
+
+    :return: Number of timetables written.
+    '''
+
+    for number, classes in batch:
+        write_timetable(directory, number, classes, timetable_format, week, weeks)
+
+    return len(batch)
+
+@traced('export')
+def export_timetables(
+        directory: str | os.PathLike[str],
+        assignment: Assignment,
+        students: Iterable[Student],
+        timetable_format: str = 'ics',
+        week: None | datetime.date = None,
+        weeks: int = 1,
+        max_workers: None | int = None,
+        batch_size: int = 256
+    ) -> int:
+    '''
+    Writes the timetable of every student to its own file (see :func:`write_timetable`).
+    Timetables are built lazily (:func:`timetables`) and written in batches by worker processes.
+    Only a few batches are kept in memory at a time, so memory use doesn't depend on the number of
+    students.
+
+    :param directory:        Directory to write timetables to. Created if it doesn't exist.
+    :param assignment:       Assignment of shifts to students.
+    :param students:         Students whose timetables are written.
+    :param timetable_format: One of :data:`TIMETABLE_FORMATS`.
+    :param week:             Monday of the first week of classes (see :func:`format_timetable`).
+                             ``None`` means the current week.
+    :param weeks:            See :func:`format_timetable`.
+    :param max_workers:      Maximum number of worker processes. ``None`` uses all processors. When
+                             ``1``, no processes are created.
+    :param batch_size:       Number of timetables sent to a worker process at once.
+
+    :return: Number of timetables written.
+
+    :raises TimetableError: Unknown format, invalid ``batch_size``, or student number that isn't a
+                            valid file name.
+    :raises KeyError:       See :func:`timetables`.
+    :raises OSError:        Failed to write a file.
+
+    >>> export_timetables('timetables', assignment, students, 'html', max_workers=4)
+    3
+    '''
+
+    if timetable_format not in TIMETABLE_FORMATS:
+        raise TimetableError(f'Unknown timetable format: {timetable_format!r}')
+    if batch_size <= 0:
+        raise TimetableError(f'Batch size must be positive: {batch_size!r}')
+
+    if week is None:
+        today = datetime.date.today()
+        week = today - datetime.timedelta(days=today.weekday())
+
+    os.makedirs(directory, exist_ok=True)
+    arguments = (timetable_format, week, weeks)
+    batches = _batched(timetables(assignment, students), batch_size)
+
+    written = 0
+    if max_workers == 1:
+        for batch in batches:
+            written += write_timetables(directory, batch, *arguments)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            # Bound the number of pending batches, instead of submitting all of them at once
+            max_pending = 2 * (max_workers or os.cpu_count() or 1)
+            pending: set[concurrent.futures.Future[int]] = set()
+
+            for batch in batches:
+                if len(pending) >= max_pending:
+                    done, pending = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    written += sum(future.result() for future in done)
+
+                pending.add(executor.submit(write_timetables, directory, batch, *arguments))
+
+            written += sum(future.result() for future in pending)
+
+    count_event('timetables written', written)
+    return written
+
+def _batched(iterable: Iterable[tuple[str, list[TimetableClass]]], size: int) -> Iterator[
+        list[tuple[str, list[TimetableClass]]]
+    ]:
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+def _format_csv(classes: Iterable[TimetableClass]) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+    writer.writerow(('course', 'shift', 'day', 'start', 'end', 'room'))
+    for course, shift, day, start, end, room in classes:
+        writer.writerow((course, shift, day, f'{start:%H:%M}', f'{end:%H:%M}', room))
+
+    return output.getvalue()
+
+def _format_html(number: str, classes: Iterable[TimetableClass]) -> str:
+    number = html.escape(number)
+    lines = [
+        '<!DOCTYPE html>',
+        '<html>',
+        '<head>',
+        '<meta charset="utf-8">',
+        f'<title>{number}</title>',
+        '</head>',
+        '<body>',
+        f'<h1>{number}</h1>',
+        '<table>',
+        '<tr><th>Day</th><th>Start</th><th>End</th><th>Course</th><th>Shift</th><th>Room</th></tr>'
+    ]
+
+    for course, shift, day, start, end, room in classes:
+        cells = (day, f'{start:%H:%M}', f'{end:%H:%M}', course, shift, room)
+        lines.append('<tr>' + ''.join(f'<td>{html.escape(cell)}</td>' for cell in cells) + '</tr>')
+
+    lines.extend(('</table>', '</body>', '</html>', ''))
+    return '\n'.join(lines)
+
+def _format_ics(
+        number: str,
+        classes: Iterable[TimetableClass],
+        week: datetime.date,
+        weeks: int
+    ) -> str:
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//scheduler//timetable//EN']
+    stamp = f'{week:%Y%m%d}T000000Z'
+
+    for i, (course, shift, day, start, end, room) in enumerate(classes):
+        date = week + datetime.timedelta(days=WEEKDAY_INDICES[day])
+        lines.extend((
+            'BEGIN:VEVENT',
+            f'UID:{_escape_ics(f"{number}-{i}")}@scheduler',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{date:%Y%m%d}T{start:%H%M%S}',
+            f'DTEND:{date:%Y%m%d}T{end:%H%M%S}'
+        ))
+
+        if weeks > 1:
+            lines.append(f'RRULE:FREQ=WEEKLY;COUNT={weeks}')
+
+        lines.extend((
+            f'SUMMARY:{_escape_ics(f"{course} ({shift})")}',
+            f'LOCATION:{_escape_ics(room)}',
+            'END:VEVENT'
+        ))
+
+    lines.append('END:VCALENDAR')
+    return ''.join(_fold_ics(line) + '\r\n' for line in lines)
+
+def _escape_ics(text: str) -> str:
+    return (
+        text.replace('\\', '\\\\')
+            .replace(';', '\\;')
+            .replace(',', '\\,')
+            .replace('\n', '\\n')
+    )
+
+def _fold_ics(line: str) -> str:
+    # Lines are limited to 75 octets, and continued in lines starting with a space
+    parts = []
+    part = ''
+    part_length = 0
+    for character in line:
+        character_length = len(character.encode('utf-8'))
+        if part_length + character_length > 75:
+            parts.append(part)
+            part = ' '
+            part_length = 1
+
+        part += character
+        part_length += character_length
+
+    parts.append(part)
+    return '\r\n'.join(parts)
@@ -0,0 +1,345 @@
+'''
+Query Service
+~~~~~~~~~~~~~
+
+Read-only HTTP service that answers queries about an assignment of shifts to students, meant for a
+local deployment (for example, a front desk during enrollment week). Queries are answered from
+indexes built once, when the service starts, and rendered timetables are kept in an LRU cache.
+
+The following ``GET`` requests are supported, and all but timetables are answered with JSON:
+
+* ``/students/<number>`` - Shifts of a student, by course.
+* ``/students/<number>/timetable?format=<format>`` - Timetable of a student (see
+  :func:`~scheduler.io.timetable.format_timetable`). The format defaults to ``html``.
+* ``/courses/<course>/shifts/<shift>`` - Numbers of the students in a shift.
+* ``/rooms/<room>?day=<day>&time=<HH:MM>`` - Classes in a room, optionally only those at a given
+  day and time.
+
+Path components are URL-encoded: ``/rooms/CP1%200.08``.
+
+>>> service = QueryService(students, assignment)
+>>> asyncio.run(serve(service, 'localhost', 8080))
+'''
+
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+import asyncio
+import datetime
+import json
+import urllib.parse
+
+from .io.timetable import TIMETABLE_FORMATS, TimetableClass, format_timetable, timetables
+from .solver.assignment import Assignment
+from .tracing import count as count_event, traced
+from .types.student import Student
+from .types.weekday import WEEKDAY_INDICES, Weekday
+
+class QueryServiceError(Exception):
+    '''Type of exception thrown by :class:`QueryService`.'''
+    pass
+
+class QueryService:
+    '''
+    Answers queries about an assignment of shifts to students, independently of how they are sent
+    (see :func:`serve`).
+
+    The indexes of the service are built from the assignment when it is created, and aren't
+    updated if the object graph or the assignment are modified.
+
+    :param students:   Students in the assignment.
+    :param assignment: Assignment of shifts to students.
+    :param week:       Monday of the first week of classes, for iCalendar timetables. ``None``
+                       means the current week.
+    :param cache_size: Maximum number of rendered timetables kept in memory.
+
+    :raises QueryServiceError: ``cache_size`` isn't positive.
+    :raises KeyError:          ``assignment`` refers to a course a student isn't enrolled in, or to
+                               a shift that doesn't exist.
+
+    >>> service = QueryService(students, assignment)
+    >>> service.shift_students('Computer Graphics', 'PL1')
+    ['A104000', 'A104001']
+    '''
+
+    __slots__ = ('__assignment', '__timetables', '__shift_students', '__room_classes', '__week',
+                 '__cache', '__cache_size')
+
+    @traced('index build')
+    def __init__(
+            self,
+            students: Iterable[Student],
+            assignment: Assignment,
+            week: None | datetime.date = None,
+            cache_size: int = 1024
+        ) -> None:
+        if cache_size <= 0:
+            raise QueryServiceError(f'Cache size must be positive: {cache_size!r}')
+
+        if week is None:
+            today = datetime.date.today()
+            week = today - datetime.timedelta(days=today.weekday())
+
+        self.__assignment = assignment
+        self.__week = week
+        self.__cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self.__cache_size = cache_size
+
+        self.__timetables: dict[str, list[TimetableClass]] = {}
+        self.__shift_students: dict[tuple[str, str], list[str]] = {}
+        self.__room_classes: dict[str, list[TimetableClass]] = {}
+
+        for number, classes in timetables(assignment, students):
+            self.__timetables[number] = classes
+            for course_name, shift_names in assignment.get(number, {}).items():
+                for shift_name in shift_names:
+                    shift_students = self.__shift_students.get((course_name, shift_name))
+                    if shift_students is None:
+                        # Index the classes of each shift only once, for its first student
+                        shift_students = self.__shift_students[(course_name, shift_name)] = []
+                        for cls in classes:
+                            if cls[0] == course_name and cls[1] == shift_name:
+                                self.__room_classes.setdefault(cls[5], []).append(cls)
+
+                    shift_students.append(number)
+
+        for room_classes in self.__room_classes.values():
+            room_classes.sort(key=lambda cls: (WEEKDAY_INDICES[cls[2]], cls[3], cls[4]))
+
+    def student_shifts(self, number: str) -> Mapping[str, Sequence[str]]:
+        '''
+        Gets the shifts of a student, by course.
+
+        :param number: Number of the student.
+
+        :raises QueryServiceError: Unknown student.
+
+        >>> service.student_shifts('A104000')
+        {'Computer Graphics': ['T1', 'PL1']}
+        '''
+
+        if number not in self.__timetables:
+            raise QueryServiceError(f'Unknown student: {number!r}')
+
+        return self.__assignment.get(number, {})
+
+    def shift_students(self, course: str, shift: str) -> Sequence[str]:
+        '''
+        Gets the numbers of the students in a shift.
+
+        :param course: Name of the shift's course.
+        :param shift:  Name of the shift.
+
+        :raises QueryServiceError: No student is in the shift.
+        '''
+
+        numbers = self.__shift_students.get((course, shift))
+        if numbers is None:
+            raise QueryServiceError(f'No students in shift {shift!r} of course {course!r}')
+
+        return numbers
+
+    def room_classes(
+            self,
+            room: str,
+            day: None | Weekday = None,
+            time: None | datetime.time = None
+        ) -> list[TimetableClass]:
+        '''
+        Gets the classes taught in a room, sorted by day and starting hour.
+
+        :param room: Name of the room (see :attr:`~.room.Room.name`).
+        :param day:  Only get classes on this day.
+        :param time: Only get classes that are taking place at this time (``start <= time < end``).
+
+        :raises QueryServiceError: No classes are taught in the room.
+        '''
+
+        classes = self.__room_classes.get(room)
+        if classes is None:
+            raise QueryServiceError(f'No classes in room: {room!r}')
+
+        return [
+            cls for cls in classes
+            if (day is None or cls[2] == day) and (time is None or cls[3] <= time < cls[4])
+        ]
+
+    def timetable(self, number: str, timetable_format: str = 'html') -> str:
+        '''
+        Gets the rendered timetable of a student. Recently rendered timetables are cached.
+
+        :param number:           Number of the student.
+        :param timetable_format: One of :data:`~.timetable.TIMETABLE_FORMATS`.
+
+        :raises QueryServiceError: Unknown student or format.
+        '''
+
+        key = (number, timetable_format)
+        rendered = self.__cache.get(key)
+        if rendered is not None:
+            count_event('timetable cache hits')
+            self.__cache.move_to_end(key)
+            return rendered
+
+        classes = self.__timetables.get(number)
+        if classes is None:
+            raise QueryServiceError(f'Unknown student: {number!r}')
+        if timetable_format not in TIMETABLE_FORMATS:
+            raise QueryServiceError(f'Unknown timetable format: {timetable_format!r}')
+
+        count_event('timetable cache misses')
+        rendered = format_timetable(number, classes, timetable_format, self.__week)
+        self.__cache[key] = rendered
+        if len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+
+        return rendered
+
+    def handle(self, target: str) -> tuple[int, str, str]:
+        '''
+        Answers a ``GET`` request (see :mod:`scheduler.service`).
+
+        :param target: Path and query of the request.
+
+        :return: The HTTP status code, the content type, and the body of the response.
+
+        >>> service.handle('/students/A104000')
+        (200, 'application/json', '{"Computer Graphics": ["T1", "PL1"]}')
+        '''
+
+        url = urllib.parse.urlsplit(target)
+        path = [urllib.parse.unquote(part) for part in url.path.split('/')[1:]]
+        query = dict(urllib.parse.parse_qsl(url.query))
+
+        try:
+            match path:
+                case ['students', number]:
+                    return _json(self.student_shifts(number))
+                case ['students', number, 'timetable']:
+                    timetable_format = query.get('format', 'html')
+                    if timetable_format not in TIMETABLE_FORMATS:
+                        return 400, 'text/plain', f'Unknown timetable format: {timetable_format!r}'
+
+                    body = self.timetable(number, timetable_format)
+                    return 200, _TIMETABLE_CONTENT_TYPES[timetable_format], body
+                case ['courses', course, 'shifts', shift]:
+                    return _json(self.shift_students(course, shift))
+                case ['rooms', room]:
+                    day = None if 'day' not in query else Weekday(query['day'])
+                    time = None if 'time' not in query else datetime.time.fromisoformat(
+                        query['time']
+                    )
+                    return _json([
+                        {
+                            'course': course,
+                            'shift': shift,
+                            'day': cls_day,
+                            'start': f'{start:%H:%M}',
+                            'end': f'{end:%H:%M}'
+                        }
+                        for course, shift, cls_day, start, end, _ in self.room_classes(
+                            room,
+                            day,
+                            time
+                        )
+                    ])
+                case _:
+                    return 404, 'text/plain', 'Not found'
+        except QueryServiceError as e:
+            return 404, 'text/plain', str(e)
+        except ValueError as e:
+            return 400, 'text/plain', str(e)
+
+    def __repr__(self) -> str:
+        return (
+            'QueryService('
+            f'students={len(self.__timetables)!r}, '
+            f'cached_timetables={len(self.__cache)!r})'
+        )
+
+_TIMETABLE_CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'html': 'text/html',
+    'ics': 'text/calendar'
+}
+
+_STATUS_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed'
+}
+
+def _json(value: object) -> tuple[int, str, str]:
+    return 200, 'application/json', json.dumps(value, ensure_ascii=False)
+
+async def serve(service: QueryService, host: str = 'localhost', port: int = 8080) -> None:
+    '''
+    Serves queries to a :class:`QueryService` over HTTP, until cancelled. HTTP/1.1 connections are
+    kept alive unless the client asks otherwise, and HTTP/1.0 connections only if the client asks
+    for it. Request bodies are ignored, and chunked bodies are rejected.
+
+    :param service: Service that answers queries.
+    :param host:    Address to listen on.
+    :param port:    Port to listen on.
+
+    :raises OSError: Failed to listen on the address.
+    '''
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = {}
+                while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip().lower()
+
+                request = request_line.decode('latin-1').split()
+                if len(request) == 3 and request[2] == 'HTTP/1.0':
+                    keep_alive = headers.get('connection') == 'keep-alive'
+                else:
+                    keep_alive = headers.get('connection') != 'close'
+
+                # The next request can only be found after skipping the body of this one
+                length = headers.get('content-length', '0')
+                if 'transfer-encoding' in headers or not length.isdigit():
+                    status, content_type, body = 400, 'text/plain', 'Unsupported request body'
+                    keep_alive = False
+                else:
+                    remaining = int(length)
+                    while remaining > 0:
+                        remaining -= len(await reader.readexactly(min(remaining, 65536)))
+
+                    if len(request) != 3:
+                        status, content_type, body = 400, 'text/plain', 'Invalid request line'
+                        keep_alive = False
+                    elif request[0] == 'GET':
+                        status, content_type, body = service.handle(request[1])
+                    else:
+                        status, content_type, body = 405, 'text/plain', 'Only GET is supported'
+
+                count_event('requests')
+                data = body.encode('utf-8')
+                writer.write(
+                    f'HTTP/1.1 {status} {_STATUS_REASONS[status]}\r\n'
+                    f'Content-Type: {content_type}; charset=utf-8\r\n'
+                    f'Content-Length: {len(data)}\r\n'
+                    f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+                    '\r\n'.encode('latin-1') + data
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle_connection, host, port)
+    async with server:
+        await server.serve_forever()
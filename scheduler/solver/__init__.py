@@ -0,0 +1,79 @@
+'''
+Solver
+~~~~~~
+
+This module attributes shifts to students, given the courses they are enrolled in (see
+:mod:`scheduler.types`). Its results are :data:`~assignment.Assignment` objects.
+
+* :class:`~model.Model` - Mixed-integer linear program for the attribution of shifts.
+* :class:`~compression.CompressedModel` - Smaller program, where identical students are grouped.
+* :class:`~patterns.PatternModel` - Program whose variables are conflict-free shift combinations
+  (:func:`~patterns.enumerate_patterns`).
+* :func:`~decomposition.solve_components` - Solves independent subproblems in parallel.
+* :func:`~heuristic.solve_heuristic` - Fast greedy attribution, without integer programming.
+* :class:`~search.LocalSearch` - Improves existing assignments.
+* :func:`~validation.validate` - Checks every constraint of an assignment.
+* :func:`~feasibility.check_feasibility` - Quickly finds instances without any valid assignment.
+* :func:`~backends.get_backend` - Integer programming solvers (HiGHS, CBC, CP-SAT) used by the
+  models, and :class:`~backends.RaceBackend`, that runs many of them at once.
+'''
+
+import sys
+
+from .assignment import Assignment, assigned_shifts
+from .backends import (
+    BACKEND_NAMES,
+    Backend,
+    BackendError,
+    CbcBackend,
+    CpSatBackend,
+    HighsBackend,
+    Program,
+    RaceBackend,
+    available_backends,
+    get_backend
+)
+from .compression import CompressedModel, group_students
+from .decomposition import connected_components, solve_component, solve_components
+from .feasibility import FeasibilityReport, check_feasibility
+from .heuristic import HeuristicError, solve_heuristic
+from .model import Model, ModelError
+from .patterns import PatternCache, PatternError, PatternModel, ShiftPatterns, enumerate_patterns
+from .search import LocalSearch, LocalSearchError
+from .validation import ValidationReport, validate
+
+if 'sphinx' not in sys.modules: # pragma: no cover
+    __all__ = [
+        'BACKEND_NAMES',
+        'Assignment',
+        'Backend',
+        'BackendError',
+        'CbcBackend',
+        'CompressedModel',
+        'CpSatBackend',
+        'FeasibilityReport',
+        'HeuristicError',
+        'HighsBackend',
+        'LocalSearch',
+        'LocalSearchError',
+        'Model',
+        'ModelError',
+        'PatternCache',
+        'PatternError',
+        'PatternModel',
+        'Program',
+        'RaceBackend',
+        'ShiftPatterns',
+        'ValidationReport',
+        'assigned_shifts',
+        'available_backends',
+        'check_feasibility',
+        'connected_components',
+        'enumerate_patterns',
+        'get_backend',
+        'group_students',
+        'solve_component',
+        'solve_components',
+        'solve_heuristic',
+        'validate'
+    ]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+
+from ..types.shift import Shift
+from ..types.student import Student
+
+Assignment = dict[str, dict[str, list[str]]]
+'''
+Attribution of shifts to students. Associates each student's number
+(:attr:`~.student.Student.number`) to a mapping between the names of the courses they are enrolled
+in (:attr:`~.course.Course.name`) and the names of the shifts they were given in each course
+(:attr:`~.shift.Shift.name`), one per :class:`~.shift.ShiftType` of the course.
+
+Names are used instead of object references so that assignments can be cheaply sent between
+processes and serialized.
+
+>>> assignment: Assignment = {'A104000': {'Computer Graphics': ['T1', 'PL3']}}
+'''
+
+def assigned_shifts(assignment: Assignment, students: Iterable[Student]) -> Iterator[
+        tuple[Student, Shift]
+    ]:
+    '''
+    Resolves the names in an assignment to the shifts they refer to.
+
+    :param assignment: Assignment to be resolved.
+    :param students:   Students whose shifts are resolved. Students missing from ``assignment`` are
+                       ignored.
+
+    :raises KeyError: ``assignment`` refers to a course the student isn't enrolled in, or to a shift
+                      that doesn't exist.
+
+    >>> list(assigned_shifts({'A104000': {'Computer Graphics': ['T1']}}, [student]))
+    [(Student(number='A104000', ...), Shift(shift_type=ShiftType.T, number=1, ...))]
+    '''
+
+    for student in students:
+        for course_name, shift_names in assignment.get(student.number, {}).items():
+            course = student.courses[course_name]
+            for shift_name in shift_names:
+                yield student, course.shifts[shift_name]
@@ -0,0 +1,469 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from typing import Any
+import abc
+import multiprocessing
+import queue
+
+import numpy as np
+import numpy.typing as npt
+import scipy.optimize
+import scipy.sparse
+
+from ..tracing import count as count_event
+from .model import ModelError
+
+class BackendError(Exception):
+    '''Type of exception thrown by :func:`get_backend` and by backends that aren't installed.'''
+    pass
+
+class Program:
+    '''
+    Integer program in the form used by :func:`scipy.optimize.milp`, where every variable is an
+    integer (see :class:`~.model.Model`)::
+
+        minimize    objective @ x
+        subject to  constraint_lower <= constraints @ x <= constraint_upper
+                    variable_lower <= x <= variable_upper
+                    x integer
+
+    Bounds may be infinite. Programs are sent to other processes by :class:`RaceBackend`, so they
+    only contain arrays.
+
+    :param objective:        Cost of each variable.
+    :param variable_lower:   Lower bound of each variable.
+    :param variable_upper:   Upper bound of each variable.
+    :param constraints:      Constraint matrix, with one row per constraint.
+    :param constraint_lower: Lower bound of each constraint.
+    :param constraint_upper: Upper bound of each constraint.
+    '''
+
+    __slots__ = (
+        '__objective',
+        '__variable_lower',
+        '__variable_upper',
+        '__constraints',
+        '__constraint_lower',
+        '__constraint_upper'
+    )
+
+    def __init__(
+            self,
+            objective: npt.NDArray[np.float64],
+            variable_lower: npt.NDArray[np.float64],
+            variable_upper: npt.NDArray[np.float64],
+            constraints: scipy.sparse.csr_array,
+            constraint_lower: npt.NDArray[np.float64],
+            constraint_upper: npt.NDArray[np.float64]
+        ) -> None:
+
+        self.__objective = objective
+        self.__variable_lower = variable_lower
+        self.__variable_upper = variable_upper
+        self.__constraints = constraints
+        self.__constraint_lower = constraint_lower
+        self.__constraint_upper = constraint_upper
+
+    @property
+    def objective(self) -> npt.NDArray[np.float64]:
+        '''Cost of each variable.'''
+
+        return self.__objective
+
+    @property
+    def variable_lower(self) -> npt.NDArray[np.float64]:
+        '''Lower bound of each variable.'''
+
+        return self.__variable_lower
+
+    @property
+    def variable_upper(self) -> npt.NDArray[np.float64]:
+        '''Upper bound of each variable.'''
+
+        return self.__variable_upper
+
+    @property
+    def constraints(self) -> scipy.sparse.csr_array:
+        '''Constraint matrix, with one row per constraint.'''
+
+        return self.__constraints
+
+    @property
+    def constraint_lower(self) -> npt.NDArray[np.float64]:
+        '''Lower bound of each constraint.'''
+
+        return self.__constraint_lower
+
+    @property
+    def constraint_upper(self) -> npt.NDArray[np.float64]:
+        '''Upper bound of each constraint.'''
+
+        return self.__constraint_upper
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            Program,
+            (
+                self.__objective,
+                self.__variable_lower,
+                self.__variable_upper,
+                self.__constraints,
+                self.__constraint_lower,
+                self.__constraint_upper
+            )
+        )
+
+    def __repr__(self) -> str:
+        return (
+            'Program('
+            f'variables={len(self.__objective)!r}, '
+            f'constraints={self.__constraints.shape[0]!r})'
+        )
+
+class Backend(abc.ABC):
+    '''
+    Integer programming solver, that solves :class:`Program` objects. Backends must be picklable,
+    so that they can be used in worker processes (see
+    :func:`~.decomposition.solve_components`).
+    '''
+
+    __slots__ = ()
+
+    name: str = ''
+    '''Name of the backend, used by :func:`get_backend`.'''
+
+    @abc.abstractmethod
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+        '''
+        Solves an integer program.
+
+        :param program:    Program to be solved. Must have at least one variable.
+        :param time_limit: Maximum time to spend solving, in seconds. ``None`` means no limit.
+
+        :return: The value of every variable, and whether the solution is proven optimal (it may
+                 not be when the time limit is reached).
+
+        :raises ModelError: The program is infeasible, or no solution was found in time.
+        '''
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}()'
+
+class HighsBackend(Backend):
+    '''HiGHS, through :func:`scipy.optimize.milp`. Always available.'''
+
+    __slots__ = ()
+
+    name = 'highs'
+
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+
+        options = {} if time_limit is None else {'time_limit': time_limit}
+        result = scipy.optimize.milp(
+            program.objective,
+            integrality=np.ones(len(program.objective)),
+            bounds=scipy.optimize.Bounds(program.variable_lower, program.variable_upper),
+            constraints=scipy.optimize.LinearConstraint(
+                program.constraints,
+                program.constraint_lower,
+                program.constraint_upper
+            ),
+            options=options
+        )
+
+        if result.x is None:
+            raise ModelError(f'Failed to solve model: {result.message}')
+
+        solution: npt.NDArray[np.float64] = result.x
+        return solution, result.status == 0
+
+class CbcBackend(Backend):
+    '''
+    CBC, through `PuLP <https://coin-or.github.io/pulp/>`_ (optional dependency).
+
+    :raises BackendError: PuLP isn't installed.
+    '''
+
+    __slots__ = ()
+
+    name = 'cbc'
+
+    def __init__(self) -> None:
+        try:
+            import pulp # noqa: F401
+        except ImportError:
+            raise BackendError('PuLP must be installed to use the cbc backend') from None
+
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+
+        import pulp
+
+        problem = pulp.LpProblem('scheduler', pulp.LpMinimize)
+        variables = [
+            pulp.LpVariable(
+                f'x{i}',
+                None if np.isinf(lower) else lower,
+                None if np.isinf(upper) else upper,
+                pulp.LpInteger
+            )
+            for i, (lower, upper) in enumerate(zip(program.variable_lower, program.variable_upper))
+        ]
+        problem += pulp.lpSum(
+            cost * variable for cost, variable in zip(program.objective, variables) if cost != 0
+        )
+
+        matrix = program.constraints
+        bounds = zip(program.constraint_lower, program.constraint_upper)
+        for row, (lower, upper) in enumerate(bounds):
+            start, end = matrix.indptr[row], matrix.indptr[row + 1]
+            expression = pulp.lpSum(
+                coefficient * variables[column]
+                for coefficient, column in zip(matrix.data[start:end], matrix.indices[start:end])
+            )
+
+            if lower == upper:
+                problem += expression == lower
+            else:
+                if not np.isinf(lower):
+                    problem += expression >= lower
+                if not np.isinf(upper):
+                    problem += expression <= upper
+
+        # PuLP fills in values even for infeasible programs, and reports programs stopped by the
+        # time limit with a feasible solution as optimal, so only sol_status tells them apart
+        status = problem.solve(pulp.PULP_CBC_CMD(msg=False, timeLimit=time_limit))
+        if status != pulp.LpStatusOptimal:
+            raise ModelError(f'Failed to solve model: {pulp.LpStatus[status]}')
+
+        values = [variable.value() for variable in variables]
+        solution = np.array([0.0 if value is None else value for value in values])
+        return solution, problem.sol_status == pulp.LpSolutionOptimal
+
+class CpSatBackend(Backend):
+    '''
+    CP-SAT, from `OR-Tools <https://developers.google.com/optimization>`_ (optional dependency).
+    Coefficients and bounds must be integers, which is true for the scheduler's programs.
+
+    :raises BackendError: OR-Tools isn't installed.
+    '''
+
+    __slots__ = ()
+
+    name = 'cp-sat'
+
+    # Replacement of infinite bounds, as CP-SAT only supports bounded integer variables
+    _BOUND = 2 ** 40
+
+    def __init__(self) -> None:
+        try:
+            from ortools.sat.python import cp_model # noqa: F401
+        except ImportError:
+            raise BackendError('OR-Tools must be installed to use the cp-sat backend') from None
+
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+
+        from ortools.sat.python import cp_model
+
+        def bound(value: float) -> int:
+            return int(max(min(value, CpSatBackend._BOUND), -CpSatBackend._BOUND))
+
+        model = cp_model.CpModel()
+        variables = [
+            model.NewIntVar(bound(lower), bound(upper), f'x{i}')
+            for i, (lower, upper) in enumerate(zip(program.variable_lower, program.variable_upper))
+        ]
+        model.Minimize(sum(
+            int(cost) * variable
+            for cost, variable in zip(program.objective, variables)
+            if cost != 0
+        ))
+
+        matrix = program.constraints
+        bounds = zip(program.constraint_lower, program.constraint_upper)
+        for row, (lower, upper) in enumerate(bounds):
+            start, end = matrix.indptr[row], matrix.indptr[row + 1]
+            expression = sum(
+                int(coefficient) * variables[column]
+                for coefficient, column in zip(matrix.data[start:end], matrix.indices[start:end])
+            )
+            model.AddLinearConstraint(expression, bound(lower), bound(upper))
+
+        solver = cp_model.CpSolver()
+        if time_limit is not None:
+            solver.parameters.max_time_in_seconds = time_limit
+
+        status = solver.Solve(model)
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            raise ModelError(f'Failed to solve model: {solver.StatusName(status)}')
+
+        solution = np.array([solver.Value(variable) for variable in variables], dtype=np.float64)
+        return solution, status == cp_model.OPTIMAL
+
+def _race_worker(
+        backend: Backend,
+        program: Program,
+        time_limit: None | float,
+        results: multiprocessing.Queue[Any]
+    ) -> None:
+
+    try:
+        solution, optimal = backend.solve(program, time_limit)
+        results.put((backend.name, solution, optimal, None))
+    except Exception as e:
+        results.put((backend.name, None, False, str(e)))
+
+class RaceBackend(Backend):
+    '''
+    Solves programs with many backends at once, each in its own process, and keeps the first
+    optimal solution. The other processes are then stopped. If no backend proves its solution
+    optimal, the first solution found is kept.
+
+    :param backends: Backends to race.
+
+    :raises BackendError: ``backends`` is empty.
+
+    >>> backend = RaceBackend([get_backend(name) for name in available_backends()])
+    >>> assignment = Model(students).solve(backend=backend)
+    '''
+
+    __slots__ = ('__backends',)
+
+    name = 'race'
+
+    def __init__(self, backends: Sequence[Backend]) -> None:
+        if not backends:
+            raise BackendError('At least one backend must be raced')
+
+        self.__backends = list(backends)
+
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+
+        context = multiprocessing.get_context()
+        results: multiprocessing.Queue[Any] = context.Queue()
+        processes = [
+            context.Process(target=_race_worker, args=(backend, program, time_limit, results))
+            for backend in self.__backends
+        ]
+
+        for process in processes:
+            process.start()
+
+        best: None | tuple[npt.NDArray[np.float64], bool] = None
+        errors: list[str] = []
+        try:
+            for _ in processes:
+                try:
+                    name, solution, optimal, error = self.__get_result(results, processes)
+                except queue.Empty:
+                    # Processes that died (for example, killed when out of memory) post no result
+                    errors.append('processes exited without a result')
+                    break
+
+                if error is not None:
+                    errors.append(f'{name}: {error}')
+                elif optimal:
+                    count_event(f'race won by {name}')
+                    return solution, True
+                elif best is None:
+                    best = (solution, False)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        if best is None:
+            raise ModelError('All backends failed: ' + '; '.join(errors))
+
+        return best
+
+    @staticmethod
+    def __get_result(
+            results: multiprocessing.Queue[Any],
+            processes: Sequence[multiprocessing.process.BaseProcess]
+        ) -> Any:
+
+        # Waits for a result, raising queue.Empty once no process can post one
+        while True:
+            try:
+                return results.get(timeout=0.1)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    return results.get(timeout=0.1)
+
+    @property
+    def backends(self) -> Sequence[Backend]:
+        '''Raced backends.'''
+
+        return self.__backends
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (RaceBackend, (self.__backends,))
+
+    def __repr__(self) -> str:
+        return f'RaceBackend(backends={self.__backends!r})'
+
+_BACKENDS: dict[str, type[Backend]] = {
+    HighsBackend.name: HighsBackend,
+    CbcBackend.name: CbcBackend,
+    CpSatBackend.name: CpSatBackend
+}
+
+BACKEND_NAMES = tuple(_BACKENDS)
+'''Names of all backends, installed or not, that can be passed to :func:`get_backend`.'''
+
+def get_backend(name: str) -> Backend:
+    '''
+    Creates a backend from its name.
+
+    :param name: One of :data:`BACKEND_NAMES`.
+
+    :raises BackendError: Unknown backend, or backend that isn't installed.
+
+    >>> get_backend('highs')
+    HighsBackend()
+    '''
+
+    backend_type = _BACKENDS.get(name)
+    if backend_type is None:
+        raise BackendError(f'Unknown solver backend: {name!r}')
+
+    return backend_type()
+
+def available_backends() -> list[str]:
+    '''
+    Gets the names of the installed backends.
+
+    >>> available_backends()
+    ['highs', 'cbc']
+    '''
+
+    names = []
+    for name in BACKEND_NAMES:
+        try:
+            get_backend(name)
+            names.append(name)
+        except BackendError:
+            pass
+
+    return names
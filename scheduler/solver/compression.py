@@ -0,0 +1,313 @@
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse
+
+from ..tracing import count as count_event
+from ..types.shift import Shift
+from ..types.student import Student
+from .assignment import Assignment
+from .backends import Backend, HighsBackend, Program
+from .model import Model, ModelError
+
+# Maximum number of partial shift combinations explored when expanding a single student
+_SEARCH_LIMIT = 10000
+
+# Maximum number of conflict-free shift combinations enumerated when splitting a class exactly
+_PATTERN_LIMIT = 10000
+
+def group_students(students: Iterable[Student]) -> list[list[Student]]:
+    '''
+    Groups students into equivalence classes, according to the courses they are enrolled in (the
+    keys of :attr:`~.student.Student.courses`). Classes are ordered by their first student, and
+    students keep their order inside each class.
+
+    :param students: Students to be grouped.
+
+    >>> group_students([Student('A1', [lcom]), Student('A2', [cg]), Student('A3', [lcom])])
+    [[Student(number='A1', ...), Student(number='A3', ...)], [Student(number='A2', ...)]]
+    '''
+
+    classes: dict[frozenset[str], list[Student]] = {}
+    for student in students:
+        classes.setdefault(frozenset(student.courses), []).append(student)
+
+    return list(classes.values())
+
+class CompressedModel:
+    '''
+    Smaller version of :class:`~.model.Model`, where students enrolled in the same courses are
+    grouped (:func:`group_students`), and each class of students enters the model as a single
+    student. Its variables are then the number of students of a class attributed to each shift,
+    instead of binary values for each student.
+
+    The solution to the compressed model is expanded back to individual students, by splitting
+    each class's shift counts into conflict-free shift combinations, one per student. The overlap
+    constraints of the compressed model are necessary, but not sufficient, for such a split to
+    exist. Counts are first split greedily, one student at a time, and then exactly, with a small
+    integer program over the class's conflict-free shift combinations. When no split exists,
+    :meth:`solve` models the class's students individually and solves the model again.
+
+    :param students:      Students to attribute shifts to.
+    :param soft_overlaps: See :class:`~.model.Model`. When ``True``, students that can't be given
+                          a conflict-free combination during expansion get overlapping shifts.
+
+    >>> model = CompressedModel(students)
+    >>> len(model.classes) < len(students)
+    True
+    >>> assignment = model.solve()
+    '''
+
+    __slots__ = ('__classes', '__model', '__soft_overlaps')
+
+    def __init__(self, students: Iterable[Student], soft_overlaps: bool = False) -> None:
+        self.__classes = group_students(students)
+        self.__soft_overlaps = soft_overlaps
+        self.__model = self.__build_model()
+
+    def __build_model(self) -> Model:
+        return Model(
+            [student_class[0] for student_class in self.__classes],
+            self.__soft_overlaps,
+            [len(student_class) for student_class in self.__classes]
+        )
+
+    def expand(self, solution: npt.NDArray[np.float64]) -> Assignment:
+        '''
+        Converts a solution of the compressed model to an assignment of individual students.
+
+        :param solution: Value of every variable of :attr:`model`.
+
+        :raises ModelError: ``solution`` has the wrong number of variables, or it can't be split
+                            into conflict-free shift combinations (only if overlaps aren't soft).
+        '''
+
+        assignment, failed = self.__expand_classes(solution)
+        if failed:
+            raise ModelError('Failed to split class into conflict-free shift combinations')
+
+        return assignment
+
+    def __expand_classes(self, solution: npt.NDArray[np.float64]) -> tuple[Assignment, list[int]]:
+        # Expands every class that can be expanded, and returns the indices of those that can't
+        counts = self.__model.counts(solution)
+        courses = self.__model.courses
+        shifts = self.__model.shifts
+
+        # For each class, the shifts of each course and type group, with their student counts
+        class_groups: list[dict[tuple[int, str], list[tuple[Shift, int]]]] = [
+            {} for _ in self.__classes
+        ]
+        for variable in np.flatnonzero(counts):
+            course_id = int(self.__model.variable_courses[variable])
+            shift = shifts[self.__model.variable_shifts[variable]]
+            groups = class_groups[self.__model.variable_students[variable]]
+            groups.setdefault((course_id, shift.shift_type), []).append(
+                (shift, int(counts[variable]))
+            )
+
+        assignment: Assignment = {}
+        failed: list[int] = []
+        for class_id, (student_class, groups) in enumerate(zip(self.__classes, class_groups)):
+            group_courses = [courses[course_id] for course_id, _ in groups]
+            group_shifts = list(groups.values())
+            try:
+                combinations = self.__expand_greedy(len(student_class), group_shifts)
+            except ModelError:
+                # Greedily taken combinations can leave the last students without a conflict-free
+                # one, even when the counts can be split exactly
+                split = self.__split_class(len(student_class), group_shifts)
+                if split is not None:
+                    count_event('exact class splits')
+                    combinations = split
+                elif self.__soft_overlaps:
+                    combinations = self.__expand_greedy(len(student_class), group_shifts)
+                else:
+                    failed.append(class_id)
+                    continue
+
+            for student, combination in zip(student_class, combinations):
+                shift_names: dict[str, list[str]] = {}
+                for course, shift in zip(group_courses, combination):
+                    shift_names.setdefault(course.name, []).append(shift.name)
+
+                assignment[student.number] = shift_names
+
+        return assignment, failed
+
+    def __expand_greedy(
+            self,
+            size: int,
+            groups: Sequence[Sequence[tuple[Shift, int]]]
+        ) -> list[list[Shift]]:
+
+        remaining = [{id(shift): count for shift, count in options} for options in groups]
+        options = [[shift for shift, _ in group_options] for group_options in groups]
+
+        combinations = []
+        for _ in range(size):
+            combination = self.__expand_student(remaining, options)
+            for group_remaining, shift in zip(remaining, combination):
+                group_remaining[id(shift)] -= 1
+
+            combinations.append(combination)
+
+        return combinations
+
+    @staticmethod
+    def __split_class(
+            size: int,
+            groups: Sequence[Sequence[tuple[Shift, int]]]
+        ) -> None | list[list[Shift]]:
+
+        # Conflict-free combinations of the shifts with students, one shift index per group
+        patterns: list[list[int]] = []
+        chosen: list[int] = []
+
+        def search(depth: int) -> bool:
+            if depth == len(groups):
+                patterns.append(list(chosen))
+                return len(patterns) < _PATTERN_LIMIT
+
+            for i, (shift, _) in enumerate(groups[depth]):
+                if not any(shift.overlaps(groups[g][j][0]) for g, j in enumerate(chosen)):
+                    chosen.append(i)
+                    if not search(depth + 1):
+                        return False
+                    chosen.pop()
+
+            return True
+
+        if not search(0) or not patterns:
+            return None
+
+        # One integer variable per pattern, and one equality row per shift, requiring that pattern
+        # counts add up to the shift's count
+        row_offsets = np.cumsum([0] + [len(options) for options in groups])
+        rows = np.array([row_offsets[g] + i for pattern in patterns for g, i in enumerate(pattern)])
+        columns = np.repeat(np.arange(len(patterns)), len(groups))
+        counts = np.array(
+            [count for options in groups for _, count in options],
+            dtype=np.float64
+        )
+
+        program = Program(
+            np.zeros(len(patterns)),
+            np.zeros(len(patterns)),
+            np.full(len(patterns), float(size)),
+            scipy.sparse.csr_array(
+                (np.ones(len(rows)), (rows, columns)),
+                shape=(len(counts), len(patterns))
+            ),
+            counts,
+            counts
+        )
+
+        try:
+            solution, _ = HighsBackend().solve(program)
+        except ModelError:
+            return None
+
+        return [
+            [groups[g][i][0] for g, i in enumerate(pattern)]
+            for pattern, count in zip(patterns, np.rint(solution).astype(np.int64))
+            for _ in range(count)
+        ]
+
+    def __expand_student(
+            self,
+            remaining: Sequence[dict[int, int]],
+            options: Sequence[Sequence[Shift]]
+        ) -> list[Shift]:
+
+        # Search groups with fewer available shifts first, and shifts with more seats left first
+        available = [
+            sorted(
+                (shift for shift in group_options if group_remaining[id(shift)] > 0),
+                key=lambda shift: -group_remaining[id(shift)]
+            )
+            for group_remaining, group_options in zip(remaining, options)
+        ]
+        order = sorted(range(len(available)), key=lambda i: len(available[i]))
+        if any(not group_available for group_available in available):
+            raise ModelError('Shift counts don\'t cover all students in a class')
+
+        chosen: list[Shift] = []
+        explored = 0
+
+        def search(depth: int) -> bool:
+            nonlocal explored
+            if depth == len(order):
+                return True
+
+            for shift in available[order[depth]]:
+                explored += 1
+                if explored > _SEARCH_LIMIT:
+                    return False
+
+                if not any(shift.overlaps(other) for other in chosen):
+                    chosen.append(shift)
+                    if search(depth + 1):
+                        return True
+                    chosen.pop()
+
+            return False
+
+        if search(0):
+            combination = chosen
+        elif self.__soft_overlaps:
+            combination = [available[i][0] for i in order]
+        else:
+            raise ModelError('Failed to split class into conflict-free shift combinations')
+
+        # Return shifts in group order
+        by_group = dict(zip(order, combination))
+        return [by_group[i] for i in range(len(order))]
+
+    def solve(self, time_limit: None | float = None, backend: None | Backend = None) -> Assignment:
+        '''
+        Solves the compressed model (:meth:`~.model.Model.solve_values`) and expands its solution
+        (:meth:`expand`). Classes whose shift counts can't be split are replaced by their
+        individual students, which the model handles exactly, and the model is solved again, until
+        every class is expanded. :attr:`classes` and :attr:`model` are updated accordingly.
+
+        :param time_limit: Maximum time to spend solving, in seconds. ``None`` means no limit. Each
+                           solve of the model gets its own time limit.
+        :param backend:    Solver to use (see :mod:`~.solver.backends`). ``None`` means HiGHS.
+
+        :raises ModelError: The model is infeasible, or no solution was found in time.
+        '''
+
+        while True:
+            solution = self.__model.solve_values(time_limit, backend)
+            assignment, failed = self.__expand_classes(solution)
+            if not failed:
+                return assignment
+
+            count_event('split classes', len(failed))
+            failed_set = set(failed)
+            self.__classes = [
+                student_class for i, student_class in enumerate(self.__classes)
+                if i not in failed_set
+            ] + [[student] for i in failed for student in self.__classes[i]]
+            self.__model = self.__build_model()
+
+    @property
+    def classes(self) -> Sequence[Sequence[Student]]:
+        '''
+        Equivalence classes of students. The first student of each class is the one that represents
+        it in :attr:`model`.
+        '''
+
+        return self.__classes
+
+    @property
+    def model(self) -> Model:
+        '''Underlying model, with one student per class.'''
+
+        return self.__model
+
+    def __repr__(self) -> str:
+        return f'CompressedModel(classes={len(self.__classes)!r}, model={self.__model!r})'
@@ -0,0 +1,147 @@
+from __future__ import annotations
+from collections.abc import Iterable
+import concurrent.futures
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.csgraph
+
+from ..tracing import traced
+from ..types.student import Student
+from .assignment import Assignment
+from .backends import Backend
+from .compression import CompressedModel
+from .model import Model
+
+def connected_components(students: Iterable[Student]) -> list[list[Student]]:
+    '''
+    Splits students into independent subproblems: connected components of the graph where courses
+    are connected when they share students (:attr:`~.student.Student.courses`) or shifts
+    (:attr:`~.course.Course.shifts`). Students in different components compete for no shifts, so
+    their shifts can be attributed separately.
+
+    Components are sorted by decreasing number of students, and students keep their order inside
+    each component. Students not enrolled in any course form a component of their own.
+
+    :param students: Students to be split.
+
+    >>> connected_components([Student('A1', [lcom]), Student('A2', [cg]), Student('A3', [lcom])])
+    [[Student(number='A1', ...), Student(number='A3', ...)], [Student(number='A2', ...)]]
+    '''
+
+    student_list = list(students)
+
+    # Edges between consecutive courses of every student and of every shift
+    course_ids: dict[int, int] = {}
+    shift_courses: dict[int, int] = {}
+    edge_sources: list[int] = []
+    edge_targets: list[int] = []
+    student_courses: list[int] = []
+
+    for student in student_list:
+        previous = -1
+        for course in student.courses.values():
+            course_id = course_ids.get(id(course))
+            if course_id is None:
+                course_id = course_ids[id(course)] = len(course_ids)
+                for shift in course.shifts.values():
+                    other_course_id = shift_courses.setdefault(id(shift), course_id)
+                    if other_course_id != course_id:
+                        edge_sources.append(other_course_id)
+                        edge_targets.append(course_id)
+
+            if previous >= 0:
+                edge_sources.append(previous)
+                edge_targets.append(course_id)
+
+            previous = course_id
+
+        student_courses.append(previous)
+
+    graph = scipy.sparse.coo_array(
+        (np.ones(len(edge_sources)), (edge_sources, edge_targets)),
+        shape=(len(course_ids), len(course_ids))
+    )
+    _, labels = scipy.sparse.csgraph.connected_components(graph, directed=False)
+
+    components: dict[int, list[Student]] = {}
+    for student, course_id in zip(student_list, student_courses):
+        label = -1 if course_id < 0 else int(labels[course_id])
+        components.setdefault(label, []).append(student)
+
+    return sorted(components.values(), key=len, reverse=True)
+
+def solve_component(
+        students: list[Student],
+        soft_overlaps: bool = False,
+        compress: bool = False,
+        time_limit: None | float = None,
+        backend: None | Backend = None
+    ) -> Assignment:
+    '''
+    Attributes shifts to a set of students, by solving a :class:`~.compression.CompressedModel`
+    or a :class:`~.model.Model`. Used by :func:`solve_components` in worker processes.
+
+    :param students:      Students to attribute shifts to.
+    :param soft_overlaps: See :class:`~.model.Model`.
+    :param compress:      Whether to group identical students (see :mod:`~.solver.compression`).
+                          Off by default, as large classes often can't be expanded directly,
+                          making compression slower than the plain model on realistic instances.
+    :param time_limit:    Maximum time to spend solving, in seconds. ``None`` means no limit.
+    :param backend:       Solver to use (see :mod:`~.solver.backends`). ``None`` means HiGHS.
+
+    :raises ModelError: The model is infeasible, or no solution was found in time.
+    '''
+
+    if compress:
+        return CompressedModel(students, soft_overlaps).solve(time_limit, backend)
+    else:
+        return Model(students, soft_overlaps).solve(time_limit, backend)
+
+@traced('solve components')
+def solve_components(
+        students: Iterable[Student],
+        soft_overlaps: bool = False,
+        compress: bool = False,
+        time_limit: None | float = None,
+        max_workers: None | int = None,
+        backend: None | Backend = None
+    ) -> Assignment:
+    '''
+    Attributes shifts to students, splitting the problem into its connected components
+    (:func:`connected_components`) and solving each of them in a separate process. The assignments
+    of all components are then merged.
+
+    :param students:      Students to attribute shifts to.
+    :param soft_overlaps: See :class:`~.model.Model`.
+    :param compress:      Whether to group identical students (see :func:`solve_component`).
+    :param time_limit:    Maximum time to spend solving each component, in seconds. ``None`` means
+                          no limit.
+    :param max_workers:   Maximum number of worker processes. ``None`` uses all processors. When
+                          ``1``, or when there's a single component, no processes are created.
+    :param backend:       Solver to use (see :mod:`~.solver.backends`). ``None`` means HiGHS.
+
+    :raises ModelError: The model of a component is infeasible, or no solution was found in time.
+
+    >>> assignment = solve_components(students, max_workers=4)
+    '''
+
+    components = connected_components(students)
+    arguments = (soft_overlaps, compress, time_limit, backend)
+
+    assignment: Assignment = {}
+    if max_workers == 1 or len(components) <= 1:
+        for component in components:
+            assignment.update(solve_component(component, *arguments))
+    else:
+        # Components are sorted by size, so the largest ones are started first
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(solve_component, component, *arguments)
+                for component in components
+            ]
+
+            for future in futures:
+                assignment.update(future.result())
+
+    return assignment
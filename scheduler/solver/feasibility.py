@@ -0,0 +1,215 @@
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from ..tracing import traced
+from ..types.course import Course
+from ..types.shift import ShiftType
+from ..types.student import Student
+
+class FeasibilityReport:
+    '''
+    Necessary conditions for an assignment to exist that were found to be violated by
+    :func:`check_feasibility`. Shifts are identified by the names of their course and their own
+    name.
+
+    :param under_capacity:   Course shift types whose shifts, together, can't sit every enrolled
+                             student, as ``(course, type, students, capacity)``.
+    :param conflicting:      Course shift types whose shifts compatible with another course can't
+                             sit every student enrolled in both courses, as
+                             ``(course, type, other course, students, capacity)``.
+    :param unknown_capacity: Shifts of unknown capacity, as ``(course, shift)``. These don't make
+                             an instance infeasible, but they aren't limited by the solvers.
+    '''
+
+    __slots__ = ('__under_capacity', '__conflicting', '__unknown_capacity')
+
+    def __init__(
+            self,
+            under_capacity: list[tuple[str, ShiftType, int, int]],
+            conflicting: list[tuple[str, ShiftType, str, int, int]],
+            unknown_capacity: list[tuple[str, str]]
+        ) -> None:
+
+        self.__under_capacity = under_capacity
+        self.__conflicting = conflicting
+        self.__unknown_capacity = unknown_capacity
+
+    @property
+    def under_capacity(self) -> Sequence[tuple[str, ShiftType, int, int]]:
+        '''Course shift types without enough seats, as ``(course, type, students, capacity)``.'''
+
+        return self.__under_capacity
+
+    @property
+    def conflicting(self) -> Sequence[tuple[str, ShiftType, str, int, int]]:
+        '''
+        Course shift types without enough seats compatible with another course, as
+        ``(course, type, other course, students, capacity)``.
+        '''
+
+        return self.__conflicting
+
+    @property
+    def unknown_capacity(self) -> Sequence[tuple[str, str]]:
+        '''Shifts of unknown capacity, as ``(course, shift)``.'''
+
+        return self.__unknown_capacity
+
+    @property
+    def feasible(self) -> bool:
+        '''
+        Whether no necessary condition was violated. This doesn't imply that an assignment exists.
+        '''
+
+        return not (self.__under_capacity or self.__conflicting)
+
+    def __repr__(self) -> str:
+        return (
+            'FeasibilityReport('
+            f'under_capacity={self.__under_capacity!r}, '
+            f'conflicting={self.__conflicting!r}, '
+            f'unknown_capacity={self.__unknown_capacity!r})'
+        )
+
+class _CourseShifts:
+    '''Shifts of a course as arrays, to test all pairs of shifts of two courses for overlaps.'''
+
+    __slots__ = ('shifts', 'capacities', 'groups', 'timeslot_shifts', 'starts', 'ends')
+
+    def __init__(self, course: Course) -> None:
+        self.shifts = list(course.shifts.values())
+        self.capacities = np.array(
+            [np.inf if shift.capacity is None else shift.capacity for shift in self.shifts],
+            dtype=np.float64
+        )
+
+        group_lists: dict[ShiftType, list[int]] = {}
+        for i, shift in enumerate(self.shifts):
+            group_lists.setdefault(shift.shift_type, []).append(i)
+        self.groups = {
+            shift_type: np.array(indices, dtype=np.int64)
+            for shift_type, indices in group_lists.items()
+        }
+
+        timeslots = [(i, t) for i, shift in enumerate(self.shifts) for t in shift.timeslots]
+        self.timeslot_shifts = np.array([i for i, _ in timeslots], dtype=np.int64)
+        self.starts = np.array([t.start_minute for _, t in timeslots], dtype=np.int64)
+        self.ends = np.array([t.end_minute for _, t in timeslots], dtype=np.int64)
+
+    def overlaps(self, other: _CourseShifts) -> npt.NDArray[np.bool_]:
+        # Matrix of overlapping shifts, from overlapping pairs of timeslots
+        i, j = np.nonzero(
+            (self.starts[:, None] < other.ends[None, :]) &
+            (other.starts[None, :] < self.ends[:, None])
+        )
+
+        matrix = np.zeros((len(self.shifts), len(other.shifts)), dtype=np.bool_)
+        matrix[self.timeslot_shifts[i], other.timeslot_shifts[j]] = True
+        return matrix
+
+    def total_capacity(self, shifts: npt.NDArray[np.int64]) -> None | int:
+        # Shifts of unknown capacity make the total unlimited
+        total = float(self.capacities[shifts].sum())
+        return None if total == np.inf else int(total)
+
+@traced('feasibility check')
+def check_feasibility(
+        students: Iterable[Student],
+        soft_overlaps: bool = False
+    ) -> FeasibilityReport:
+    '''
+    Checks necessary conditions for an assignment of shifts to exist, much faster than building and
+    solving a :class:`~.model.Model`:
+
+    * For each course and :class:`~.shift.ShiftType`, the summed :attr:`~.shift.Shift.capacity` of
+      its shifts must cover the students enrolled in the course;
+    * For each pair of courses with students in common, and for each type of the first course, the
+      students in common must fit in the shifts of that type that can be combined with one shift of
+      each type of the other course without overlaps. This is a Hall-style bound on the neighbors
+      of those students: when every shift of the type overlaps with every shift of a type of the
+      other course, no seats are available at all.
+
+    Shifts of unknown capacity are unlimited, so groups that contain them are never short of seats.
+    They are reported separately.
+
+    :param students:      Students to attribute shifts to.
+    :param soft_overlaps: Whether overlaps will be allowed (see :class:`~.model.Model`), in which
+                          case the second condition isn't checked.
+
+    >>> report = check_feasibility(students)
+    >>> report.under_capacity
+    [('Computer Graphics', ShiftType.PL, 120, 100)]
+    '''
+
+    courses: list[Course] = []
+    course_ids: dict[int, int] = {}
+    enrollments: list[int] = []
+    signatures: dict[tuple[int, ...], int] = {}
+
+    for student in students:
+        student_course_ids = []
+        for course in student.courses.values():
+            course_id = course_ids.get(id(course))
+            if course_id is None:
+                course_id = course_ids[id(course)] = len(courses)
+                courses.append(course)
+                enrollments.append(0)
+
+            enrollments[course_id] += 1
+            student_course_ids.append(course_id)
+
+        signature = tuple(sorted(student_course_ids))
+        signatures[signature] = signatures.get(signature, 0) + 1
+
+    # Students in common between every pair of courses, counted once per set of courses
+    pair_enrollments: dict[tuple[int, int], int] = {}
+    if not soft_overlaps:
+        for signature, count in signatures.items():
+            for i, first in enumerate(signature):
+                for second in signature[i + 1:]:
+                    pair_enrollments[(first, second)] = \
+                        pair_enrollments.get((first, second), 0) + count
+
+    course_shifts = [_CourseShifts(course) for course in courses]
+
+    under_capacity: list[tuple[str, ShiftType, int, int]] = []
+    unknown_capacity: list[tuple[str, str]] = []
+    for course, shifts, enrolled in zip(courses, course_shifts, enrollments):
+        for shift_type, group in shifts.groups.items():
+            capacity = shifts.total_capacity(group)
+            if capacity is not None and capacity < enrolled:
+                under_capacity.append((course.name, shift_type, enrolled, capacity))
+
+        unknown_capacity.extend(
+            (course.name, shift.name) for shift in shifts.shifts if shift.capacity is None
+        )
+
+    conflicting: list[tuple[str, ShiftType, str, int, int]] = []
+    for (first, second), enrolled in sorted(pair_enrollments.items()):
+        matrix = course_shifts[first].overlaps(course_shifts[second])
+        for course_id, other_id, pair_matrix in (
+            (first, second, matrix),
+            (second, first, matrix.T)
+        ):
+            shifts = course_shifts[course_id]
+
+            # Shifts that leave at least one shift of each type of the other course free
+            compatible = np.ones(len(shifts.shifts), dtype=np.bool_)
+            for other_group in course_shifts[other_id].groups.values():
+                compatible &= ~pair_matrix[:, other_group].all(axis=1)
+
+            for shift_type, group in shifts.groups.items():
+                capacity = shifts.total_capacity(group[compatible[group]])
+                if capacity is not None and capacity < enrolled:
+                    conflicting.append((
+                        courses[course_id].name,
+                        shift_type,
+                        courses[other_id].name,
+                        enrolled,
+                        capacity
+                    ))
+
+    return FeasibilityReport(under_capacity, conflicting, unknown_capacity)
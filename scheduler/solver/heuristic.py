@@ -0,0 +1,114 @@
+from __future__ import annotations
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from ..index.conflicts import ShiftConflictIndex
+from ..tracing import traced
+from ..types.course import Course
+from ..types.student import Student
+from .assignment import Assignment
+
+class HeuristicError(Exception):
+    '''Type of exception thrown by :func:`solve_heuristic`.'''
+    pass
+
+@traced('solve')
+def solve_heuristic(students: Iterable[Student]) -> Assignment:
+    '''
+    Quickly attributes shifts to students, without solving an integer program. Each student is
+    given one shift of each :class:`~.shift.ShiftType` of each course, in a single greedy pass:
+
+    * Every course and shift type is given a scarcity: the number of seats in its shifts
+      (:attr:`~.shift.Shift.capacity`) divided by the number of students enrolled in the course.
+      Students taking the scarcest courses are handled first, and, for each student, the scarcest
+      courses and shift types are handled first;
+    * Among the shifts with free seats, the student gets the one with the most free seats that
+      doesn't overlap with the shifts they already have. When every shift with free seats overlaps,
+      overlaps are allowed, so the result may have overlapping shifts even when the problem is
+      feasible.
+
+    Overlaps are checked with a :class:`~.conflicts.ShiftConflictIndex`.
+
+    :param students: Students to attribute shifts to.
+
+    :raises HeuristicError: There are not enough seats in the shifts of a course.
+
+    >>> assignment = solve_heuristic(students)
+    '''
+
+    student_list = list(students)
+
+    course_ids: dict[int, int] = {}
+    courses: list[Course] = []
+    for student in student_list:
+        for course in student.courses.values():
+            if id(course) not in course_ids:
+                course_ids[id(course)] = len(courses)
+                courses.append(course)
+
+    index = ShiftConflictIndex(courses)
+    remaining = np.array(
+        [np.inf if shift.capacity is None else shift.capacity for shift in index.shifts],
+        dtype=np.float64
+    )
+
+    # Shift identifiers of each course and shift type
+    course_groups: list[list[npt.NDArray[np.int64]]] = []
+    for course in courses:
+        groups: dict[str, list[int]] = {}
+        for shift in course.shifts.values():
+            groups.setdefault(shift.shift_type, []).append(index.id_of(shift))
+
+        course_groups.append([np.array(ids, dtype=np.int64) for ids in groups.values()])
+
+    demand = np.zeros(len(courses))
+    for student in student_list:
+        for course in student.courses.values():
+            demand[course_ids[id(course)]] += 1
+
+    scarcity = [
+        [float(remaining[ids].sum()) / demand[course_id] for ids in groups]
+        for course_id, groups in enumerate(course_groups)
+    ]
+
+    # Work items (scarcity, course, group) of each student, scarcest first
+    student_items = [
+        sorted(
+            (scarcity[course_ids[id(course)]][group], course_ids[id(course)], group)
+            for course in student.courses.values()
+            for group in range(len(course_groups[course_ids[id(course)]]))
+        )
+        for student in student_list
+    ]
+    order = sorted(
+        range(len(student_list)),
+        key=lambda i: student_items[i][0][0] if student_items[i] else np.inf
+    )
+
+    assignment: Assignment = {student.number: {} for student in student_list}
+    for i in order:
+        student_shifts = assignment[student_list[i].number]
+        busy = np.zeros(len(index), dtype=np.bool_)
+
+        for _, course_id, group in student_items[i]:
+            ids = course_groups[course_id][group]
+            free = ids[remaining[ids] > 0]
+            if len(free) == 0:
+                raise HeuristicError(
+                    f'Not enough seats in course {courses[course_id].name!r} '
+                    f'for student {student_list[i].number!r}'
+                )
+
+            non_overlapping = free[~busy[free]]
+            candidates = non_overlapping if len(non_overlapping) > 0 else free
+            choice = int(candidates[np.argmax(remaining[candidates])])
+
+            remaining[choice] -= 1
+            busy |= index.matrix[choice]
+
+            shift_names = student_shifts.setdefault(courses[course_id].name, [])
+            shift_names.append(index.shifts[choice].name)
+
+    return assignment
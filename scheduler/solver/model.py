@@ -0,0 +1,466 @@
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse
+
+from ..tracing import count as count_event, traced
+from ..types.course import Course
+from ..types.shift import Shift
+from ..types.student import Student
+from .assignment import Assignment
+
+if TYPE_CHECKING:
+    from .backends import Backend
+
+class ModelError(Exception):
+    '''Type of exception thrown by :class:`Model`.'''
+    pass
+
+class Model:
+    '''
+    Mixed-integer linear program that attributes shifts to students. There is one binary variable
+    per student, per course the student is enrolled in, and per shift of that course, that tells
+    whether the student is attributed that shift. The program is subject to the following
+    constraints:
+
+    * Each student is attributed exactly one shift of each :class:`~.shift.ShiftType` of each
+      course they are enrolled in;
+    * No student is attributed two shifts that overlap (:meth:`~.shift.Shift.overlaps`);
+    * The number of students in each shift does not exceed its :attr:`~.shift.Shift.capacity`.
+      Shifts of unknown capacity are not limited.
+
+    Overlaps are expressed as clique constraints: for every student and every instant a class
+    starts, at most one of the student's shifts can be taking place. Instants where only one of the
+    student's shifts (or shifts of the same type and course) takes place are skipped.
+
+    The constraint matrix is built with vectorized operations over all enrollments at once, and
+    the time and memory needed to build it grow with the number of nonzero coefficients.
+
+    :param students:      Students to attribute shifts to.
+    :param soft_overlaps:  When ``True``, instead of forbidding overlaps, one integer slack
+                           variable is added per overlap constraint, and the total number of
+                           overlaps is minimized.
+    :param multiplicities: Number of identical students each element of ``students`` stands for
+                           (see :mod:`~.solver.compression`). When provided, variables become
+                           integer counts of students, bounded by the multiplicity of their
+                           student, instead of binary values. Defaults to one for every student.
+
+    :raises ModelError: ``multiplicities`` doesn't have one positive value per student.
+
+    The program takes the form used by :func:`scipy.optimize.milp`::
+
+        minimize    objective @ x
+        subject to  constraint_lower <= constraints @ x <= constraint_upper
+                    variable_lower <= x <= variable_upper
+                    x integer
+
+    >>> model = Model(students)
+    >>> assignment = model.solve()
+    '''
+
+    __slots__ = (
+        '__students',
+        '__courses',
+        '__shifts',
+        '__variable_students',
+        '__variable_courses',
+        '__variable_shifts',
+        '__multiplicities',
+        '__objective',
+        '__variable_upper',
+        '__constraints',
+        '__constraint_lower',
+        '__constraint_upper'
+    )
+
+    @traced('model build')
+    def __init__(
+            self,
+            students: Iterable[Student],
+            soft_overlaps: bool = False,
+            multiplicities: None | Sequence[int] = None
+        ) -> None:
+
+        self.__students = list(students)
+        self.__courses: list[Course] = []
+        self.__shifts: list[Shift] = []
+
+        if multiplicities is None:
+            self.__multiplicities = None
+            student_multiplicities = np.ones(len(self.__students))
+        elif len(multiplicities) != len(self.__students) or any(m <= 0 for m in multiplicities):
+            raise ModelError('There must be one positive multiplicity per student')
+        else:
+            self.__multiplicities = list(multiplicities)
+            student_multiplicities = np.array(multiplicities, dtype=np.float64)
+
+        # Enrollments, as pairs of indices into the lists above
+        course_ids: dict[int, int] = {}
+        enrollment_students: list[int] = []
+        enrollment_courses: list[int] = []
+        for student_id, student in enumerate(self.__students):
+            for course in student.courses.values():
+                course_id = course_ids.get(id(course))
+                if course_id is None:
+                    course_id = course_ids[id(course)] = len(self.__courses)
+                    self.__courses.append(course)
+
+                enrollment_students.append(student_id)
+                enrollment_courses.append(course_id)
+
+        # Course slots: the shifts of every course, in order, and the type group of each of them
+        shift_ids: dict[int, int] = {}
+        course_slot_counts: list[int] = []
+        course_group_counts: list[int] = []
+        slot_shifts: list[int] = []
+        slot_groups: list[int] = []
+        for course in self.__courses:
+            groups: dict[str, int] = {}
+            for shift in course.shifts.values():
+                shift_id = shift_ids.get(id(shift))
+                if shift_id is None:
+                    shift_id = shift_ids[id(shift)] = len(self.__shifts)
+                    self.__shifts.append(shift)
+
+                slot_shifts.append(shift_id)
+                slot_groups.append(groups.setdefault(shift.shift_type, len(groups)))
+
+            course_slot_counts.append(len(course.shifts))
+            course_group_counts.append(len(groups))
+
+        enrollment_student_array = np.array(enrollment_students, dtype=np.int64)
+        enrollment_course_array = np.array(enrollment_courses, dtype=np.int64)
+        slot_counts = np.array(course_slot_counts, dtype=np.int64)[enrollment_course_array]
+        group_counts = np.array(course_group_counts, dtype=np.int64)[enrollment_course_array]
+        course_slot_starts = Model.__exclusive_cumsum(np.array(course_slot_counts, dtype=np.int64))
+
+        # Variables: one per enrollment and slot of the enrollment's course
+        variable_count = int(slot_counts.sum())
+        variable_enrollments = np.repeat(np.arange(len(enrollment_students)), slot_counts)
+        variable_slots = (
+            course_slot_starts[enrollment_course_array][variable_enrollments] +
+            np.arange(variable_count) -
+            Model.__exclusive_cumsum(slot_counts)[variable_enrollments]
+        )
+
+        self.__variable_students = enrollment_student_array[variable_enrollments]
+        self.__variable_courses = enrollment_course_array[variable_enrollments]
+        self.__variable_shifts: npt.NDArray[np.int64] = \
+            np.array(slot_shifts, dtype=np.int64)[variable_slots]
+        variables = np.arange(variable_count)
+
+        # One shift of each type per course: one row per enrollment and type
+        variable_groups = (
+            Model.__exclusive_cumsum(group_counts)[variable_enrollments] +
+            np.array(slot_groups, dtype=np.int64)[variable_slots]
+        )
+        group_row_count = int(group_counts.sum())
+
+        # Capacity: one row per shift of known capacity
+        capacities = np.array(
+            [-1 if shift.capacity is None else shift.capacity for shift in self.__shifts],
+            dtype=np.int64
+        )
+        limited_shifts = np.flatnonzero(capacities >= 0)
+        capacity_rows = np.full(len(self.__shifts), -1, dtype=np.int64)
+        capacity_rows[limited_shifts] = np.arange(len(limited_shifts))
+
+        limited_variables = variables[capacity_rows[self.__variable_shifts] >= 0]
+        capacity_row_count = len(limited_shifts)
+
+        # Overlaps: one row per student and class starting instant with overlapping shifts
+        overlap_variables, overlap_keys, instant_count = \
+            self.__overlap_entries(variables, variable_groups)
+        overlap_row_keys = Model.__unique(overlap_keys)
+        overlap_row_count = len(overlap_row_keys)
+
+        # Right-hand sides of rows that depend on the number of students represented
+        group_row_multiplicities = np.repeat(
+            student_multiplicities[enrollment_student_array],
+            group_counts
+        )
+        overlap_row_multiplicities = \
+            student_multiplicities[overlap_row_keys // max(instant_count, 1)]
+
+        # Build matrix
+        rows = np.concatenate((
+            variable_groups,
+            group_row_count + capacity_rows[self.__variable_shifts[limited_variables]],
+            group_row_count + capacity_row_count + np.searchsorted(overlap_row_keys, overlap_keys)
+        ))
+        columns = np.concatenate((variables, limited_variables, overlap_variables))
+        row_count = group_row_count + capacity_row_count + overlap_row_count
+
+        self.__constraint_lower = np.concatenate((
+            group_row_multiplicities,
+            np.zeros(capacity_row_count),
+            np.zeros(overlap_row_count)
+        ))
+        self.__constraint_upper = np.concatenate((
+            group_row_multiplicities,
+            capacities[limited_shifts].astype(np.float64),
+            overlap_row_multiplicities
+        ))
+
+        self.__objective = np.zeros(variable_count)
+        self.__variable_upper = student_multiplicities[self.__variable_students]
+        column_count = variable_count
+        data = np.ones(len(rows))
+
+        if soft_overlaps:
+            slack_rows = group_row_count + capacity_row_count + np.arange(overlap_row_count)
+            rows = np.concatenate((rows, slack_rows))
+            columns = np.concatenate((columns, variable_count + np.arange(overlap_row_count)))
+            data = np.concatenate((data, -np.ones(overlap_row_count)))
+
+            column_count += overlap_row_count
+            self.__objective = np.concatenate((self.__objective, np.ones(overlap_row_count)))
+            self.__variable_upper = np.concatenate(
+                (self.__variable_upper, np.full(overlap_row_count, np.inf))
+            )
+
+        self.__constraints = scipy.sparse.csr_array(
+            (data, (rows, columns)),
+            shape=(row_count, column_count)
+        )
+
+        count_event('model variables', column_count)
+        count_event('model constraints', row_count)
+
+    def __overlap_entries(
+            self,
+            variables: npt.NDArray[np.int64],
+            variable_groups: npt.NDArray[np.int64]
+        ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], int]:
+
+        # Instants when classes start, and, for each shift, the ones it is taking place in
+        instants = np.unique(np.array(
+            [timeslot.start_minute for shift in self.__shifts for timeslot in shift.timeslots],
+            dtype=np.int64
+        ))
+
+        shift_instants: list[int] = []
+        shift_instant_counts: list[int] = []
+        for shift in self.__shifts:
+            count = 0
+            for timeslot in shift.timeslots:
+                first = int(np.searchsorted(instants, timeslot.start_minute))
+                last = int(np.searchsorted(instants, timeslot.end_minute))
+                shift_instants.extend(range(first, last))
+                count += last - first
+
+            shift_instant_counts.append(count)
+
+        # Expand to one entry per variable and instant
+        instant_counts = np.array(shift_instant_counts, dtype=np.int64)
+        instant_starts = Model.__exclusive_cumsum(instant_counts)
+        variable_instant_counts = instant_counts[self.__variable_shifts]
+
+        entry_variables = np.repeat(variables, variable_instant_counts)
+        entry_instants = np.array(shift_instants, dtype=np.int64)[
+            instant_starts[self.__variable_shifts][entry_variables] +
+            np.arange(len(entry_variables)) -
+            Model.__exclusive_cumsum(variable_instant_counts)[entry_variables]
+        ]
+        entry_keys = self.__variable_students[entry_variables] * len(instants) + entry_instants
+
+        # Keep entries whose key has variables from more than one group
+        group_count = max(int(variable_groups.max(initial=0)) + 1, 1)
+        key_groups = Model.__unique(entry_keys * group_count + variable_groups[entry_variables])
+        keys = key_groups // group_count
+        overlapping_keys = Model.__unique(keys[1:][keys[1:] == keys[:-1]])
+
+        kept = np.isin(entry_keys, overlapping_keys)
+        return entry_variables[kept], entry_keys[kept], len(instants)
+
+    @staticmethod
+    def __unique(array: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        # Sorting is faster than the hash table used by np.unique for large integer arrays
+        result = np.sort(array)
+        if len(result) > 0:
+            result = result[np.concatenate(([True], result[1:] != result[:-1]))]
+
+        return result
+
+    @staticmethod
+    def __exclusive_cumsum(array: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        result = np.zeros(len(array), dtype=np.int64)
+        np.cumsum(array[:-1], out=result[1:])
+        return result
+
+    def decode(self, solution: npt.NDArray[np.float64]) -> Assignment:
+        '''
+        Converts a solution of the program to an assignment.
+
+        :param solution: Value of every variable of the program.
+
+        :raises ModelError: ``solution`` has the wrong number of variables, or the model was built
+                            with ``multiplicities`` (use :meth:`counts` instead).
+        '''
+
+        if self.__multiplicities is not None:
+            raise ModelError('Can\'t decode a model with multiplicities into an assignment')
+
+        counts = self.counts(solution)
+
+        assignment: Assignment = {student.number: {} for student in self.__students}
+        for variable in np.flatnonzero(counts):
+            student = self.__students[self.__variable_students[variable]]
+            course = self.__courses[self.__variable_courses[variable]]
+            shift = self.__shifts[self.__variable_shifts[variable]]
+            assignment[student.number].setdefault(course.name, []).append(shift.name)
+
+        return assignment
+
+    def counts(self, solution: npt.NDArray[np.float64]) -> npt.NDArray[np.int64]:
+        '''
+        Gets the number of students attributed to the shift of every non-slack variable, rounding
+        the values in a solution of the program.
+
+        :param solution: Value of every variable of the program.
+
+        :raises ModelError: ``solution`` has the wrong number of variables.
+        '''
+
+        if len(solution) != self.__constraints.shape[1]:
+            raise ModelError('Solution doesn\'t match the model\'s number of variables')
+
+        return np.rint(solution[:len(self.__variable_shifts)]).astype(np.int64)
+
+    def solve(self, time_limit: None | float = None, backend: None | Backend = None) -> Assignment:
+        '''
+        Solves the program and decodes the solution (:meth:`decode`).
+
+        :param time_limit: Maximum time to spend solving, in seconds. ``None`` means no limit.
+        :param backend:    Solver to use (see :mod:`~.solver.backends`). ``None`` means HiGHS
+                           (:func:`scipy.optimize.milp`).
+
+        :raises ModelError: The program is infeasible, no solution was found in time, or the
+                            model was built with ``multiplicities``.
+        '''
+
+        return self.decode(self.solve_values(time_limit, backend))
+
+    @traced('solve')
+    def solve_values(
+            self,
+            time_limit: None | float = None,
+            backend: None | Backend = None
+        ) -> npt.NDArray[np.float64]:
+        '''
+        Solves the program.
+
+        :param time_limit: Maximum time to spend solving, in seconds. ``None`` means no limit.
+        :param backend:    Solver to use (see :mod:`~.solver.backends`). ``None`` means HiGHS
+                           (:func:`scipy.optimize.milp`).
+
+        :raises ModelError: The program is infeasible, or no solution was found in time.
+        '''
+
+        # Imported here, as backends depend on this module
+        from .backends import HighsBackend, Program
+
+        if len(self.__objective) == 0:
+            return self.__objective
+
+        if backend is None:
+            backend = HighsBackend()
+
+        program = Program(
+            self.__objective,
+            self.variable_lower,
+            self.__variable_upper,
+            self.__constraints,
+            self.__constraint_lower,
+            self.__constraint_upper
+        )
+
+        solution, optimal = backend.solve(program, time_limit)
+        if not optimal:
+            count_event('suboptimal solutions')
+
+        return solution
+
+    @property
+    def students(self) -> Sequence[Student]:
+        '''Students in the program, indexed by :attr:`variable_students`.'''
+
+        return self.__students
+
+    @property
+    def courses(self) -> Sequence[Course]:
+        '''Courses in the program, indexed by :attr:`variable_courses`.'''
+
+        return self.__courses
+
+    @property
+    def shifts(self) -> Sequence[Shift]:
+        '''Shifts in the program, indexed by :attr:`variable_shifts`.'''
+
+        return self.__shifts
+
+    @property
+    def variable_students(self) -> npt.NDArray[np.int64]:
+        '''Index of the student of each binary variable (slack variables excluded).'''
+
+        return self.__variable_students
+
+    @property
+    def variable_courses(self) -> npt.NDArray[np.int64]:
+        '''Index of the course of each binary variable (slack variables excluded).'''
+
+        return self.__variable_courses
+
+    @property
+    def variable_shifts(self) -> npt.NDArray[np.int64]:
+        '''Index of the shift of each binary variable (slack variables excluded).'''
+
+        return self.__variable_shifts
+
+    @property
+    def objective(self) -> npt.NDArray[np.float64]:
+        '''Coefficients of every variable in the objective function.'''
+
+        return self.__objective
+
+    @property
+    def variable_lower(self) -> npt.NDArray[np.float64]:
+        '''Lower bound of every variable.'''
+
+        return np.zeros(len(self.__objective))
+
+    @property
+    def variable_upper(self) -> npt.NDArray[np.float64]:
+        '''Upper bound of every variable.'''
+
+        return self.__variable_upper
+
+    @property
+    def constraints(self) -> scipy.sparse.csr_array:
+        '''Sparse constraint matrix, with one row per constraint and one column per variable.'''
+
+        return self.__constraints
+
+    @property
+    def constraint_lower(self) -> npt.NDArray[np.float64]:
+        '''Lower bound of every constraint.'''
+
+        return self.__constraint_lower
+
+    @property
+    def constraint_upper(self) -> npt.NDArray[np.float64]:
+        '''Upper bound of every constraint.'''
+
+        return self.__constraint_upper
+
+    def __repr__(self) -> str:
+        rows, columns = self.__constraints.shape
+        return (
+            'Model('
+            f'variables={columns!r}, '
+            f'constraints={rows!r}, '
+            f'nonzeros={self.__constraints.nnz!r})'
+        )
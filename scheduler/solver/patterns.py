@@ -0,0 +1,377 @@
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse
+
+from ..tracing import count as count_event, traced
+from ..types.course import Course
+from ..types.shift import Shift, ShiftType
+from ..types.student import Student
+from .assignment import Assignment
+from .backends import Backend, HighsBackend, Program
+from .compression import group_students
+from .model import ModelError
+
+class PatternError(Exception):
+    '''Type of exception thrown by :func:`enumerate_patterns` and :class:`PatternCache`.'''
+    pass
+
+class ShiftPatterns:
+    '''
+    Every conflict-free shift combination (pattern) of a set of courses, as found by
+    :func:`enumerate_patterns`. Each pattern has one shift per group, in the order of
+    :attr:`groups`.
+
+    :param groups:   Course and shift type of each position of the patterns.
+    :param patterns: Shift combinations.
+    '''
+
+    __slots__ = ('__groups', '__patterns')
+
+    def __init__(
+            self,
+            groups: list[tuple[Course, ShiftType]],
+            patterns: list[tuple[Shift, ...]]
+        ) -> None:
+        self.__groups = groups
+        self.__patterns = patterns
+
+    @property
+    def groups(self) -> Sequence[tuple[Course, ShiftType]]:
+        '''
+        Course and shift type of each position of the patterns. Courses are sorted by name, and the
+        types of each course are in the order they first appear in :attr:`~.course.Course.shifts`.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__groups
+
+    @property
+    def patterns(self) -> Sequence[tuple[Shift, ...]]:
+        '''
+        Conflict-free shift combinations, with one shift per group.
+
+        See :ref:`this <encapsulation>` to learn how objects and collections are copied.
+        '''
+
+        return self.__patterns
+
+    def __len__(self) -> int:
+        return len(self.__patterns)
+
+    def __repr__(self) -> str:
+        return f'ShiftPatterns(groups={len(self.__groups)!r}, patterns={len(self.__patterns)!r})'
+
+def enumerate_patterns(courses: Iterable[Course], max_patterns: int = 100000) -> ShiftPatterns:
+    '''
+    Enumerates every way of choosing one shift of each :class:`~.shift.ShiftType` of each course
+    without overlaps (:meth:`~.shift.Shift.overlaps`), with backtracking. Groups with fewer shifts
+    are chosen first, and, after each choice, shifts that overlap with it are removed from the
+    groups still to be chosen, so that dead ends are found as soon as a group runs out of shifts.
+
+    :param courses:      Courses whose shifts are combined. Must have different names.
+    :param max_patterns: Maximum number of patterns, as their number grows exponentially with the
+                         number of courses.
+
+    :raises PatternError: There are more than ``max_patterns`` patterns.
+
+    >>> patterns = enumerate_patterns([lcom, cg])
+    >>> patterns.patterns
+    [(Shift(shift_type=ShiftType.T, number=1, ...), Shift(shift_type=ShiftType.PL, number=2, ...))]
+    '''
+
+    groups: list[tuple[Course, ShiftType]] = []
+    domains: list[list[Shift]] = []
+    for course in sorted(courses, key=lambda course: course.name):
+        course_groups: dict[ShiftType, list[Shift]] = {}
+        for shift in course.shifts.values():
+            course_groups.setdefault(shift.shift_type, []).append(shift)
+
+        for shift_type, shifts in course_groups.items():
+            groups.append((course, shift_type))
+            domains.append(shifts)
+
+    order = sorted(range(len(groups)), key=lambda i: len(domains[i]))
+    chosen: dict[int, Shift] = {}
+    patterns: list[tuple[Shift, ...]] = []
+
+    def search(depth: int, remaining: list[list[Shift]]) -> None:
+        if depth == len(order):
+            if len(patterns) >= max_patterns:
+                raise PatternError(f'More than {max_patterns!r} shift patterns')
+
+            patterns.append(tuple(chosen[i] for i in range(len(groups))))
+            return
+
+        for shift in remaining[0]:
+            pruned = [
+                [other for other in domain if not shift.overlaps(other)]
+                for domain in remaining[1:]
+            ]
+
+            if all(pruned):
+                chosen[order[depth]] = shift
+                search(depth + 1, pruned)
+
+    search(0, [domains[i] for i in order])
+    count_event('shift patterns', len(patterns))
+    return ShiftPatterns(groups, patterns)
+
+class PatternCache:
+    '''
+    Memoized :func:`enumerate_patterns`. Patterns are enumerated once per signature (the set of
+    courses, identified by object identity), so that students enrolled in the same courses share
+    the work.
+
+    :param max_patterns: See :func:`enumerate_patterns`.
+
+    >>> cache = PatternCache()
+    >>> cache.patterns(student1.courses.values()) is cache.patterns(student2.courses.values())
+    True
+    '''
+
+    __slots__ = ('__max_patterns', '__patterns')
+
+    def __init__(self, max_patterns: int = 100000) -> None:
+        self.__max_patterns = max_patterns
+        # Patterns are stored with their courses, so that ids in signatures are never reused, even
+        # for courses without shifts, that patterns don't reference
+        self.__patterns: dict[frozenset[int], tuple[list[Course], ShiftPatterns]] = {}
+
+    def patterns(self, courses: Iterable[Course]) -> ShiftPatterns:
+        '''
+        Gets the patterns of a set of courses, enumerating them if they aren't cached.
+
+        :param courses: Courses whose shifts are combined. Must have different names.
+
+        :raises PatternError: See :func:`enumerate_patterns`.
+        '''
+
+        course_list = list(courses)
+        signature = frozenset(id(course) for course in course_list)
+
+        entry = self.__patterns.get(signature)
+        if entry is None:
+            count_event('shift pattern cache misses')
+            entry = self.__patterns[signature] = \
+                (course_list, enumerate_patterns(course_list, self.__max_patterns))
+        else:
+            count_event('shift pattern cache hits')
+
+        return entry[1]
+
+    def __len__(self) -> int:
+        return len(self.__patterns)
+
+    def __repr__(self) -> str:
+        return f'PatternCache(signatures={len(self.__patterns)!r})'
+
+class PatternModel:
+    '''
+    Integer program that attributes shifts to students with pattern variables. Students enrolled
+    in the same courses are grouped (:func:`~.compression.group_students`), and there is one
+    integer variable per class of students and per conflict-free shift combination of the class's
+    courses (:class:`PatternCache`), that tells how many students of the class are given that
+    combination. The program is subject to the following constraints:
+
+    * The students of each class are given exactly as many combinations as there are students;
+    * The number of students in each shift does not exceed its :attr:`~.shift.Shift.capacity`.
+      Shifts of unknown capacity are not limited.
+
+    Overlaps are excluded by construction, so, unlike :class:`~.compression.CompressedModel`,
+    solutions can always be split into individual students. The linear relaxation is also tighter
+    than that of :class:`~.model.Model`. However, the number of variables grows with the number of
+    combinations, so this model is best suited to courses with few shifts each.
+
+    :param students: Students to attribute shifts to.
+    :param cache:    Cache of shift combinations, that can be shared between models.
+
+    :raises PatternError: A class of students has too many shift combinations.
+
+    >>> model = PatternModel(students)
+    >>> assignment = model.solve()
+    '''
+
+    __slots__ = ('__classes', '__class_patterns', '__variable_classes', '__variable_patterns',
+                 '__constraints', '__constraint_lower', '__constraint_upper')
+
+    @traced('model build')
+    def __init__(self, students: Iterable[Student], cache: None | PatternCache = None) -> None:
+        if cache is None:
+            cache = PatternCache()
+
+        self.__classes = group_students(students)
+        self.__class_patterns = [
+            cache.patterns(student_class[0].courses.values()) for student_class in self.__classes
+        ]
+
+        shift_ids: dict[int, int] = {}
+        shifts: list[Shift] = []
+        variable_classes: list[int] = []
+        variable_patterns: list[int] = []
+        entry_variables: list[int] = []
+        entry_shifts: list[int] = []
+
+        for class_id, patterns in enumerate(self.__class_patterns):
+            for pattern_id, pattern in enumerate(patterns.patterns):
+                variable = len(variable_classes)
+                variable_classes.append(class_id)
+                variable_patterns.append(pattern_id)
+
+                for shift in pattern:
+                    shift_id = shift_ids.get(id(shift))
+                    if shift_id is None:
+                        shift_id = shift_ids[id(shift)] = len(shifts)
+                        shifts.append(shift)
+
+                    entry_variables.append(variable)
+                    entry_shifts.append(shift_id)
+
+        self.__variable_classes = np.array(variable_classes, dtype=np.int64)
+        self.__variable_patterns = np.array(variable_patterns, dtype=np.int64)
+
+        # Capacity: one row per shift of known capacity
+        capacities = np.array(
+            [-1 if shift.capacity is None else shift.capacity for shift in shifts],
+            dtype=np.int64
+        )
+        limited_shifts = np.flatnonzero(capacities >= 0)
+        capacity_rows = np.full(len(shifts), -1, dtype=np.int64)
+        capacity_rows[limited_shifts] = np.arange(len(limited_shifts))
+
+        entry_rows = capacity_rows[np.array(entry_shifts, dtype=np.int64)]
+        limited_entries = entry_rows >= 0
+
+        # Rows: one per class of students, then one per limited shift
+        class_sizes = np.array([len(student_class) for student_class in self.__classes])
+        rows = np.concatenate((
+            self.__variable_classes,
+            len(self.__classes) + entry_rows[limited_entries]
+        ))
+        columns = np.concatenate((
+            np.arange(len(variable_classes)),
+            np.array(entry_variables, dtype=np.int64)[limited_entries]
+        ))
+
+        self.__constraints = scipy.sparse.csr_array(
+            (np.ones(len(rows)), (rows, columns)),
+            shape=(len(self.__classes) + len(limited_shifts), len(variable_classes))
+        )
+        self.__constraint_lower = np.concatenate(
+            (class_sizes, np.zeros(len(limited_shifts)))
+        ).astype(np.float64)
+        self.__constraint_upper = np.concatenate(
+            (class_sizes, capacities[limited_shifts])
+        ).astype(np.float64)
+
+        count_event('model variables', len(variable_classes))
+        count_event('model constraints', self.__constraints.shape[0])
+
+    def expand(self, solution: npt.NDArray[np.float64]) -> Assignment:
+        '''
+        Converts a solution of the program to an assignment of individual students.
+
+        :param solution: Value of every variable of the program.
+
+        :raises ModelError: ``solution`` has the wrong number of variables.
+        '''
+
+        if len(solution) != self.__constraints.shape[1]:
+            raise ModelError('Solution doesn\'t match the model\'s number of variables')
+
+        counts = np.rint(solution).astype(np.int64)
+        class_combinations: list[list[int]] = [[] for _ in self.__classes]
+        for variable in np.flatnonzero(counts):
+            class_combinations[self.__variable_classes[variable]].extend(
+                [int(self.__variable_patterns[variable])] * int(counts[variable])
+            )
+
+        assignment: Assignment = {}
+        for student_class, patterns, combinations in zip(
+            self.__classes,
+            self.__class_patterns,
+            class_combinations
+        ):
+            for student, pattern_id in zip(student_class, combinations):
+                shift_names: dict[str, list[str]] = {}
+                for (course, _), shift in zip(patterns.groups, patterns.patterns[pattern_id]):
+                    shift_names.setdefault(course.name, []).append(shift.name)
+
+                assignment[student.number] = shift_names
+
+        return assignment
+
+    @traced('solve')
+    def solve(self, time_limit: None | float = None, backend: None | Backend = None) -> Assignment:
+        '''
+        Solves the program and expands the solution (:meth:`expand`).
+
+        :param time_limit: Maximum time to spend solving, in seconds. ``None`` means no limit.
+        :param backend:    Solver to use (see :mod:`~.solver.backends`). ``None`` means HiGHS
+                           (:func:`scipy.optimize.milp`).
+
+        :raises ModelError: The program is infeasible, or no solution was found in time.
+        '''
+
+        if any(len(patterns) == 0 for patterns in self.__class_patterns):
+            raise ModelError('No conflict-free shift combination for a class of students')
+
+        variable_count = self.__constraints.shape[1]
+        if self.__constraints.shape[0] == 0:
+            return self.expand(np.zeros(variable_count))
+
+        if backend is None:
+            backend = HighsBackend()
+
+        program = Program(
+            np.zeros(variable_count),
+            np.zeros(variable_count),
+            np.full(variable_count, np.inf),
+            self.__constraints,
+            self.__constraint_lower,
+            self.__constraint_upper
+        )
+
+        solution, _ = backend.solve(program, time_limit)
+        return self.expand(solution)
+
+    @property
+    def classes(self) -> Sequence[Sequence[Student]]:
+        '''Classes of students, in the order of their constraints.'''
+
+        return self.__classes
+
+    @property
+    def class_patterns(self) -> Sequence[ShiftPatterns]:
+        '''Shift combinations of each class of students.'''
+
+        return self.__class_patterns
+
+    @property
+    def variable_classes(self) -> npt.NDArray[np.int64]:
+        '''Class of students (index into :attr:`classes`) of every variable.'''
+
+        return self.__variable_classes
+
+    @property
+    def variable_patterns(self) -> npt.NDArray[np.int64]:
+        '''Pattern (index into the patterns of the variable's class) of every variable.'''
+
+        return self.__variable_patterns
+
+    @property
+    def constraints(self) -> scipy.sparse.csr_array:
+        '''Constraint matrix, with one row per class of students and per limited shift.'''
+
+        return self.__constraints
+
+    def __repr__(self) -> str:
+        return (
+            'PatternModel('
+            f'classes={len(self.__classes)!r}, '
+            f'variables={self.__constraints.shape[1]!r}, '
+            f'constraints={self.__constraints.shape[0]!r})'
+        )
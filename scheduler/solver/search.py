@@ -0,0 +1,332 @@
+from __future__ import annotations
+from collections.abc import Iterable
+import random
+import time
+
+import numpy as np
+import numpy.typing as npt
+
+from ..index.conflicts import ShiftConflictIndex
+from ..tracing import traced
+from ..types.course import Course
+from ..types.student import Student
+from .assignment import Assignment
+
+class LocalSearchError(Exception):
+    '''Type of exception thrown by :class:`LocalSearch`.'''
+    pass
+
+class LocalSearch:
+    '''
+    Improves an existing assignment, reducing the number of pairs of overlapping shifts
+    (:meth:`~.shift.Shift.overlaps`) given to the same student, while respecting shift capacities
+    (:attr:`~.shift.Shift.capacity`). Each student keeps one shift of each type of each course.
+
+    Every iteration picks a student with overlapping shifts and tries, in order:
+
+    * Moving the student to another shift of the same course and type with free seats;
+    * Swapping shifts with another student of the same course and type;
+    * Large neighbourhood search: the student and other students sharing a course with them are
+      removed from their shifts and greedily reinserted in random order. The result is kept only if
+      it has no more overlaps than before.
+
+    Moves are evaluated incrementally, using the seats left in each shift and the overlaps between
+    the shifts of each student, obtained from a :class:`~.conflicts.ShiftConflictIndex`.
+
+    :param students:   Students in the assignment.
+    :param assignment: Assignment to improve. It isn't modified.
+    :param seed:       Seed of the random number generator, for reproducible searches.
+
+    :raises LocalSearchError: ``assignment`` is incomplete, refers to unknown courses or shifts, or
+                              exceeds the capacity of a shift.
+
+    >>> search = LocalSearch(students, solve_heuristic(students))
+    >>> search.run(time_limit=10.0)
+    >>> search.cost
+    0
+    >>> improved = search.assignment
+    '''
+
+    __slots__ = (
+        '__students',
+        '__courses',
+        '__index',
+        '__random',
+        '__group_shifts',
+        '__group_courses',
+        '__student_slots',
+        '__chosen',
+        '__shift_students',
+        '__remaining',
+        '__costs',
+        '__conflicted',
+        '__conflicted_positions'
+    )
+
+    def __init__(self, students: Iterable[Student], assignment: Assignment, seed: int = 0) -> None:
+        self.__students = list(students)
+        self.__random = random.Random(seed)
+
+        course_ids: dict[int, int] = {}
+        self.__courses: list[Course] = []
+        for student in self.__students:
+            for course in student.courses.values():
+                if id(course) not in course_ids:
+                    course_ids[id(course)] = len(self.__courses)
+                    self.__courses.append(course)
+
+        self.__index = ShiftConflictIndex(self.__courses)
+
+        # Type groups of every course, as global group identifiers and their shifts
+        self.__group_shifts: list[npt.NDArray[np.int64]] = []
+        self.__group_courses: list[Course] = []
+        course_groups: list[dict[str, int]] = []
+        for course in self.__courses:
+            groups: dict[str, list[int]] = {}
+            for shift in course.shifts.values():
+                groups.setdefault(shift.shift_type, []).append(self.__index.id_of(shift))
+
+            course_groups.append({})
+            for shift_type, ids in groups.items():
+                course_groups[-1][shift_type] = len(self.__group_shifts)
+                self.__group_shifts.append(np.array(ids, dtype=np.int64))
+                self.__group_courses.append(course)
+
+        # Slots (groups) of every student, and the shift chosen for each of them
+        self.__student_slots: list[list[int]] = []
+        self.__chosen: list[list[int]] = []
+        self.__shift_students: list[set[int]] = [set() for _ in range(len(self.__index))]
+        occupation = np.zeros(len(self.__index))
+
+        for student_id, student in enumerate(self.__students):
+            slots: dict[int, int] = {}
+            student_assignment = assignment.get(student.number, {})
+
+            for course_name, shift_names in student_assignment.items():
+                enrolled_course = student.courses.get(course_name)
+                if enrolled_course is None:
+                    raise LocalSearchError(f'Unknown course in assignment: {course_name!r}')
+
+                for shift_name in shift_names:
+                    assigned_shift = enrolled_course.shifts.get(shift_name)
+                    if assigned_shift is None:
+                        raise LocalSearchError(f'Unknown shift in assignment: {shift_name!r}')
+
+                    course_id = course_ids[id(enrolled_course)]
+                    group = course_groups[course_id][assigned_shift.shift_type]
+                    if group in slots:
+                        raise LocalSearchError(
+                            f'Repeated shift type for student {student.number!r}: {shift_name!r}'
+                        )
+
+                    shift_id = self.__index.id_of(assigned_shift)
+                    slots[group] = shift_id
+                    self.__shift_students[shift_id].add(student_id)
+                    occupation[shift_id] += 1
+
+            expected = sum(len(course_groups[course_ids[id(c)]]) for c in student.courses.values())
+            if len(slots) != expected:
+                raise LocalSearchError(f'Incomplete assignment for student {student.number!r}')
+
+            self.__student_slots.append(list(slots))
+            self.__chosen.append(list(slots.values()))
+
+        capacities = np.array(
+            [np.inf if shift.capacity is None else shift.capacity for shift in self.__index.shifts],
+            dtype=np.float64
+        )
+        self.__remaining = capacities - occupation
+        if np.any(self.__remaining < 0):
+            raise LocalSearchError('Assignment exceeds the capacity of a shift')
+
+        self.__costs = [self.__student_cost(i) for i in range(len(self.__students))]
+
+        # Students with overlapping shifts, and their positions in that list, updated on every move
+        self.__conflicted = [i for i, cost in enumerate(self.__costs) if cost > 0]
+        self.__conflicted_positions = {student: i for i, student in enumerate(self.__conflicted)}
+
+    @traced('solve')
+    def run(
+            self,
+            iterations: None | int = 1000,
+            time_limit: None | float = None,
+            neighbourhood: int = 8
+        ) -> None:
+        '''
+        Runs the search, until there are no overlaps left or a limit is reached.
+
+        :param iterations:    Maximum number of iterations. ``None`` means no limit.
+        :param time_limit:    Maximum time to spend searching, in seconds. ``None`` means no
+                              limit.
+        :param neighbourhood: Number of students removed and reinserted in each large
+                              neighbourhood search step.
+        '''
+
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        iteration = 0
+
+        while iterations is None or iteration < iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            if not self.__conflicted:
+                break
+
+            student = self.__random.choice(self.__conflicted)
+            if not self.__move(student) and not self.__swap(student):
+                self.__destroy_and_repair(student, neighbourhood)
+
+            iteration += 1
+
+    @property
+    def cost(self) -> int:
+        '''Number of pairs of overlapping shifts given to the same student, in all students.'''
+
+        return sum(self.__costs)
+
+    @property
+    def assignment(self) -> Assignment:
+        '''Current assignment. A new object is created on every access.'''
+
+        assignment: Assignment = {}
+        for student, slots, chosen in zip(self.__students, self.__student_slots, self.__chosen):
+            student_assignment: dict[str, list[str]] = {}
+            for group, shift_id in zip(slots, chosen):
+                course_name = self.__group_courses[group].name
+                shift_name = self.__index.shifts[shift_id].name
+                student_assignment.setdefault(course_name, []).append(shift_name)
+
+            assignment[student.number] = student_assignment
+
+        return assignment
+
+    def __set_cost(self, student: int, cost: int) -> None:
+        self.__costs[student] = cost
+
+        position = self.__conflicted_positions.get(student)
+        if cost > 0 and position is None:
+            self.__conflicted_positions[student] = len(self.__conflicted)
+            self.__conflicted.append(student)
+        elif cost == 0 and position is not None:
+            # Replace the student with the last one, instead of shifting the whole list
+            last = self.__conflicted.pop()
+            if last != student:
+                self.__conflicted[position] = last
+                self.__conflicted_positions[last] = position
+            del self.__conflicted_positions[student]
+
+    def __student_cost(self, student: int) -> int:
+        chosen = np.array(self.__chosen[student], dtype=np.int64)
+        submatrix = self.__index.matrix[np.ix_(chosen, chosen)]
+        return (int(submatrix.sum()) - int(np.trace(submatrix))) // 2
+
+    def __overlaps(self, student: int, slot: int, shift: int) -> int:
+        # Overlaps between a shift and the shifts of every other slot of a student
+        chosen = self.__chosen[student]
+        others = chosen[:slot] + chosen[slot + 1:]
+        return int(self.__index.matrix[shift, others].sum())
+
+    def __assign(self, student: int, slot: int, shift: int) -> None:
+        old = self.__chosen[student][slot]
+        self.__shift_students[old].discard(student)
+        self.__remaining[old] += 1
+
+        self.__chosen[student][slot] = shift
+        self.__shift_students[shift].add(student)
+        self.__remaining[shift] -= 1
+
+    def __move(self, student: int) -> bool:
+        for slot, group in enumerate(self.__student_slots[student]):
+            current = self.__chosen[student][slot]
+            current_overlaps = self.__overlaps(student, slot, current)
+            if current_overlaps == 0:
+                continue
+
+            for shift in self.__group_shifts[group]:
+                if shift != current and self.__remaining[shift] > 0:
+                    delta = self.__overlaps(student, slot, int(shift)) - current_overlaps
+                    if delta < 0:
+                        self.__assign(student, slot, int(shift))
+                        self.__set_cost(student, self.__costs[student] + delta)
+                        return True
+
+        return False
+
+    def __swap(self, student: int) -> bool:
+        for slot, group in enumerate(self.__student_slots[student]):
+            current = self.__chosen[student][slot]
+            current_overlaps = self.__overlaps(student, slot, current)
+            if current_overlaps == 0:
+                continue
+
+            for shift in map(int, self.__group_shifts[group]):
+                if shift == current:
+                    continue
+
+                student_delta = self.__overlaps(student, slot, shift) - current_overlaps
+                if student_delta >= 0:
+                    continue
+
+                for other in self.__shift_students[shift]:
+                    other_slot = self.__chosen[other].index(shift)
+                    other_delta = (
+                        self.__overlaps(other, other_slot, current) -
+                        self.__overlaps(other, other_slot, shift)
+                    )
+
+                    if student_delta + other_delta < 0:
+                        self.__assign(student, slot, shift)
+                        self.__assign(other, other_slot, current)
+                        self.__set_cost(student, self.__costs[student] + student_delta)
+                        self.__set_cost(other, self.__costs[other] + other_delta)
+                        return True
+
+        return False
+
+    def __destroy_and_repair(self, student: int, neighbourhood: int) -> None:
+        # Neighbourhood: the student and others sharing shifts of the same type groups
+        candidates = {
+            other
+            for shift in self.__chosen[student]
+            for other in self.__shift_students[shift]
+            if other != student
+        }
+        sample = self.__random.sample(sorted(candidates), min(len(candidates), neighbourhood - 1))
+        removed = [student] + sample
+
+        saved = {i: list(self.__chosen[i]) for i in removed}
+        old_cost = sum(self.__costs[i] for i in removed)
+
+        for i in removed:
+            for shift in self.__chosen[i]:
+                self.__shift_students[shift].discard(i)
+                self.__remaining[shift] += 1
+
+        self.__random.shuffle(removed)
+        for i in removed:
+            chosen = self.__chosen[i]
+            for slot, group in enumerate(self.__student_slots[i]):
+                shifts = self.__group_shifts[group]
+                free = shifts[self.__remaining[shifts] > 0]
+                previous = np.array(chosen[:slot], dtype=np.int64)
+                overlaps = self.__index.matrix[np.ix_(free, previous)].sum(axis=1)
+                best = int(free[np.argmin(overlaps)])
+
+                chosen[slot] = best
+                self.__shift_students[best].add(i)
+                self.__remaining[best] -= 1
+
+        new_costs = [self.__student_cost(i) for i in removed]
+        if sum(new_costs) <= old_cost:
+            for i, cost in zip(removed, new_costs):
+                self.__set_cost(i, cost)
+        else:
+            for i, chosen in saved.items():
+                for shift in self.__chosen[i]:
+                    self.__shift_students[shift].discard(i)
+                    self.__remaining[shift] += 1
+
+                self.__chosen[i] = chosen
+                for shift in chosen:
+                    self.__shift_students[shift].add(i)
+                    self.__remaining[shift] -= 1
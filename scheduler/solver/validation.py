@@ -0,0 +1,293 @@
+from __future__ import annotations
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from ..index.conflicts import ShiftConflictIndex
+from ..tracing import traced
+from ..types.course import Course
+from ..types.shift import SHIFT_TYPE_INDICES, SHIFT_TYPES, ShiftType
+from ..types.student import Student
+from ..types.timeslot import Timeslot
+from .assignment import Assignment
+
+# Minutes in a week, used to keep timeslots of different rooms apart when sorting
+_WEEK_MINUTES = 7 * 24 * 60
+
+class ValidationReport:
+    '''
+    Constraint violations found by :func:`validate` in an assignment. Shifts are identified by the
+    names of their course and their own name.
+
+    :param unknown:       Entries that refer to courses the student isn't enrolled in, or to shifts
+                          that don't exist, as ``(student, course, shift)`` name tuples.
+    :param missing:       Course shift types without a shift, as ``(student, course, type)``.
+    :param repeated:      Course shift types with more than one shift, as
+                          ``(student, course, type)``.
+    :param overlaps:      Pairs of overlapping shifts of the same student, as
+                          ``(student, (course, shift), (course, shift))``.
+    :param over_capacity: Shifts with more students than their capacity, as
+                          ``(course, shift, students, capacity)``.
+    :param double_booked: Pairs of overlapping timeslots of attributed shifts in the same room, as
+                          ``(room, timeslot, timeslot)``.
+    '''
+
+    __slots__ = (
+        '__unknown',
+        '__missing',
+        '__repeated',
+        '__overlaps',
+        '__over_capacity',
+        '__double_booked'
+    )
+
+    def __init__(
+            self,
+            unknown: list[tuple[str, str, str]],
+            missing: list[tuple[str, str, ShiftType]],
+            repeated: list[tuple[str, str, ShiftType]],
+            overlaps: list[tuple[str, tuple[str, str], tuple[str, str]]],
+            over_capacity: list[tuple[str, str, int, int]],
+            double_booked: list[tuple[str, Timeslot, Timeslot]]
+        ) -> None:
+
+        self.__unknown = unknown
+        self.__missing = missing
+        self.__repeated = repeated
+        self.__overlaps = overlaps
+        self.__over_capacity = over_capacity
+        self.__double_booked = double_booked
+
+    @property
+    def unknown(self) -> Sequence[tuple[str, str, str]]:
+        '''Entries that refer to unknown courses or shifts, as ``(student, course, shift)``.'''
+
+        return self.__unknown
+
+    @property
+    def missing(self) -> Sequence[tuple[str, str, ShiftType]]:
+        '''Course shift types without a shift, as ``(student, course, type)``.'''
+
+        return self.__missing
+
+    @property
+    def repeated(self) -> Sequence[tuple[str, str, ShiftType]]:
+        '''Course shift types with more than one shift, as ``(student, course, type)``.'''
+
+        return self.__repeated
+
+    @property
+    def overlaps(self) -> Sequence[tuple[str, tuple[str, str], tuple[str, str]]]:
+        '''
+        Overlapping shifts of the same student, as ``(student, (course, shift), (course, shift))``.
+        '''
+
+        return self.__overlaps
+
+    @property
+    def over_capacity(self) -> Sequence[tuple[str, str, int, int]]:
+        '''Shifts over their capacity, as ``(course, shift, students, capacity)``.'''
+
+        return self.__over_capacity
+
+    @property
+    def double_booked(self) -> Sequence[tuple[str, Timeslot, Timeslot]]:
+        '''Overlapping timeslots in the same room, as ``(room, timeslot, timeslot)``.'''
+
+        return self.__double_booked
+
+    @property
+    def valid(self) -> bool:
+        '''Whether no constraint violations were found.'''
+
+        return not (
+            self.__unknown or
+            self.__missing or
+            self.__repeated or
+            self.__overlaps or
+            self.__over_capacity or
+            self.__double_booked
+        )
+
+    def __repr__(self) -> str:
+        return (
+            'ValidationReport('
+            f'unknown={self.__unknown!r}, '
+            f'missing={self.__missing!r}, '
+            f'repeated={self.__repeated!r}, '
+            f'overlaps={self.__overlaps!r}, '
+            f'over_capacity={self.__over_capacity!r}, '
+            f'double_booked={self.__double_booked!r})'
+        )
+
+def _ordered_pairs(
+        ends: npt.NDArray[np.int64]
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+
+    # Pairs (i, j) for every element i and every j in [i + 1, ends[i])
+    counts = np.maximum(ends - np.arange(len(ends)) - 1, 0)
+    first = np.repeat(np.arange(len(ends)), counts)
+
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    second = first + 1 + np.arange(len(first)) - offsets[first]
+    return first, second
+
+@traced('validate')
+def validate(students: Iterable[Student], assignment: Assignment) -> ValidationReport:
+    '''
+    Checks every constraint of an assignment, with vectorized operations over all of its entries:
+
+    * Each student has one shift of each :class:`~.shift.ShiftType` of each course they are
+      enrolled in, and no shifts of other courses;
+    * No student has overlapping shifts (:meth:`~.shift.Shift.overlaps`);
+    * No shift has more students than its :attr:`~.shift.Shift.capacity`;
+    * No room is used by two overlapping timeslots of shifts that have students.
+
+    :param students:   Students in the assignment. Students missing from ``assignment`` are
+                       considered to have no shifts.
+    :param assignment: Assignment to validate.
+
+    >>> validate(students, assignment).valid
+    True
+    '''
+
+    student_list = list(students)
+
+    courses: list[Course] = []
+    course_ids: dict[int, int] = {}
+    for student in student_list:
+        for course in student.courses.values():
+            if id(course) not in course_ids:
+                course_ids[id(course)] = len(courses)
+                courses.append(course)
+
+    index = ShiftConflictIndex(courses)
+    shift_courses = np.zeros(len(index), dtype=np.int64)
+    for course_id, course in enumerate(courses):
+        for shift in course.shifts.values():
+            shift_courses[index.id_of(shift)] = course_id
+
+    # Type groups of every course
+    course_types = [
+        sorted({SHIFT_TYPE_INDICES[shift.shift_type] for shift in course.shifts.values()})
+        for course in courses
+    ]
+
+    # Resolve entries of the assignment to (student, shift) pairs
+    unknown: list[tuple[str, str, str]] = []
+    entry_students: list[int] = []
+    entry_shifts: list[int] = []
+    for student_id, student in enumerate(student_list):
+        for course_name, shift_names in assignment.get(student.number, {}).items():
+            enrolled_course = student.courses.get(course_name)
+            for shift_name in shift_names:
+                assigned_shift = (
+                    None if enrolled_course is None else enrolled_course.shifts.get(shift_name)
+                )
+
+                if assigned_shift is None:
+                    unknown.append((student.number, course_name, shift_name))
+                else:
+                    entry_students.append(student_id)
+                    entry_shifts.append(index.id_of(assigned_shift))
+
+    students_array = np.array(entry_students, dtype=np.int64)
+    shifts_array = np.array(entry_shifts, dtype=np.int64)
+    shift_type_ids = np.array(
+        [SHIFT_TYPE_INDICES[shift.shift_type] for shift in index.shifts],
+        dtype=np.int64
+    )
+
+    # One shift per type: count entries per (student, course, type) key
+    type_count = len(SHIFT_TYPES)
+    course_count = max(len(courses), 1)
+    entry_keys = (
+        (students_array * course_count + shift_courses[shifts_array]) * type_count +
+        shift_type_ids[shifts_array]
+    )
+    keys, key_counts = np.unique(entry_keys, return_counts=True)
+
+    expected = np.array(
+        [
+            (student_id * course_count + course_ids[id(course)]) * type_count + shift_type
+            for student_id, student in enumerate(student_list)
+            for course in student.courses.values()
+            for shift_type in course_types[course_ids[id(course)]]
+        ],
+        dtype=np.int64
+    )
+
+    def describe_key(key: int) -> tuple[str, str, ShiftType]:
+        student_course, shift_type = divmod(int(key), type_count)
+        student_id, course_id = divmod(student_course, course_count)
+        return student_list[student_id].number, courses[course_id].name, SHIFT_TYPES[shift_type]
+
+    missing = [describe_key(key) for key in expected[~np.isin(expected, keys)]]
+    repeated = [describe_key(key) for key in keys[key_counts > 1]]
+
+    # Overlaps: all pairs of entries of the same student, looked up in the conflict matrix
+    order = np.argsort(students_array, kind='stable')
+    sorted_students = students_array[order]
+    sorted_shifts = shifts_array[order]
+    student_ends = np.searchsorted(sorted_students, sorted_students, side='right')
+
+    first, second = _ordered_pairs(student_ends)
+    overlapping = index.matrix[sorted_shifts[first], sorted_shifts[second]]
+
+    def describe_shift(shift_id: int) -> tuple[str, str]:
+        return courses[int(shift_courses[shift_id])].name, index.shifts[shift_id].name
+
+    overlaps = [
+        (
+            student_list[int(sorted_students[i])].number,
+            describe_shift(int(sorted_shifts[i])),
+            describe_shift(int(sorted_shifts[j]))
+        )
+        for i, j in zip(first[overlapping], second[overlapping])
+    ]
+
+    # Capacity
+    occupation = np.bincount(shifts_array, minlength=len(index))
+    capacities = np.array(
+        [-1 if shift.capacity is None else shift.capacity for shift in index.shifts],
+        dtype=np.int64
+    )
+    over_capacity = [
+        (*describe_shift(int(shift_id)), int(occupation[shift_id]), int(capacities[shift_id]))
+        for shift_id in np.flatnonzero((capacities >= 0) & (occupation > capacities))
+    ]
+
+    # Rooms: timeslots of used shifts sorted by room and time, paired with later overlapping ones
+    timeslots: list[Timeslot] = []
+    timeslot_shifts: list[int] = []
+    room_ids: dict[str, int] = {}
+    for shift_id in np.flatnonzero(occupation):
+        for timeslot in index.shifts[int(shift_id)].timeslots:
+            timeslots.append(timeslot)
+            timeslot_shifts.append(int(shift_id))
+            room_ids.setdefault(timeslot.room.name, len(room_ids))
+
+    timeslot_rooms = np.array([room_ids[t.room.name] for t in timeslots], dtype=np.int64)
+    starts = timeslot_rooms * _WEEK_MINUTES + np.array(
+        [t.start_minute for t in timeslots],
+        dtype=np.int64
+    )
+    ends = timeslot_rooms * _WEEK_MINUTES + np.array(
+        [t.end_minute for t in timeslots],
+        dtype=np.int64
+    )
+
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+    first, second = _ordered_pairs(np.searchsorted(starts, ends, side='left'))
+    timeslot_shifts_array = np.array(timeslot_shifts, dtype=np.int64)[order]
+    distinct = timeslot_shifts_array[first] != timeslot_shifts_array[second]
+
+    double_booked = [
+        (timeslots[order[i]].room.name, timeslots[order[i]], timeslots[order[j]])
+        for i, j in zip(first[distinct], second[distinct])
+    ]
+
+    return ValidationReport(unknown, missing, repeated, overlaps, over_capacity, double_booked)
@@ -0,0 +1,385 @@
+'''
+Tracing
+~~~~~~~
+
+Instrumentation of the scheduler's phases (loading, index building, model building, feasibility
+checking, solving, validation and exporting). Code marks phases with :func:`span` (or
+:func:`traced`, for whole functions) and counts events with :func:`count`. These do nothing until a
+:class:`Tracer` is installed with :func:`set_tracer`, so instrumentation costs a single function
+call when tracing is disabled.
+
+>>> tracer = Tracer()
+>>> set_tracer(tracer)
+>>> with span('load'):
+...     count('rows', 1000)
+>>> set_tracer(None)
+>>> tracer.spans
+[Span(name='load', ...)]
+>>> tracer.counters
+{'rows': 1000}
+
+Tracing only covers the current process, so work done in worker processes (for example, by
+:func:`~scheduler.solver.decomposition.solve_components`) is only seen as the span around it.
+'''
+
+from __future__ import annotations
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any, ParamSpec, TypeVar
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+class TracerError(Exception):
+    '''Type of exception thrown by :class:`Tracer`.'''
+    pass
+
+class Span:
+    '''
+    A traced phase, recorded by :func:`span`.
+
+    :param name:        Name of the phase.
+    :param depth:       Number of spans the phase is nested in.
+    :param start:       Time the phase started at, in seconds since the tracer was created.
+    :param wall_time:   Wall time the phase took, in seconds.
+    :param cpu_time:    CPU time of the process during the phase, in seconds.
+    :param peak_memory: Peak memory allocated during the phase, in bytes, or ``None`` if the tracer
+                        isn't tracing memory.
+    '''
+
+    __slots__ = ('__name', '__depth', '__start', '__wall_time', '__cpu_time', '__peak_memory')
+
+    def __init__(
+            self,
+            name: str,
+            depth: int,
+            start: float,
+            wall_time: float,
+            cpu_time: float,
+            peak_memory: None | int
+        ) -> None:
+
+        self.__name = name
+        self.__depth = depth
+        self.__start = start
+        self.__wall_time = wall_time
+        self.__cpu_time = cpu_time
+        self.__peak_memory = peak_memory
+
+    @property
+    def name(self) -> str:
+        '''Name of the phase.'''
+
+        return self.__name
+
+    @property
+    def depth(self) -> int:
+        '''Number of spans the phase is nested in.'''
+
+        return self.__depth
+
+    @property
+    def start(self) -> float:
+        '''Time the phase started at, in seconds since the tracer was created.'''
+
+        return self.__start
+
+    @property
+    def wall_time(self) -> float:
+        '''Wall time the phase took, in seconds.'''
+
+        return self.__wall_time
+
+    @property
+    def cpu_time(self) -> float:
+        '''CPU time of the process during the phase, in seconds.'''
+
+        return self.__cpu_time
+
+    @property
+    def peak_memory(self) -> None | int:
+        '''
+        Peak memory allocated during the phase, in bytes, as measured by :mod:`tracemalloc`. It is
+        ``None`` if the tracer isn't tracing memory.
+        '''
+
+        return self.__peak_memory
+
+    def to_dict(self) -> dict[str, Any]:
+        '''Converts the span to a JSON-serializable dictionary.'''
+
+        return {
+            'name': self.__name,
+            'depth': self.__depth,
+            'start': self.__start,
+            'wall_time': self.__wall_time,
+            'cpu_time': self.__cpu_time,
+            'peak_memory': self.__peak_memory
+        }
+
+    def __repr__(self) -> str:
+        return (
+            'Span('
+            f'name={self.__name!r}, '
+            f'depth={self.__depth!r}, '
+            f'start={self.__start!r}, '
+            f'wall_time={self.__wall_time!r}, '
+            f'cpu_time={self.__cpu_time!r}, '
+            f'peak_memory={self.__peak_memory!r})'
+        )
+
+class Tracer:
+    '''
+    Collects the spans and counters of a run. Install it with :func:`set_tracer`.
+
+    :param memory: Whether to measure the peak memory of each span with :mod:`tracemalloc`. This
+                   slows down the program considerably, so it is disabled by default.
+    '''
+
+    __slots__ = (
+        '__memory',
+        '__origin',
+        '__spans',
+        '__counters',
+        '__counter_events',
+        '__depth',
+        '__peaks',
+        '__started_tracemalloc',
+        '__lock'
+    )
+
+    def __init__(self, memory: bool = False) -> None:
+        self.__memory = memory
+        self.__origin = time.perf_counter()
+        self.__spans: list[Span] = []
+        self.__counters: dict[str, float] = {}
+        self.__counter_events: list[tuple[float, str, float]] = []
+        self.__depth = 0
+
+        # Peak memory of each open span, updated when nested spans are opened and closed, as
+        # tracemalloc only keeps a single peak
+        self.__peaks: list[int] = []
+        self.__started_tracemalloc = False
+        self.__lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        '''
+        Context manager that records a :class:`Span` around its body. Prefer the module-level
+        :func:`span`, that does nothing when tracing is disabled.
+
+        :param name: Name of the phase.
+        '''
+
+        if self.__memory:
+            self.__push_peak()
+
+        depth = self.__depth
+        self.__depth += 1
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+
+        try:
+            yield
+        finally:
+            cpu_time = time.process_time() - start_cpu
+            wall_time = time.perf_counter() - start_wall
+            self.__depth -= 1
+            peak_memory = self.__pop_peak() if self.__memory else None
+
+            with self.__lock:
+                self.__spans.append(Span(
+                    name,
+                    depth,
+                    start_wall - self.__origin,
+                    wall_time,
+                    cpu_time,
+                    peak_memory
+                ))
+
+    def count(self, name: str, value: float = 1) -> None:
+        '''
+        Adds a value to a counter. Prefer the module-level :func:`count`, that does nothing when
+        tracing is disabled.
+
+        :param name:  Name of the counter.
+        :param value: Value to add to the counter.
+        '''
+
+        with self.__lock:
+            total = self.__counters[name] = self.__counters.get(name, 0) + value
+            self.__counter_events.append((time.perf_counter() - self.__origin, name, total))
+
+    @property
+    def spans(self) -> Sequence[Span]:
+        '''Spans recorded so far, in the order they ended.'''
+
+        return self.__spans
+
+    @property
+    def counters(self) -> Mapping[str, float]:
+        '''Current value of every counter.'''
+
+        return self.__counters
+
+    def to_json(self) -> dict[str, Any]:
+        '''
+        Converts the trace to a JSON-serializable dictionary, with a list of spans, sorted by their
+        starting time, and the final values of the counters.
+        '''
+
+        return {
+            'spans': [s.to_dict() for s in sorted(self.__spans, key=lambda s: s.start)],
+            'counters': dict(self.__counters)
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        '''
+        Converts the trace to the Chrome trace event format, that can be opened in
+        ``chrome://tracing`` or in `Perfetto <https://ui.perfetto.dev>`_. Spans become complete
+        events and counters become counter events.
+        '''
+
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {
+                'name': s.name,
+                'ph': 'X',
+                'ts': s.start * 1e6,
+                'dur': s.wall_time * 1e6,
+                'pid': pid,
+                'tid': 0,
+                'args': {'cpu_time': s.cpu_time, 'peak_memory': s.peak_memory}
+            }
+            for s in self.__spans
+        ]
+        events.extend(
+            {'name': name, 'ph': 'C', 'ts': timestamp * 1e6, 'pid': pid, 'args': {name: total}}
+            for timestamp, name, total in self.__counter_events
+        )
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path: str | os.PathLike[str], trace_format: str = 'json') -> None:
+        '''
+        Writes the trace to a file.
+
+        :param path:         Path to the file to write.
+        :param trace_format: ``'json'`` (:meth:`to_json`) or ``'chrome'`` (:meth:`to_chrome_trace`).
+
+        :raises TracerError: Unknown trace format.
+        :raises OSError:     Failed to write the file.
+        '''
+
+        if trace_format == 'json':
+            trace = self.to_json()
+        elif trace_format == 'chrome':
+            trace = self.to_chrome_trace()
+        else:
+            raise TracerError(f'Unknown trace format: {trace_format!r}')
+
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(trace, file, indent=4)
+
+    def __push_peak(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracemalloc = True
+
+        _, peak = tracemalloc.get_traced_memory()
+        if self.__peaks:
+            self.__peaks[-1] = max(self.__peaks[-1], peak)
+
+        tracemalloc.reset_peak()
+        self.__peaks.append(tracemalloc.get_traced_memory()[0])
+
+    def __pop_peak(self) -> int:
+        _, peak = tracemalloc.get_traced_memory()
+        span_peak = max(self.__peaks.pop(), peak)
+        if self.__peaks:
+            self.__peaks[-1] = max(self.__peaks[-1], span_peak)
+            tracemalloc.reset_peak()
+        elif self.__started_tracemalloc:
+            tracemalloc.stop()
+            self.__started_tracemalloc = False
+
+        return span_peak
+
+    def __repr__(self) -> str:
+        return f'Tracer(spans={len(self.__spans)!r}, counters={self.__counters!r})'
+
+_tracer: None | Tracer = None
+_null_span = contextlib.nullcontext()
+
+def set_tracer(tracer: None | Tracer) -> None:
+    '''
+    Installs a tracer, that will record all following spans and counters.
+
+    :param tracer: Tracer to install, or ``None`` to disable tracing.
+    '''
+
+    global _tracer
+    _tracer = tracer
+
+def get_tracer() -> None | Tracer:
+    '''Gets the installed tracer, or ``None`` if tracing is disabled.'''
+
+    return _tracer
+
+def span(name: str) -> contextlib.AbstractContextManager[None]:
+    '''
+    Context manager that records a phase of the program in the installed tracer (see
+    :meth:`Tracer.span`). Does nothing when tracing is disabled.
+
+    :param name: Name of the phase.
+
+    >>> with span('solve'):
+    ...     model.solve()
+    '''
+
+    if _tracer is None:
+        return _null_span
+
+    return _tracer.span(name)
+
+def traced(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    '''
+    Decorator that records every call to a function as a phase of the program (see :func:`span`).
+
+    :param name: Name of the phase.
+
+    >>> @traced('validate')
+    ... def validate(students, assignment):
+    ...     ...
+    '''
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _tracer is None:
+                return function(*args, **kwargs)
+
+            with _tracer.span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+def count(name: str, value: float = 1) -> None:
+    '''
+    Adds a value to a counter of the installed tracer (see :meth:`Tracer.count`). Does nothing
+    when tracing is disabled.
+
+    :param name:  Name of the counter.
+    :param value: Value to add to the counter.
+    '''
+
+    if _tracer is not None:
+        _tracer.count(name, value)
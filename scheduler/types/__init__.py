@@ -78,13 +78,17 @@ import sys
 
 from .course import Course, CourseError
 from .room import Room, RoomError
-from .shift import Shift, ShiftError, ShiftType
+from .shift import SHIFT_TYPE_INDICES, SHIFT_TYPES, Shift, ShiftError, ShiftType
 from .student import Student, StudentError
 from .timeslot import Timeslot, TimeslotError
-from .weekday import Weekday
+from .weekday import WEEKDAY_INDICES, WEEKDAYS, Weekday
 
 if 'sphinx' not in sys.modules: # pragma: no cover
     __all__ = [
+        'SHIFT_TYPES',
+        'SHIFT_TYPE_INDICES',
+        'WEEKDAYS',
+        'WEEKDAY_INDICES',
         'Course',
         'CourseError',
         'Room',
@@ -1,9 +1,14 @@
 from __future__ import annotations
 from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 import copy
+import weakref
 
 from .shift import Shift
 
+if TYPE_CHECKING:
+    from ..index.inverted import InvertedIndex
+
 class CourseError(Exception):
     '''Type of exception thrown by :class:`Course`.'''
     pass
@@ -23,10 +28,18 @@ class Course:
     See :ref:`this <encapsulation>` to learn how objects and collections are copied.
     '''
 
+    __slots__ = ('__name', '__shifts', '__fingerprint', '__observers')
+
     def __init__(self, name: str, shifts: None | list[Shift] = None) -> None:
         self.__name = name
         self.__shifts: dict[str, Shift] = {}
 
+        # Hash of all compared attributes, only computed for frozen courses (see freeze)
+        self.__fingerprint: None | int = None
+
+        # Indexes notified of new shifts, only created when the course is indexed
+        self.__observers: None | weakref.WeakSet[InvertedIndex] = None
+
         if shifts:
             for shift in shifts:
                 self.add_shift(shift)
@@ -38,7 +51,7 @@ class Course:
         :param shift: Shift to be added to the course.
 
         :raises CourseError: The course already has a shift with the same
-                             :attr:`~.shift.Shift.name`.
+                             :attr:`~.shift.Shift.name`, or the course is frozen.
 
         >>> course = Course('Computer Graphics')
         >>> course.add_shift(Shift(ShiftType.PL, 1))
@@ -48,11 +61,71 @@ class Course:
         See :ref:`this <encapsulation>` to learn how objects and collections are copied.
         '''
 
-        if shift.name in self.__shifts:
+        if self.__fingerprint is not None:
+            raise CourseError('Tried to modify a frozen course')
+        elif shift.name in self.__shifts:
             raise CourseError('Tried to add a shift to a course more than once')
         else:
             self.__shifts[shift.name] = shift
 
+            if self.__observers is not None:
+                for index in self.__observers:
+                    index._shift_added(self, shift)
+
+    def _add_observer(self, index: InvertedIndex) -> None:
+        '''
+        Registers an index to be notified of shifts added to this course, while the index is alive.
+        For internal use by :class:`~scheduler.index.inverted.InvertedIndex`.
+
+        :param index: Index of this course.
+        '''
+
+        if self.__observers is None:
+            self.__observers = weakref.WeakSet()
+
+        self.__observers.add(index)
+
+    def freeze(self, memo: None | dict[int, Any] = None) -> Course:
+        '''
+        Creates an immutable copy of the course, with frozen shifts (see
+        :meth:`~.shift.Shift.freeze`), that can be safely shared between threads. Adding shifts to
+        it raises a :class:`CourseError`. Freezing a frozen course returns the course itself.
+
+        :param memo: Objects already frozen, by the :func:`id` of their original object. Shifts
+                     shared by many courses are frozen only once when the same ``memo`` is used.
+                     New frozen objects are added to it.
+
+        >>> course = Course('Computer Graphics', [Shift(ShiftType.T, 1)]).freeze()
+        >>> course.frozen, course.shifts['T1'].frozen
+        (True, True)
+        '''
+
+        if self.__fingerprint is not None:
+            return self
+
+        if memo is None:
+            memo = {}
+
+        shifts: list[Shift] = []
+        for shift in self.__shifts.values():
+            frozen_shift = memo.get(id(shift))
+            if frozen_shift is None:
+                frozen_shift = memo[id(shift)] = shift.freeze()
+            shifts.append(frozen_shift)
+
+        return Course._from_frozen_state(self.__name, shifts)
+
+    @staticmethod
+    def _from_frozen_state(name: str, shifts: list[Shift]) -> Course:
+        '''
+        Creates a frozen course (see :meth:`freeze`) from frozen shifts. For internal use by
+        :meth:`freeze` and :mod:`pickle`.
+        '''
+
+        course = Course(name, shifts)
+        course.__fingerprint = hash((name, tuple(course.__shifts)))
+        return course
+
     @property
     def name(self) -> str:
         '''
@@ -78,8 +151,22 @@ class Course:
 
         return self.__shifts
 
+    @property
+    def frozen(self) -> bool:
+        '''Whether the course is immutable (see :meth:`freeze`).'''
+
+        return self.__fingerprint is not None
+
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Course):
+        if self is other:
+            return True
+        elif not isinstance(other, Course):
+            return False
+        elif (
+            self.__fingerprint is not None and
+            other.__fingerprint is not None and
+            self.__fingerprint != other.__fingerprint
+        ):
             return False
 
         return self.__name == other.name and list(self.__shifts) == list(other.shifts)
@@ -90,5 +177,12 @@ class Course:
     def __hash__(self) -> int:
         return hash(self.name)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Fingerprints depend on string hashes, that change between processes
+        if self.__fingerprint is not None:
+            return (Course._from_frozen_state, (self.__name, list(self.__shifts.values())))
+
+        return (Course, (self.__name, list(self.__shifts.values())))
+
     def __repr__(self) -> str:
         return f'Course(name={self.__name!r}, shifts={self.__shifts!r})'
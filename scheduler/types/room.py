@@ -1,4 +1,9 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+import weakref
+
+if TYPE_CHECKING:
+    from .shift import Shift
 
 class RoomError(Exception):
     '''Type of exception thrown by :class:`Room`.'''
@@ -17,11 +22,28 @@ class Room:
     :raises RoomError: ``capacity`` is not positive.
     '''
 
+    __slots__ = ('__building', '__name_in_building', '__name', '__capacity', '__dependents')
+
     def __init__(self, building: str, name_in_building: str, capacity: None | int = None) -> None:
         self.__building = building
         self.__name_in_building = name_in_building
+        self.__name = f'{building} {name_in_building}'
+
+        # Shifts with a timeslot in this room, whose cached capacity depends on this room's
+        self.__dependents: weakref.WeakSet[Shift] = weakref.WeakSet()
         self.capacity = capacity
 
+    def _add_dependent(self, shift: Shift) -> None:
+        '''
+        Registers a shift whose :attr:`~.shift.Shift.capacity` depends on this room's capacity, so
+        that it is notified when the room's capacity changes. Only weak references to shifts are
+        kept. For internal use by :class:`~.shift.Shift`.
+
+        :param shift: Shift with a timeslot in this room.
+        '''
+
+        self.__dependents.add(shift)
+
     @property
     def name(self) -> str:
         '''
@@ -32,7 +54,7 @@ class Room:
         'CP1 0.08'
         '''
 
-        return f'{self.__building} {self.__name_in_building}'
+        return self.__name
 
     @property
     def building(self) -> str:
@@ -86,6 +108,8 @@ class Room:
             raise RoomError('Room\'s capacity must be positive')
 
         self.__capacity = capacity
+        for shift in self.__dependents:
+            shift._invalidate_capacity()
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Room):
@@ -101,7 +125,12 @@ class Room:
         return Room(self.__building, self.__name_in_building, self.__capacity)
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return hash(self.__name)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Weak references can't be pickled. Dependent shifts register themselves again when they
+        # are unpickled.
+        return (Room, (self.__building, self.__name_in_building, self.__capacity))
 
     def __repr__(self) -> str:
         return (
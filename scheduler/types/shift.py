@@ -1,10 +1,20 @@
 from __future__ import annotations
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+import bisect
 import copy
 import enum
 import re
+import weakref
+
+import numpy as np
+import numpy.typing as npt
 
 from .timeslot import Timeslot
+from .weekday import Weekday
+
+if TYPE_CHECKING:
+    from ..index.inverted import InvertedIndex
 
 class ShiftError(Exception):
     '''Type of exception thrown by :class:`Shift`.'''
@@ -22,6 +32,14 @@ class ShiftType(enum.StrEnum):
     def __repr__(self) -> str:
         return f'ShiftType.{self}'
 
+SHIFT_TYPES: tuple[ShiftType, ...] = tuple(ShiftType)
+'''Types of shifts, in order. Binary formats store types as their position in this tuple.'''
+
+SHIFT_TYPE_INDICES: Mapping[ShiftType, int] = {
+    shift_type: i for i, shift_type in enumerate(SHIFT_TYPES)
+}
+'''Position of each type in :data:`SHIFT_TYPES`.'''
+
 class Shift:
     '''
     Subdivision of a :class:`~.course.Course`, to allow for more enrolled students. A shift is
@@ -38,6 +56,19 @@ class Shift:
     See :ref:`this <encapsulation>` to learn how objects and collections are copied.
     '''
 
+    __slots__ = (
+        '__shift_type',
+        '__number',
+        '__name',
+        '__timeslots',
+        '__timeslots_by_day',
+        '__capacity',
+        '__capacity_valid',
+        '__fingerprint',
+        '__observers',
+        '__weakref__'
+    )
+
     def __init__(
             self,
             shift_type: ShiftType,
@@ -47,8 +78,23 @@ class Shift:
 
         self.__shift_type = shift_type
         self.__number = number
+        self.__name = f'{shift_type}{number}'
         self.__timeslots: list[Timeslot] = []
 
+        # Timeslots of each day, sorted by starting time. Because the timeslots of a shift can't
+        # overlap, these lists are also sorted by ending time.
+        self.__timeslots_by_day: dict[Weekday, list[Timeslot]] = {}
+
+        # Cached value of the capacity property, invalidated by the rooms of the timeslots
+        self.__capacity: None | int = None
+        self.__capacity_valid = True
+
+        # Hash of all compared attributes, only computed for frozen shifts (see freeze)
+        self.__fingerprint: None | int = None
+
+        # Indexes notified of new timeslots, only created when the shift is indexed
+        self.__observers: None | weakref.WeakSet[InvertedIndex] = None
+
         if timeslots:
             for timeslot in timeslots:
                 self.add_timeslot(timeslot)
@@ -59,7 +105,8 @@ class Shift:
 
         :param timeslot: Timeslot to be added to the shift.
 
-        :raises ShiftError: ``timeslot`` overlaps with at least one of the shift's timeslots.
+        :raises ShiftError: ``timeslot`` overlaps with at least one of the shift's timeslots, or the
+                            shift is frozen.
 
         >>> shift = Shift(ShiftType.T, 2)
         >>> timeslot = Timeslot(Weekday.MONDAY, time(10, 0), time(12, 0), Room('CP1', '0.04'))
@@ -70,23 +117,136 @@ class Shift:
         See :ref:`this <encapsulation>` to learn how objects and collections are copied.
         '''
 
-        for t in self.__timeslots:
-            if t.overlaps(timeslot):
-                raise ShiftError('Overlapping timeslots in shift')
+        if self.__fingerprint is not None:
+            raise ShiftError('Tried to modify a frozen shift')
+
+        day_timeslots = self.__timeslots_by_day.get(timeslot.day)
+        if day_timeslots is None:
+            day_timeslots = self.__timeslots_by_day[timeslot.day] = []
+
+        # Only the neighbors of the insertion point can overlap with the new timeslot
+        i = bisect.bisect_left(day_timeslots, timeslot.start_minute, key=lambda t: t.start_minute)
+        if (
+            (i > 0 and day_timeslots[i - 1].end_minute > timeslot.start_minute) or
+            (i < len(day_timeslots) and day_timeslots[i].start_minute < timeslot.end_minute)
+        ):
+            raise ShiftError('Overlapping timeslots in shift')
 
+        day_timeslots.insert(i, timeslot)
         self.__timeslots.append(timeslot)
 
+        timeslot.room._add_dependent(self)
+        self.__capacity_valid = False
+
+        if self.__observers is not None:
+            for index in self.__observers:
+                index._timeslot_added(self, timeslot)
+
+    def _add_observer(self, index: InvertedIndex) -> None:
+        '''
+        Registers an index to be notified of timeslots added to this shift, while the index is
+        alive. For internal use by :class:`~scheduler.index.inverted.InvertedIndex`.
+
+        :param index: Index of this shift.
+        '''
+
+        if self.__observers is None:
+            self.__observers = weakref.WeakSet()
+
+        self.__observers.add(index)
+
+    @staticmethod
+    def _from_valid_timeslots(
+            shift_type: ShiftType,
+            number: int,
+            timeslots: list[Timeslot]
+        ) -> Shift:
+        '''
+        Creates a shift without checking whether its timeslots overlap, in a single pass over them.
+        For internal use by readers of data that was already validated, such as
+        :func:`~scheduler.io.snapshot.read_snapshot`.
+
+        :param shift_type: Type of the shift.
+        :param number:     Number of the shift.
+        :param timeslots:  List of timeslots of the shift, which must not overlap.
+        '''
+
+        shift = Shift(shift_type, number)
+        shift.__timeslots = list(timeslots)
+
+        for timeslot in timeslots:
+            day_timeslots = shift.__timeslots_by_day.get(timeslot.day)
+            if day_timeslots is None:
+                day_timeslots = shift.__timeslots_by_day[timeslot.day] = []
+
+            day_timeslots.append(timeslot)
+            timeslot.room._add_dependent(shift)
+
+        for day_timeslots in shift.__timeslots_by_day.values():
+            day_timeslots.sort(key=lambda t: t.start_minute)
+
+        shift.__capacity_valid = False
+        return shift
+
+    def freeze(self) -> Shift:
+        '''
+        Creates an immutable copy of the shift, that can be safely shared between threads. Adding
+        timeslots to it raises a :class:`ShiftError`.
+
+        The :attr:`capacity` of a frozen shift is the one it had when it was frozen, and doesn't
+        change with the capacity of its rooms. A hash of all the attributes compared by ``==`` is
+        also computed once, so that comparing frozen shifts that differ is fast.
+
+        Freezing a frozen shift returns the shift itself.
+
+        >>> shift = Shift(ShiftType.T, 2).freeze()
+        >>> shift.frozen
+        True
+        >>> shift.add_timeslot(timeslot)
+        scheduler.types.shift.ShiftError: Tried to modify a frozen shift
+        '''
+
+        if self.__fingerprint is not None:
+            return self
+
+        return Shift._from_frozen_state(
+            self.__shift_type,
+            self.__number,
+            self.__timeslots,
+            self.capacity
+        )
+
     def overlaps(self, other: Shift) -> bool:
         '''
         Checks if at least one of the timeslots of the shift overlaps with any of the timeslots in
         ``other``.
 
         :param other: Shift to test for overlapping timeslots.
+
+        The timeslots of both shifts are merged day by day, in linear time on the number of
+        timeslots.
+
+        >>> slot1 = Timeslot(Weekday.MONDAY, time(9, 0), time(11, 0), Room('CP1', '0.20'))
+        >>> slot2 = Timeslot(Weekday.MONDAY, time(10, 0), time(12, 0), Room('CP1', '0.04'))
+        >>> Shift(ShiftType.PL, 1, [slot1]).overlaps(Shift(ShiftType.PL, 2, [slot2]))
+        True
         '''
 
-        for self_timeslot in self.__timeslots:
-            for other_timeslot in other.timeslots:
-                if self_timeslot.overlaps(other_timeslot):
+        for day, self_timeslots in self.__timeslots_by_day.items():
+            other_timeslots = other.__timeslots_by_day.get(day)
+            if not other_timeslots:
+                continue
+
+            i = j = 0
+            while i < len(self_timeslots) and j < len(other_timeslots):
+                self_timeslot = self_timeslots[i]
+                other_timeslot = other_timeslots[j]
+
+                if self_timeslot.end_minute <= other_timeslot.start_minute:
+                    i += 1
+                elif other_timeslot.end_minute <= self_timeslot.start_minute:
+                    j += 1
+                else:
                     return True
 
         return False
@@ -124,7 +284,7 @@ class Shift:
         'T2'
         '''
 
-        return f'{self.__shift_type}{self.__number}'
+        return self.__name
 
     @property
     def timeslots(self) -> Sequence[Timeslot]:
@@ -149,17 +309,47 @@ class Shift:
         room the shift has classes in. The value of this property is ``None`` when the shift has no
         timeslots, or when the room of one of the timeslots has an unknown
         :attr:`~.room.Room.capacity`.
+
+        This value is cached, and recomputed only after timeslots are added to the shift or after
+        the capacity of one of its rooms changes.
         '''
 
-        if not self.__timeslots or any(timeslot.capacity is None for timeslot in self.__timeslots):
-            return None
-        else:
-            return min(
-                timeslot.capacity for timeslot in self.__timeslots if timeslot.capacity is not None
-            )
+        if not self.__capacity_valid:
+            if not self.__timeslots or any(t.capacity is None for t in self.__timeslots):
+                self.__capacity = None
+            else:
+                self.__capacity = min(
+                    t.capacity for t in self.__timeslots if t.capacity is not None
+                )
+
+            self.__capacity_valid = True
+
+        return self.__capacity
+
+    @property
+    def frozen(self) -> bool:
+        '''Whether the shift is immutable (see :meth:`freeze`).'''
+
+        return self.__fingerprint is not None
+
+    def _invalidate_capacity(self) -> None:
+        '''
+        Marks the cached :attr:`capacity` as outdated. For internal use by :class:`~.room.Room`,
+        when its capacity changes.
+        '''
+
+        self.__capacity_valid = False
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Shift):
+        if self is other:
+            return True
+        elif not isinstance(other, Shift):
+            return False
+        elif (
+            self.__fingerprint is not None and
+            other.__fingerprint is not None and
+            self.__fingerprint != other.__fingerprint
+        ):
             return False
 
         return (
@@ -172,7 +362,41 @@ class Shift:
         return Shift(self.__shift_type, self.__number, self.__timeslots)
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return hash(self.__name)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self.__fingerprint is not None:
+            return (
+                Shift._from_frozen_state,
+                (self.__shift_type, self.__number, self.__timeslots, self.__capacity)
+            )
+
+        # Rebuilding the shift registers it again in the rooms of its timeslots
+        return (Shift, (self.__shift_type, self.__number, self.__timeslots))
+
+    @staticmethod
+    def _from_frozen_state(
+            shift_type: ShiftType,
+            number: int,
+            timeslots: list[Timeslot],
+            capacity: None | int
+        ) -> Shift:
+        '''
+        Creates a frozen shift (see :meth:`freeze`). For internal use by :meth:`freeze` and
+        :mod:`pickle`.
+        '''
+
+        # Frozen shifts aren't registered in their rooms, as their capacity never changes
+        shift = Shift(shift_type, number)
+        shift.__timeslots = list(timeslots)
+        for timeslot in timeslots:
+            shift.__timeslots_by_day.setdefault(timeslot.day, []).append(timeslot)
+        for day_timeslots in shift.__timeslots_by_day.values():
+            day_timeslots.sort(key=lambda t: t.start_minute)
+
+        shift.__capacity = capacity
+        shift.__fingerprint = hash((shift_type, number, tuple(timeslots)))
+        return shift
 
     def __repr__(self) -> str:
         return (
@@ -195,7 +419,7 @@ class Shift:
         '''
 
         shift_types_regex = '|'.join(ShiftType)
-        match = re.match(rf'({shift_types_regex})([0-9]+)', name)
+        match = re.fullmatch(rf'({shift_types_regex})([0-9]+)', name)
 
         if match is None:
             raise ShiftError(f'Failed to parse shift name: {name!r}')
@@ -203,3 +427,41 @@ class Shift:
             shift_type = ShiftType(match.group(1))
             number = int(match.group(2))
             return shift_type, number
+
+    @staticmethod
+    def parse_names(
+            names: Sequence[str] | npt.NDArray[np.str_]
+        ) -> tuple[npt.NDArray[np.int8], npt.NDArray[np.int64]]:
+        '''
+        Parses many shift names at once (see :meth:`parse_name`), with vectorized string operations.
+
+        :param names: Shift names to parse.
+
+        :return: The position of the type of each shift in :class:`ShiftType`, and the number of
+                 each shift.
+
+        :raises ShiftError: Invalid shift name.
+
+        >>> types, numbers = Shift.parse_names(['TP4', 'T1', 'PL12'])
+        >>> [list(ShiftType)[t] for t in types], numbers
+        ([ShiftType.TP, ShiftType.T, ShiftType.PL], array([ 4,  1, 12]))
+        '''
+
+        names_array = np.asarray(names, dtype=np.str_)
+        prefixes = np.char.rstrip(names_array, '0123456789')
+        digits = np.char.lstrip(names_array, ''.join(sorted(set(''.join(ShiftType)))))
+
+        types = np.full(len(names_array), -1, dtype=np.int8)
+        for i, shift_type in enumerate(SHIFT_TYPES):
+            types[prefixes == shift_type.value] = i
+
+        invalid = (
+            (types < 0) |
+            ~np.char.isdigit(digits) |
+            (np.char.str_len(prefixes) + np.char.str_len(digits) != np.char.str_len(names_array))
+        )
+        if invalid.any():
+            name = names_array[np.argmax(invalid)]
+            raise ShiftError(f'Failed to parse shift name: {str(name)!r}')
+
+        return types, digits.astype(np.int64)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 import copy
+import weakref
 
 from .course import Course
 
+if TYPE_CHECKING:
+    from ..index.inverted import InvertedIndex
+
 class StudentError(Exception):
     '''Type of exception thrown by :class:`Student`.'''
     pass
@@ -22,10 +27,18 @@ class Student:
     See :ref:`this <encapsulation>` to learn how objects and collections are copied.
     '''
 
+    __slots__ = ('__number', '__courses', '__fingerprint', '__observers')
+
     def __init__(self, number: str, courses: None | list[Course] = None) -> None:
         self.__number = number
         self.__courses: dict[str, Course] = {}
 
+        # Hash of all compared attributes, only computed for frozen students (see freeze)
+        self.__fingerprint: None | int = None
+
+        # Indexes notified of new courses, only created when the student is indexed
+        self.__observers: None | weakref.WeakSet[InvertedIndex] = None
+
         if courses:
             for course in courses:
                 self.add_course(course)
@@ -37,7 +50,7 @@ class Student:
         :param course: Course to enroll the student in.
 
         :raises StudentError: The student is already enrolled in a course with the same
-                              :attr:`~.course.Course.name`.
+                              :attr:`~.course.Course.name`, or the student is frozen.
 
         >>> student = Student('A10400')
         >>> student.add_course(Course('Software Labs II'))
@@ -47,11 +60,71 @@ class Student:
         See :ref:`this <encapsulation>` to learn how objects and collections are copied.
         '''
 
-        if course.name in self.__courses:
+        if self.__fingerprint is not None:
+            raise StudentError('Tried to modify a frozen student')
+        elif course.name in self.__courses:
             raise StudentError('Tried to add a course to a student more than once')
 
         self.__courses[course.name] = course
 
+        if self.__observers is not None:
+            for index in self.__observers:
+                index._course_added(self, course)
+
+    def _add_observer(self, index: InvertedIndex) -> None:
+        '''
+        Registers an index to be notified of courses added to this student, while the index is
+        alive. For internal use by :class:`~scheduler.index.inverted.InvertedIndex`.
+
+        :param index: Index of this student.
+        '''
+
+        if self.__observers is None:
+            self.__observers = weakref.WeakSet()
+
+        self.__observers.add(index)
+
+    def freeze(self, memo: None | dict[int, Any] = None) -> Student:
+        '''
+        Creates an immutable copy of the student, enrolled in frozen courses (see
+        :meth:`~.course.Course.freeze`), that can be safely shared between threads and cheaply
+        sent to other processes. Adding courses to it raises a :class:`StudentError`. Freezing a
+        frozen student returns the student itself.
+
+        :param memo: Objects already frozen, by the :func:`id` of their original object. Use the
+                     same ``memo`` when freezing many students, so that each course is frozen only
+                     once, and frozen students keep sharing courses.
+
+        >>> memo = {}
+        >>> frozen = [student.freeze(memo) for student in students]
+        '''
+
+        if self.__fingerprint is not None:
+            return self
+
+        if memo is None:
+            memo = {}
+
+        courses: list[Course] = []
+        for course in self.__courses.values():
+            frozen_course = memo.get(id(course))
+            if frozen_course is None:
+                frozen_course = memo[id(course)] = course.freeze(memo)
+            courses.append(frozen_course)
+
+        return Student._from_frozen_state(self.__number, courses)
+
+    @staticmethod
+    def _from_frozen_state(number: str, courses: list[Course]) -> Student:
+        '''
+        Creates a frozen student (see :meth:`freeze`) from frozen courses. For internal use by
+        :meth:`freeze` and :mod:`pickle`.
+        '''
+
+        student = Student(number, courses)
+        student.__fingerprint = hash((number, tuple(student.__courses)))
+        return student
+
     @property
     def number(self) -> str:
         '''
@@ -77,8 +150,22 @@ class Student:
 
         return self.__courses
 
+    @property
+    def frozen(self) -> bool:
+        '''Whether the student is immutable (see :meth:`freeze`).'''
+
+        return self.__fingerprint is not None
+
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Student):
+        if self is other:
+            return True
+        elif not isinstance(other, Student):
+            return False
+        elif (
+            self.__fingerprint is not None and
+            other.__fingerprint is not None and
+            self.__fingerprint != other.__fingerprint
+        ):
             return False
 
         return self.__number == other.number and list(self.__courses) == list(other.courses)
@@ -89,5 +176,12 @@ class Student:
     def __hash__(self) -> int:
         return hash(self.__number)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Fingerprints depend on string hashes, that change between processes
+        if self.__fingerprint is not None:
+            return (Student._from_frozen_state, (self.__number, list(self.__courses.values())))
+
+        return (Student, (self.__number, list(self.__courses.values())))
+
     def __repr__(self) -> str:
         return f'Student(number={self.__number!r}, courses={self.__courses!r})'
@@ -2,7 +2,7 @@ from __future__ import annotations
 import datetime
 
 from .room import Room
-from .weekday import Weekday
+from .weekday import WEEKDAY_INDICES, Weekday
 
 class TimeslotError(Exception):
     '''Type of exception thrown by :class:`Timeslot`.'''
@@ -19,19 +19,30 @@ class Timeslot:
     :param end:   Ending hour of the class.
     :param room:  Room where the class is taught.
 
-    :raises TimeslotError: If and only if ``end <= start``
+    :raises TimeslotError: If and only if ``end <= start``, once seconds are discarded.
+
+    Timeslots have a resolution of one minute: seconds in ``start`` and ``end`` are not considered
+    in comparisons.
 
     See :ref:`this <encapsulation>` to learn how objects and collections are copied.
     '''
 
+    __slots__ = ('__day', '__start', '__end', '__room', '__start_minute', '__end_minute')
+
     def __init__(self, day: Weekday, start: datetime.time, end: datetime.time, room: Room) -> None:
-        if end <= start:
+        day_start = WEEKDAY_INDICES[day] * 24 * 60
+        start_minute = day_start + start.hour * 60 + start.minute
+        end_minute = day_start + end.hour * 60 + end.minute
+
+        if end_minute <= start_minute:
             raise TimeslotError(f'Timeslot\'s start ({start!r}) must precede its end ({end!r})')
 
         self.__day = day
         self.__start = start
         self.__end = end
         self.__room = room
+        self.__start_minute = start_minute
+        self.__end_minute = end_minute
 
     def overlaps(self, other: Timeslot) -> bool:
         '''
@@ -48,7 +59,7 @@ class Timeslot:
         False
         '''
 
-        return self.__day == other.day and self.__start < other.end and other.start < self.__end
+        return self.__start_minute < other.__end_minute and other.__start_minute < self.__end_minute
 
     @property
     def day(self) -> Weekday:
@@ -83,6 +94,30 @@ class Timeslot:
 
         return self.__end
 
+    @property
+    def start_minute(self) -> int:
+        '''
+        Starting time of the class, in minutes since the start of the week (Monday, 00:00).
+
+        >>> timeslot = Timeslot(Weekday.TUESDAY, time(10, 0), time(12, 0), Room('CP1', '0.04'))
+        >>> timeslot.start_minute
+        2040
+        '''
+
+        return self.__start_minute
+
+    @property
+    def end_minute(self) -> int:
+        '''
+        Ending time of the class, in minutes since the start of the week (Monday, 00:00).
+
+        >>> timeslot = Timeslot(Weekday.TUESDAY, time(10, 0), time(12, 0), Room('CP1', '0.04'))
+        >>> timeslot.end_minute
+        2160
+        '''
+
+        return self.__end_minute
+
     @property
     def room(self) -> Room:
         '''
@@ -113,17 +148,16 @@ class Timeslot:
             return False
 
         return (
-            self.__day == other.day and
-            self.__start == other.start and
-            self.__end == other.end and
-            self.__room.name == other.room.name
+            self.__start_minute == other.__start_minute and
+            self.__end_minute == other.__end_minute and
+            self.__room.name == other.__room.name
         )
 
     def __copy__(self) -> Timeslot:
         return Timeslot(self.__day, self.__start, self.__end, self.__room)
 
     def __hash__(self) -> int:
-        return hash((self.__day, self.__start, self.__end, self.__room))
+        return hash((self.__start_minute, self.__end_minute, self.__room))
 
     def __repr__(self) -> str:
         return (
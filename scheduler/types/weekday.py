@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 import enum
 
 @enum.unique
@@ -12,3 +13,9 @@ class Weekday(enum.StrEnum):
 
     def __repr__(self) -> str:
         return f'Weekday.{self.upper()}'
+
+WEEKDAYS: tuple[Weekday, ...] = tuple(Weekday)
+'''Days of the week, in order. Binary formats store days as their position in this tuple.'''
+
+WEEKDAY_INDICES: Mapping[Weekday, int] = {day: i for i, day in enumerate(WEEKDAYS)}
+'''Position of each day in :data:`WEEKDAYS`, starting at 0 for Monday.'''
@@ -0,0 +1,56 @@
+import datetime
+import itertools
+
+from scheduler.solver.assignment import Assignment, assigned_shifts
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift
+from scheduler.types.student import Student
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+def make_shift(
+        name: str,
+        day: Weekday,
+        start: int,
+        end: int,
+        capacity: None | int = None,
+        room: None | Room = None
+    ) -> Shift:
+
+    if room is None:
+        room = Room('CP1', name, capacity)
+
+    timeslot = Timeslot(day, datetime.time(start), datetime.time(end), room)
+    return Shift(*Shift.parse_name(name), [timeslot])
+
+def make_courses() -> tuple[Course, Course]:
+    algebra = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.MONDAY, 9, 11, None),
+        make_shift('TP1', Weekday.TUESDAY, 9, 11, 3),
+        make_shift('TP2', Weekday.WEDNESDAY, 9, 11, 3)
+    ])
+    calculus = Course('Cálculo', [
+        make_shift('T1', Weekday.MONDAY, 14, 16, None),
+        make_shift('TP1', Weekday.TUESDAY, 9, 11, 2),
+        make_shift('TP2', Weekday.THURSDAY, 9, 11, 5)
+    ])
+    return algebra, calculus
+
+def check_assignment(students: list[Student], assignment: Assignment) -> None:
+    assert set(assignment) == {student.number for student in students}
+
+    occupation: dict[int, int] = {}
+    for student in students:
+        shifts = [shift for s, shift in assigned_shifts(assignment, [student])]
+        for a, b in itertools.combinations(shifts, 2):
+            assert not a.overlaps(b)
+
+        for course in student.courses.values():
+            names = assignment[student.number][course.name]
+            types = [course.shifts[name].shift_type for name in names]
+            assert sorted(types) == sorted({shift.shift_type for shift in course.shifts.values()})
+
+        for shift in shifts:
+            occupation[id(shift)] = occupation.get(id(shift), 0) + 1
+            assert shift.capacity is None or occupation[id(shift)] <= shift.capacity
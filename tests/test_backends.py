@@ -0,0 +1,159 @@
+import importlib.util
+import os
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+import scipy.sparse
+
+from scheduler.solver.backends import (
+    Backend,
+    BackendError,
+    HighsBackend,
+    Program,
+    RaceBackend,
+    available_backends,
+    get_backend
+)
+from scheduler.solver.model import Model, ModelError
+from scheduler.types.course import Course
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_shift
+
+class FailingBackend(Backend):
+    name = 'failing'
+
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+
+        raise ModelError('Failed to solve model: test')
+
+class SuboptimalBackend(HighsBackend):
+    name = 'suboptimal'
+
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+
+        solution, _ = super().solve(program, time_limit)
+        return solution, False
+
+class DyingBackend(Backend):
+    name = 'dying'
+
+    def solve(
+            self,
+            program: Program,
+            time_limit: None | float = None
+        ) -> tuple[npt.NDArray[np.float64], bool]:
+
+        os._exit(1)
+
+def make_students() -> list[Student]:
+    algebra = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.MONDAY, 9, 11, None),
+        make_shift('TP1', Weekday.TUESDAY, 9, 11, 1),
+        make_shift('TP2', Weekday.TUESDAY, 14, 16, 1)
+    ])
+    return [Student('A100', [algebra]), Student('A101', [algebra])]
+
+def make_program() -> Program:
+    # Minimize x + 2y, subject to x + y = 3, 0 <= x <= 2, y >= 0
+    return Program(
+        np.array([1.0, 2.0]),
+        np.zeros(2),
+        np.array([2.0, np.inf]),
+        scipy.sparse.csr_array(np.array([[1.0, 1.0]])),
+        np.array([3.0]),
+        np.array([3.0])
+    )
+
+def test_highs() -> None:
+    solution, optimal = HighsBackend().solve(make_program())
+
+    assert optimal
+    assert list(solution) == [2.0, 1.0]
+
+def test_infeasible() -> None:
+    program = make_program()
+    program = Program(
+        program.objective,
+        program.variable_lower,
+        np.array([1.0, 1.0]),
+        program.constraints,
+        program.constraint_lower,
+        program.constraint_upper
+    )
+
+    with pytest.raises(ModelError):
+        HighsBackend().solve(program)
+
+def test_get_backend() -> None:
+    assert isinstance(get_backend('highs'), HighsBackend)
+    assert available_backends()[0] == 'highs'
+
+    with pytest.raises(BackendError):
+        get_backend('gurobi')
+
+@pytest.mark.skipif(importlib.util.find_spec('pulp') is not None, reason='PuLP installed')
+def test_missing_cbc() -> None:
+    with pytest.raises(BackendError):
+        get_backend('cbc')
+
+    assert 'cbc' not in available_backends()
+
+@pytest.mark.skipif(importlib.util.find_spec('ortools') is not None, reason='OR-Tools installed')
+def test_missing_cp_sat() -> None:
+    with pytest.raises(BackendError):
+        get_backend('cp-sat')
+
+    assert 'cp-sat' not in available_backends()
+
+@pytest.mark.parametrize('name', ['cbc', 'cp-sat'])
+def test_optional(name: str) -> None:
+    if name not in available_backends():
+        pytest.skip(f'{name} not installed')
+
+    solution, optimal = get_backend(name).solve(make_program())
+
+    assert optimal
+    assert list(solution) == [2.0, 1.0]
+
+def test_race() -> None:
+    backend = RaceBackend([FailingBackend(), HighsBackend()])
+    solution, optimal = backend.solve(make_program())
+
+    assert optimal
+    assert list(solution) == [2.0, 1.0]
+
+def test_race_died() -> None:
+    backend = RaceBackend([SuboptimalBackend(), DyingBackend()])
+    solution, optimal = backend.solve(make_program())
+
+    assert not optimal
+    assert list(solution) == [2.0, 1.0]
+
+    with pytest.raises(ModelError):
+        RaceBackend([DyingBackend()]).solve(make_program())
+
+def test_race_failed() -> None:
+    with pytest.raises(BackendError):
+        RaceBackend([])
+
+    with pytest.raises(ModelError):
+        RaceBackend([FailingBackend(), FailingBackend()]).solve(make_program())
+
+def test_model() -> None:
+    students = make_students()
+    assignment = Model(students).solve(backend=RaceBackend([HighsBackend(), HighsBackend()]))
+
+    assert {assignment['A100']['Álgebra Linear'][1], assignment['A101']['Álgebra Linear'][1]} == {
+        'TP1',
+        'TP2'
+    }
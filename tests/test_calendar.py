@@ -0,0 +1,110 @@
+import datetime
+
+import pytest
+
+from scheduler.index.calendar import RoomCalendar, RoomCalendarError
+from scheduler.types.room import Room
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+room_1: Room
+room_2: Room
+
+@pytest.fixture(autouse=True)
+def initialize_reference_rooms() -> None:
+    global room_1, room_2
+    room_1 = Room('CP1', '0.08')
+    room_2 = Room('CP1', '0.04')
+
+def test_init_invalid_bucket() -> None:
+    with pytest.raises(RoomCalendarError):
+        RoomCalendar([], 0)
+
+    with pytest.raises(RoomCalendarError):
+        RoomCalendar([], 7)
+
+def test_is_free() -> None:
+    calendar = RoomCalendar([
+        Timeslot(Weekday.MONDAY, datetime.time(9), datetime.time(11), room_1),
+        Timeslot(Weekday.MONDAY, datetime.time(14), datetime.time(16), room_2)
+    ])
+
+    assert not calendar.is_free('CP1 0.08', Weekday.MONDAY, datetime.time(10), datetime.time(12))
+    assert calendar.is_free('CP1 0.08', Weekday.MONDAY, datetime.time(11), datetime.time(12))
+    assert calendar.is_free('CP1 0.08', Weekday.MONDAY, datetime.time(8), datetime.time(9))
+    assert calendar.is_free('CP1 0.08', Weekday.TUESDAY, datetime.time(10), datetime.time(12))
+    assert calendar.is_free('CP2 0.01', Weekday.MONDAY, datetime.time(10), datetime.time(12))
+
+def test_is_free_temporary_timeslots() -> None:
+    # Timeslots aren't referenced anywhere else, so their ids could be reused once collected
+    calendar = RoomCalendar()
+    for hour in (9, 11, 14, 16):
+        calendar.add_timeslot(
+            Timeslot(Weekday.MONDAY, datetime.time(hour), datetime.time(hour + 1), room_1)
+        )
+
+    for hour in (9, 11, 14, 16):
+        assert not calendar.is_free(
+            'CP1 0.08',
+            Weekday.MONDAY,
+            datetime.time(hour),
+            datetime.time(hour + 1)
+        )
+
+def test_is_free_unaligned() -> None:
+    calendar = RoomCalendar([
+        Timeslot(Weekday.MONDAY, datetime.time(9, 10), datetime.time(11), room_1)
+    ], 30)
+
+    assert not calendar.is_free('CP1 0.08', Weekday.MONDAY, datetime.time(8), datetime.time(9, 5))
+    assert calendar.is_free('CP1 0.08', Weekday.MONDAY, datetime.time(8), datetime.time(9))
+
+def test_is_free_invalid_period() -> None:
+    with pytest.raises(RoomCalendarError):
+        RoomCalendar([]).is_free('CP1 0.08', Weekday.MONDAY, datetime.time(10), datetime.time(9))
+
+def test_free_rooms() -> None:
+    calendar = RoomCalendar([
+        Timeslot(Weekday.MONDAY, datetime.time(9), datetime.time(11), room_1),
+        Timeslot(Weekday.MONDAY, datetime.time(14), datetime.time(16), room_2)
+    ])
+
+    assert calendar.free_rooms(Weekday.MONDAY, datetime.time(10), datetime.time(12)) == [
+        'CP1 0.04'
+    ]
+    assert calendar.free_rooms(Weekday.MONDAY, datetime.time(11), datetime.time(14)) == [
+        'CP1 0.08',
+        'CP1 0.04'
+    ]
+
+def test_double_booked() -> None:
+    calendar = RoomCalendar([
+        Timeslot(Weekday.MONDAY, datetime.time(9), datetime.time(11), room_1),
+        Timeslot(Weekday.MONDAY, datetime.time(10), datetime.time(12), room_1),
+        Timeslot(Weekday.MONDAY, datetime.time(10), datetime.time(12), room_2),
+        Timeslot(Weekday.FRIDAY, datetime.time(10), datetime.time(12), room_1),
+        Timeslot(Weekday.FRIDAY, datetime.time(14), datetime.time(15), room_1),
+        Timeslot(Weekday.FRIDAY, datetime.time(11), datetime.time(15), room_1)
+    ])
+
+    assert calendar.double_booked() == {
+        'CP1 0.08': [
+            (Weekday.MONDAY, datetime.time(10), datetime.time(11)),
+            (Weekday.FRIDAY, datetime.time(11), datetime.time(12)),
+            (Weekday.FRIDAY, datetime.time(14), datetime.time(15))
+        ]
+    }
+
+def test_double_booked_same_timeslot() -> None:
+    timeslot = Timeslot(Weekday.MONDAY, datetime.time(9), datetime.time(11), room_1)
+    assert RoomCalendar([timeslot, timeslot]).double_booked() == {}
+
+def test_double_booked_end_of_day() -> None:
+    calendar = RoomCalendar([
+        Timeslot(Weekday.MONDAY, datetime.time(22), datetime.time(23, 59), room_1),
+        Timeslot(Weekday.MONDAY, datetime.time(23), datetime.time(23, 59), room_1)
+    ], 60)
+
+    assert calendar.double_booked() == {
+        'CP1 0.08': [(Weekday.MONDAY, datetime.time(23), datetime.time(23, 59))]
+    }
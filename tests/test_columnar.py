@@ -0,0 +1,92 @@
+import datetime
+import pathlib
+import pickle
+
+import numpy as np
+import pytest
+
+from scheduler.io.columnar import ColumnarStore, ColumnarStoreError
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.student import Student
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+def build_students() -> list[Student]:
+    room_1 = Room('CP1', '0.08', 30)
+    room_2 = Room('CP2', '1.01')
+
+    lógica = Course('Lógica', [
+        Shift(ShiftType.T, 1, [
+            Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), room_1),
+            Timeslot(Weekday.FRIDAY, datetime.time(9, 0), datetime.time(10, 0), room_2)
+        ]),
+        Shift(ShiftType.TP, 2)
+    ])
+    álgebra = Course('Álgebra Linear', [
+        Shift(ShiftType.PL, 1, [
+            Timeslot(Weekday.TUESDAY, datetime.time(9, 0), datetime.time(11, 0), room_1)
+        ])
+    ])
+
+    return [Student('A100', [lógica]), Student('A101', [lógica, álgebra])]
+
+@pytest.fixture
+def store(tmp_path: pathlib.Path) -> ColumnarStore:
+    ColumnarStore.write(tmp_path / 'store', build_students(), [Course('Empty')])
+    return ColumnarStore(tmp_path / 'store')
+
+def test_students(store: ColumnarStore) -> None:
+    assert len(store) == 2
+    assert list(store.students()) == build_students()
+
+def test_lazy_objects(store: ColumnarStore) -> None:
+    student = store.student(1)
+    assert store.student(1) is student
+    assert store.student(0).courses['Lógica'] is student.courses['Lógica']
+
+    t1 = student.courses['Lógica'].shifts['T1']
+    pl1 = student.courses['Álgebra Linear'].shifts['PL1']
+    assert t1.timeslots[0].room is pl1.timeslots[0].room
+
+def test_indices(store: ColumnarStore) -> None:
+    assert store.student_index('A101') == 1
+    assert store.course_index('Empty') == 2
+    assert store.course(2) == Course('Empty')
+    assert store.course_count == 3
+
+    with pytest.raises(KeyError):
+        store.student_index('A102')
+
+    with pytest.raises(IndexError):
+        store.student(2)
+
+def test_columns(store: ColumnarStore) -> None:
+    assert isinstance(store.enrollment_courses, np.memmap)
+    assert isinstance(store.timeslot_starts, np.memmap)
+    assert store.enrollment_students.tolist() == [0, 1, 1]
+    assert store.enrollment_courses.tolist() == [0, 0, 1]
+    assert store.enrollment_offsets.tolist() == [0, 1, 3]
+
+    timeslots = [
+        timeslot
+        for course in build_students()[1].courses.values()
+        for shift in course.shifts.values()
+        for timeslot in shift.timeslots
+    ]
+    assert store.timeslot_starts.tolist() == [t.start_minute for t in timeslots]
+    assert store.timeslot_ends.tolist() == [t.end_minute for t in timeslots]
+    assert store.timeslot_rooms.tolist() == [0, 1, 0]
+
+def test_pickle(store: ColumnarStore) -> None:
+    copy = pickle.loads(pickle.dumps(store))
+    assert copy.directory == store.directory
+    assert list(copy.students()) == build_students()
+
+def test_missing_column(tmp_path: pathlib.Path) -> None:
+    ColumnarStore.write(tmp_path / 'store', build_students())
+    (tmp_path / 'store' / 'timeslot_rooms.npy').unlink()
+
+    with pytest.raises(ColumnarStoreError):
+        ColumnarStore(tmp_path / 'store')
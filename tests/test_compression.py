@@ -0,0 +1,102 @@
+import pytest
+
+from scheduler.solver.compression import CompressedModel, group_students
+from scheduler.solver.model import Model, ModelError
+from scheduler.types.course import Course
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import check_assignment, make_courses, make_shift
+
+def make_students() -> list[Student]:
+    algebra, calculus = make_courses()
+
+    return [Student(f'A{i}', [algebra, calculus]) for i in range(5)] + [
+        Student('A5', [calculus]),
+        Student('A6', [calculus, algebra])
+    ]
+
+def test_group_students() -> None:
+    students = make_students()
+    classes = group_students(students)
+
+    assert classes == [students[:5] + [students[6]], [students[5]]]
+
+def test_group_students_empty() -> None:
+    assert group_students([]) == []
+
+def test_model_size() -> None:
+    students = make_students()
+    model = CompressedModel(students)
+
+    assert len(model.classes) == 2
+    assert model.model.constraints.shape[1] == 6 + 3
+    assert model.model.constraints.shape[1] < Model(students).constraints.shape[1]
+
+def test_solve() -> None:
+    students = make_students()
+    assignment = CompressedModel(students).solve()
+
+    check_assignment(students, assignment)
+
+def test_solve_exact_split() -> None:
+    # Expanding the compressed solution one student at a time gives the first student T1 of both
+    # courses, leaving the overlapping T2 shifts to the second, so the counts are split exactly
+    first = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.TUESDAY, 8, 10, 1),
+        make_shift('T2', Weekday.TUESDAY, 9, 11, 1),
+        make_shift('TP1', Weekday.MONDAY, 8, 10, 3)
+    ])
+    second = Course('Cálculo', [
+        make_shift('T1', Weekday.TUESDAY, 12, 14, 1),
+        make_shift('T2', Weekday.TUESDAY, 10, 12, 1),
+        make_shift('T3', Weekday.MONDAY, 8, 10, 2),
+        make_shift('TP1', Weekday.MONDAY, 10, 12, 3)
+    ])
+    students = [Student('A1', [first, second]), Student('A2', [first, second])]
+    model = CompressedModel(students)
+
+    check_assignment(students, model.expand(model.model.solve_values()))
+
+def test_solve_split_class() -> None:
+    # The compressed solution gives the class T2 and T3 of the first course and T1 and T2 of the
+    # second, but T3 overlaps both shifts of the second course, so these counts can't be split. The
+    # class is then modeled per student.
+    first = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.TUESDAY, 9, 11, 2),
+        make_shift('T2', Weekday.TUESDAY, 12, 14, 1),
+        make_shift('T3', Weekday.TUESDAY, 10, 12, 3),
+        make_shift('TP1', Weekday.MONDAY, 8, 10, 3)
+    ])
+    second = Course('Cálculo', [
+        make_shift('T1', Weekday.TUESDAY, 9, 11, 2),
+        make_shift('T2', Weekday.TUESDAY, 11, 13, 3),
+        make_shift('TP1', Weekday.MONDAY, 11, 13, 2)
+    ])
+    students = [Student('A1', [first, second]), Student('A2', [first, second])]
+    model = CompressedModel(students)
+
+    with pytest.raises(ModelError):
+        model.expand(model.model.solve_values())
+
+    check_assignment(students, model.solve())
+    assert len(model.classes) == 2
+
+def test_solve_infeasible() -> None:
+    students = make_students()
+    students += [Student(f'A{i}', [students[0].courses['Álgebra Linear']]) for i in range(7, 9)]
+
+    with pytest.raises(ModelError):
+        CompressedModel(students).solve()
+
+def test_model_multiplicities_invalid() -> None:
+    with pytest.raises(ModelError):
+        Model(make_students(), multiplicities=[1])
+
+    with pytest.raises(ModelError):
+        Model(make_students()[:1], multiplicities=[0])
+
+def test_model_decode_multiplicities() -> None:
+    model = Model(make_students()[:1], multiplicities=[5])
+
+    with pytest.raises(ModelError):
+        model.solve()
@@ -0,0 +1,88 @@
+import datetime
+import itertools
+
+import numpy as np
+import pytest
+
+from scheduler.index.conflicts import ShiftConflictIndex, ShiftConflictIndexError
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+def make_timeslot(day: Weekday, start: int, end: int) -> Timeslot:
+    return Timeslot(day, datetime.time(start), datetime.time(end), Room('CP1', '0.08'))
+
+def make_courses() -> list[Course]:
+    return [
+        Course('Álgebra Linear', [
+            Shift(ShiftType.T, 1, [make_timeslot(Weekday.MONDAY, 9, 11)]),
+            Shift(ShiftType.TP, 1, [
+                make_timeslot(Weekday.MONDAY, 14, 16),
+                make_timeslot(Weekday.FRIDAY, 9, 10)
+            ]),
+            Shift(ShiftType.TP, 2, [make_timeslot(Weekday.TUESDAY, 9, 11)])
+        ]),
+        Course('Cálculo', [
+            Shift(ShiftType.T, 1, [make_timeslot(Weekday.MONDAY, 10, 12)]),
+            Shift(ShiftType.TP, 1, [make_timeslot(Weekday.FRIDAY, 9, 12)]),
+            Shift(ShiftType.PL, 1, [])
+        ])
+    ]
+
+def test_init_empty() -> None:
+    index = ShiftConflictIndex([])
+
+    assert len(index) == 0
+    assert index.matrix.shape == (0, 0)
+
+def test_ids() -> None:
+    courses = make_courses()
+    index = ShiftConflictIndex(courses)
+    shifts = [shift for course in courses for shift in course.shifts.values()]
+
+    assert len(index) == len(shifts)
+    for i, shift in enumerate(shifts):
+        assert index.id_of(shift) == i
+        assert index.shifts[i] is shift
+
+def test_ids_same_name_different_course() -> None:
+    courses = make_courses()
+    index = ShiftConflictIndex(courses)
+
+    assert index.id_of(courses[0].shifts['T1']) != index.id_of(courses[1].shifts['T1'])
+
+def test_ids_shared_shift() -> None:
+    shift = Shift(ShiftType.T, 1, [make_timeslot(Weekday.MONDAY, 9, 11)])
+    index = ShiftConflictIndex([Course('Lógica', [shift]), Course('Álgebra', [shift])])
+
+    assert len(index) == 1
+
+def test_id_of_invalid() -> None:
+    index = ShiftConflictIndex(make_courses())
+
+    with pytest.raises(ShiftConflictIndexError):
+        index.id_of(Shift(ShiftType.T, 1))
+
+def test_conflicts_matches_overlaps() -> None:
+    courses = make_courses()
+    index = ShiftConflictIndex(courses)
+    shifts = [shift for course in courses for shift in course.shifts.values()]
+
+    for a, b in itertools.product(shifts, shifts):
+        assert index.conflicts(a, b) == a.overlaps(b)
+
+def test_conflicts_of() -> None:
+    courses = make_courses()
+    index = ShiftConflictIndex(courses)
+    shift = courses[0].shifts['TP1']
+
+    conflicts = [index.shifts[int(i)] for i in np.flatnonzero(index.conflicts_of(shift))]
+    assert conflicts == [shift, courses[1].shifts['TP1']]
+
+def test_matrix_read_only() -> None:
+    index = ShiftConflictIndex(make_courses())
+
+    with pytest.raises(ValueError):
+        index.matrix[0, 0] = False
@@ -1,4 +1,5 @@
 import copy
+import pickle
 import datetime
 
 import pytest
@@ -141,3 +142,34 @@ def test_repr() -> None:
     shift = Shift(ShiftType.T, 2)
     course = Course('Cálculo de Programas', [shift])
     assert repr(course) == f'Course(name=\'Cálculo de Programas\', shifts={{\'T2\': {shift!r}}})'
+
+def test_slots() -> None:
+    assert not hasattr(Course('Lógica'), '__dict__')
+
+def test_freeze() -> None:
+    shift = Shift(ShiftType.T, 2)
+    course = Course('Lógica', [shift])
+    frozen = course.freeze()
+
+    assert not course.frozen
+    assert frozen.frozen
+    assert frozen.shifts['T2'].frozen
+    assert frozen == course
+    assert frozen.freeze() is frozen
+    assert frozen != Course('Lógica', [Shift(ShiftType.T, 1)]).freeze()
+
+    with pytest.raises(CourseError):
+        frozen.add_shift(Shift(ShiftType.TP, 1))
+
+def test_freeze_memo() -> None:
+    shift = Shift(ShiftType.T, 2)
+    memo: dict[int, object] = {}
+
+    course1 = Course('Lógica', [shift]).freeze(memo)
+    course2 = Course('Cálculo', [shift]).freeze(memo)
+    assert course1.shifts['T2'] is course2.shifts['T2']
+
+def test_pickle_frozen() -> None:
+    course = pickle.loads(pickle.dumps(Course('Lógica', [Shift(ShiftType.T, 2)]).freeze()))
+    assert course.frozen
+    assert course == Course('Lógica', [Shift(ShiftType.T, 2)]).freeze()
@@ -0,0 +1,99 @@
+import pytest
+
+from scheduler.solver.decomposition import connected_components, solve_components
+from scheduler.solver.model import ModelError
+from scheduler.tracing import Tracer, set_tracer
+from scheduler.types.course import Course
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_shift
+
+def make_courses() -> list[Course]:
+    return [
+        Course('Álgebra Linear', [
+            make_shift('T1', Weekday.MONDAY, 9, 11, None),
+            make_shift('TP1', Weekday.TUESDAY, 9, 11, 1),
+            make_shift('TP2', Weekday.WEDNESDAY, 9, 11, 1)
+        ]),
+        Course('Cálculo', [make_shift('T1', Weekday.MONDAY, 14, 16, None)]),
+        Course('Lógica', [make_shift('T1', Weekday.MONDAY, 14, 16, None)]),
+        Course('Programação Funcional', [make_shift('PL1', Weekday.FRIDAY, 14, 16, 1)])
+    ]
+
+def test_connected_components() -> None:
+    algebra, calculus, logic, functional = make_courses()
+    students = [
+        Student('A1', [algebra]),
+        Student('A2', [logic]),
+        Student('A3', [calculus, algebra]),
+        Student('A4', []),
+        Student('A5', [functional])
+    ]
+
+    assert connected_components(students) == [
+        [students[0], students[2]],
+        [students[1]],
+        [students[3]],
+        [students[4]]
+    ]
+
+def test_connected_components_shared_shift() -> None:
+    shift = make_shift('T1', Weekday.MONDAY, 9, 11, None)
+    students = [
+        Student('A1', [Course('Álgebra Linear', [shift])]),
+        Student('A2', [Course('Cálculo', [shift])])
+    ]
+
+    assert connected_components(students) == [students]
+
+def test_connected_components_empty() -> None:
+    assert connected_components([]) == []
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_solve_components(max_workers: int) -> None:
+    algebra, calculus, logic, functional = make_courses()
+    students = [
+        Student('A1', [algebra]),
+        Student('A2', [logic]),
+        Student('A3', [calculus, algebra]),
+        Student('A4', []),
+        Student('A5', [functional])
+    ]
+
+    assignment = solve_components(students, max_workers=max_workers)
+
+    assert sorted(assignment['A1']['Álgebra Linear'] + assignment['A3']['Álgebra Linear']) == [
+        'T1',
+        'T1',
+        'TP1',
+        'TP2'
+    ]
+    assert assignment['A2'] == {'Lógica': ['T1']}
+    assert assignment['A3']['Cálculo'] == ['T1']
+    assert assignment['A4'] == {}
+    assert assignment['A5'] == {'Programação Funcional': ['PL1']}
+
+def test_solve_components_infeasible() -> None:
+    algebra, _, _, functional = make_courses()
+    students = [
+        Student('A1', [algebra]),
+        Student('A2', [functional]),
+        Student('A3', [functional])
+    ]
+
+    with pytest.raises(ModelError):
+        solve_components(students, compress=False, max_workers=2)
+
+def test_span() -> None:
+    algebra, calculus, _, _ = make_courses()
+    tracer = Tracer()
+    set_tracer(tracer)
+    try:
+        solve_components([Student('A1', [algebra]), Student('A2', [calculus])], max_workers=1)
+    finally:
+        set_tracer(None)
+
+    names = [s.name for s in tracer.spans]
+    assert names[-1] == 'solve components'
+    assert names.count('solve components') == 1
+    assert names.count('solve') == 2
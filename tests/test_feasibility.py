@@ -0,0 +1,67 @@
+from scheduler.solver.feasibility import check_feasibility
+from scheduler.solver.model import Model
+from scheduler.tracing import Tracer, set_tracer
+from scheduler.types.course import Course
+from scheduler.types.shift import ShiftType
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_courses, make_shift
+
+def test_feasible() -> None:
+    algebra, calculus = make_courses()
+    students = [Student(f'A{i}', [algebra, calculus]) for i in range(5)]
+    report = check_feasibility(students)
+
+    assert report.feasible
+    assert report.under_capacity == []
+    assert report.conflicting == []
+    assert report.unknown_capacity == [('Álgebra Linear', 'T1'), ('Cálculo', 'T1')]
+    Model(students).solve()
+
+def test_under_capacity() -> None:
+    algebra, calculus = make_courses()
+    students = [Student(f'A{i}', [algebra]) for i in range(7)]
+    report = check_feasibility(students)
+
+    assert not report.feasible
+    assert report.under_capacity == [('Álgebra Linear', ShiftType.TP, 7, 6)]
+    assert report.conflicting == []
+
+def test_all_overlapping() -> None:
+    course1 = Course('A', [make_shift('T1', Weekday.MONDAY, 9, 11, 10)])
+    course2 = Course('B', [make_shift('T1', Weekday.MONDAY, 10, 12, 10)])
+    students = [Student('A1', [course1, course2]), Student('A2', [course1])]
+    report = check_feasibility(students)
+
+    assert not report.feasible
+    assert report.under_capacity == []
+    assert report.conflicting == [
+        ('A', ShiftType.T, 'B', 1, 0),
+        ('B', ShiftType.T, 'A', 1, 0)
+    ]
+    assert check_feasibility(students, soft_overlaps=True).feasible
+
+def test_partially_compatible() -> None:
+    course1 = Course('A', [
+        make_shift('TP1', Weekday.MONDAY, 9, 11, 2),
+        make_shift('TP2', Weekday.TUESDAY, 9, 11, 10)
+    ])
+    course2 = Course('B', [make_shift('T1', Weekday.TUESDAY, 10, 12, None)])
+    students = [Student(f'A{i}', [course1, course2]) for i in range(3)]
+
+    assert check_feasibility(students).conflicting == [('A', ShiftType.TP, 'B', 3, 2)]
+
+def test_empty() -> None:
+    report = check_feasibility([Student('A1'), Student('A2', [Course('Empty')])])
+    assert report.feasible
+    assert report.unknown_capacity == []
+
+def test_span() -> None:
+    tracer = Tracer()
+    set_tracer(tracer)
+    try:
+        check_feasibility([])
+    finally:
+        set_tracer(None)
+
+    assert [s.name for s in tracer.spans] == ['feasibility check']
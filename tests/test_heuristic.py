@@ -0,0 +1,72 @@
+import pytest
+
+from scheduler.solver.heuristic import HeuristicError, solve_heuristic
+from scheduler.types.course import Course
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_shift
+
+def make_courses() -> list[Course]:
+    return [
+        Course('Álgebra Linear', [
+            make_shift('T1', Weekday.MONDAY, 9, 11, None),
+            make_shift('TP1', Weekday.TUESDAY, 9, 11, 2),
+            make_shift('TP2', Weekday.WEDNESDAY, 9, 11, 2)
+        ]),
+        Course('Cálculo', [
+            make_shift('T1', Weekday.MONDAY, 14, 16, None),
+            make_shift('TP1', Weekday.TUESDAY, 10, 12, 3),
+            make_shift('TP2', Weekday.THURSDAY, 9, 11, 2)
+        ])
+    ]
+
+def test_empty() -> None:
+    assert solve_heuristic([]) == {}
+
+def test_student_without_courses() -> None:
+    assert solve_heuristic([Student('A1')]) == {'A1': {}}
+
+def test_solve() -> None:
+    algebra, calculus = make_courses()
+    students = [
+        Student('A1', [algebra, calculus]),
+        Student('A2', [algebra, calculus]),
+        Student('A3', [algebra, calculus]),
+        Student('A4', [calculus])
+    ]
+
+    assignment = solve_heuristic(students)
+
+    occupation: dict[tuple[str, str], int] = {}
+    for student in students:
+        shifts = []
+        for course_name, shift_names in assignment[student.number].items():
+            assert len(shift_names) == 2
+            assert shift_names[0] != shift_names[1]
+            assert 'T1' in shift_names
+
+            for name in shift_names:
+                occupation[(course_name, name)] = occupation.get((course_name, name), 0) + 1
+                shifts.append(student.courses[course_name].shifts[name])
+
+        assert not any(a.overlaps(b) for a in shifts for b in shifts if a is not b)
+
+    assert occupation[('Álgebra Linear', 'TP1')] <= 2
+    assert occupation[('Álgebra Linear', 'TP2')] <= 2
+    assert occupation[('Cálculo', 'TP1')] <= 3
+    assert occupation[('Cálculo', 'TP2')] <= 2
+
+def test_solve_overlap_fallback() -> None:
+    course1 = Course('Lógica', [make_shift('T1', Weekday.MONDAY, 9, 11, None)])
+    course2 = Course('Cálculo', [make_shift('T1', Weekday.MONDAY, 10, 12, None)])
+
+    assert solve_heuristic([Student('A1', [course1, course2])]) == {
+        'A1': {'Lógica': ['T1'], 'Cálculo': ['T1']}
+    }
+
+def test_solve_not_enough_seats() -> None:
+    algebra, _ = make_courses()
+    students = [Student(f'A{i}', [algebra]) for i in range(5)]
+
+    with pytest.raises(HeuristicError):
+        solve_heuristic(students)
@@ -0,0 +1,96 @@
+import datetime
+import gc
+
+import pytest
+
+from scheduler.index.inverted import InvertedIndex, InvertedIndexError
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.student import Student
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+def build_graph() -> tuple[list[Student], Course, Shift, Timeslot]:
+    room = Room('CP1', '0.08', 30)
+    timeslot = Timeslot(Weekday.MONDAY, datetime.time(9, 30), datetime.time(11, 0), room)
+    shift = Shift(ShiftType.T, 1, [timeslot])
+    course = Course('Lógica', [shift, Shift(ShiftType.TP, 1)])
+    return [Student('A1', [course]), Student('A2', [course])], course, shift, timeslot
+
+def test_init_invalid_bucket() -> None:
+    with pytest.raises(InvertedIndexError):
+        InvertedIndex([], 0)
+
+    with pytest.raises(InvertedIndexError):
+        InvertedIndex([], 7)
+
+def test_build() -> None:
+    students, course, shift, timeslot = build_graph()
+    index = InvertedIndex(students + [students[0]])
+
+    assert index.students == students
+    assert index.course_students(course) == students
+    assert index.shift_courses(shift) == [course]
+    assert index.room_timeslots('CP1 0.08') == [timeslot]
+    assert index.room_timeslots('CP2 0.01') == []
+
+def test_not_indexed() -> None:
+    index = InvertedIndex(build_graph()[0])
+
+    with pytest.raises(InvertedIndexError):
+        index.course_students(Course('Lógica'))
+    with pytest.raises(InvertedIndexError):
+        index.shift_courses(Shift(ShiftType.T, 1))
+
+@pytest.mark.parametrize('bucket_minutes', [15, 60, 24 * 60])
+def test_active_timeslots(bucket_minutes: int) -> None:
+    students, _, _, timeslot = build_graph()
+    index = InvertedIndex(students, bucket_minutes)
+
+    assert index.active_timeslots(Weekday.MONDAY, datetime.time(9, 30)) == [timeslot]
+    assert index.active_timeslots(Weekday.MONDAY, datetime.time(10, 59, 59)) == [timeslot]
+    assert index.active_timeslots(Weekday.MONDAY, datetime.time(9, 29)) == []
+    assert index.active_timeslots(Weekday.MONDAY, datetime.time(11, 0)) == []
+    assert index.active_timeslots(Weekday.TUESDAY, datetime.time(10, 0)) == []
+
+def test_incremental() -> None:
+    students, course, shift, _ = build_graph()
+    index = InvertedIndex(students)
+
+    other_course = Course('Álgebra')
+    students[0].add_course(other_course)
+    assert index.course_students(other_course) == [students[0]]
+
+    other_shift = Shift(ShiftType.PL, 1)
+    other_course.add_shift(other_shift)
+    assert index.shift_courses(other_shift) == [other_course]
+
+    room = Room('CP2', '1')
+    timeslot = Timeslot(Weekday.FRIDAY, datetime.time(14, 0), datetime.time(16, 0), room)
+    other_shift.add_timeslot(timeslot)
+    assert index.room_timeslots('CP2 1') == [timeslot]
+    assert index.active_timeslots(Weekday.FRIDAY, datetime.time(15, 0)) == [timeslot]
+
+    student = Student('A3', [course])
+    assert index.course_students(course) == students
+    index.add_student(student)
+    assert index.course_students(course) == students + [student]
+
+def test_shared_shift() -> None:
+    students, course, shift, timeslot = build_graph()
+    other_course = Course('Cálculo', [shift])
+    students[1].add_course(other_course)
+    index = InvertedIndex(students)
+
+    assert index.shift_courses(shift) == [course, other_course]
+    assert index.room_timeslots('CP1 0.08') == [timeslot]
+
+def test_observers_released() -> None:
+    students, course, _, _ = build_graph()
+    InvertedIndex(students)
+    gc.collect()
+
+    # The index is no longer alive, and isn't notified
+    students[0].add_course(Course('Álgebra'))
+    course.add_shift(Shift(ShiftType.PL, 1))
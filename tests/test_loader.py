@@ -0,0 +1,152 @@
+import datetime
+import json
+import pathlib
+
+import pytest
+
+from scheduler.io.loader import LoadStatistics, Loader, LoaderError, read_rows
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+ROOMS = [
+    {'building': 'CP1', 'room': '0.08', 'capacity': '30'},
+    {'building': 'CP2', 'room': '1.01', 'capacity': ''}
+]
+
+TIMESLOTS = [
+    {
+        'course': 'Lógica', 'shift': 'T1', 'day': 'Monday', 'start': '09:00', 'end': '11:00',
+        'building': 'CP1', 'room': '0.08'
+    },
+    {
+        'course': 'Lógica', 'shift': 'T1', 'day': 'Friday', 'start': '09:00', 'end': '10:00',
+        'building': 'CP2', 'room': '1.01'
+    },
+    {
+        'course': 'Lógica', 'shift': 'TP2', 'day': 'Monday', 'start': '14:00', 'end': '16:00',
+        'building': 'CP1', 'room': '0.08'
+    }
+]
+
+ENROLLMENTS = [
+    {'student': 'A100', 'course': 'Lógica'},
+    {'student': 'A101', 'course': 'Lógica'},
+    {'student': 'A101', 'course': 'Álgebra Linear'}
+]
+
+def test_read_rows_csv(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'enrollments.csv'
+    path.write_text('student,course\nA100,Lógica\nA101,Álgebra Linear\n', encoding='utf-8')
+
+    assert list(read_rows(path)) == [
+        {'student': 'A100', 'course': 'Lógica'},
+        {'student': 'A101', 'course': 'Álgebra Linear'}
+    ]
+
+def test_read_rows_json(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'enrollments.json'
+    path.write_text(json.dumps(ENROLLMENTS), encoding='utf-8')
+
+    assert list(read_rows(path)) == ENROLLMENTS
+
+def test_read_rows_json_lines(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'enrollments.jsonl'
+    path.write_text('\n'.join(json.dumps(row) for row in ENROLLMENTS) + '\n\n', encoding='utf-8')
+
+    assert list(read_rows(path)) == ENROLLMENTS
+
+def test_read_rows_invalid_json(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / 'enrollments.json'
+    path.write_text('{"student": "A100"}', encoding='utf-8')
+
+    with pytest.raises(LoaderError):
+        list(read_rows(path))
+
+def test_read_rows_invalid_extension(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(LoaderError):
+        list(read_rows(tmp_path / 'enrollments.xlsx'))
+
+def test_load_graph() -> None:
+    loader = Loader()
+    loader.load_rooms(ROOMS)
+    loader.load_timeslots(TIMESLOTS)
+    loader.load_enrollments(ENROLLMENTS)
+
+    room1 = Room('CP1', '0.08', 30)
+    room2 = Room('CP2', '1.01')
+    assert loader.rooms == {'CP1 0.08': room1, 'CP2 1.01': room2}
+
+    assert list(loader.courses) == ['Lógica', 'Álgebra Linear']
+    assert loader.courses['Lógica'].shifts == {
+        'T1': Shift(ShiftType.T, 1, [
+            Timeslot(Weekday.MONDAY, datetime.time(9), datetime.time(11), room1),
+            Timeslot(Weekday.FRIDAY, datetime.time(9), datetime.time(10), room2)
+        ]),
+        'TP2': Shift(ShiftType.TP, 2, [
+            Timeslot(Weekday.MONDAY, datetime.time(14), datetime.time(16), room1)
+        ])
+    }
+
+    assert list(loader.students) == ['A100', 'A101']
+    assert list(loader.students['A101'].courses) == ['Lógica', 'Álgebra Linear']
+
+def test_load_non_canonical_shift_name() -> None:
+    loader = Loader()
+    loader.load_timeslots([{**TIMESLOTS[0], 'shift': 'T01'}, {**TIMESLOTS[1], 'shift': 'T01'}])
+
+    shifts = loader.courses['Lógica'].shifts
+    assert list(shifts) == ['T1']
+    assert len(shifts['T1'].timeslots) == 2
+
+def test_load_shared_objects() -> None:
+    loader = Loader()
+    loader.load_enrollments(ENROLLMENTS)
+    loader.load_timeslots(TIMESLOTS)
+    loader.load_rooms(ROOMS)
+
+    course = loader.courses['Lógica']
+    assert loader.students['A100'].courses['Lógica'] is course
+    assert loader.students['A101'].courses['Lógica'] is course
+
+    room = loader.rooms['CP1 0.08']
+    assert course.shifts['T1'].timeslots[0].room is room
+    assert course.shifts['TP2'].timeslots[0].room is room
+    assert course.shifts['TP2'].capacity == 30
+
+def test_load_statistics() -> None:
+    loader = Loader()
+    loader.load_rooms(ROOMS)
+    loader.load_enrollments(ENROLLMENTS)
+
+    assert loader.statistics.rows == len(ROOMS) + len(ENROLLMENTS)
+    assert loader.statistics.seconds >= 0
+
+def test_load_invalid_missing_column() -> None:
+    with pytest.raises(LoaderError, match='Row 1'):
+        Loader().load_enrollments([{'student': 'A100'}])
+
+def test_load_invalid_duplicate_enrollment() -> None:
+    with pytest.raises(LoaderError, match='Row 2'):
+        Loader().load_enrollments([ENROLLMENTS[0], ENROLLMENTS[0]])
+
+def test_load_invalid_overlapping_timeslots() -> None:
+    with pytest.raises(LoaderError):
+        Loader().load_timeslots([TIMESLOTS[0], TIMESLOTS[0]])
+
+def test_load_invalid_shift_name() -> None:
+    with pytest.raises(LoaderError):
+        Loader().load_timeslots([{**TIMESLOTS[0], 'shift': 'X1'}])
+
+def test_load_invalid_capacity() -> None:
+    with pytest.raises(LoaderError):
+        Loader().load_rooms([{'building': 'CP1', 'room': '0.08', 'capacity': '-1'}])
+
+def test_load_invalid_conflicting_capacity() -> None:
+    with pytest.raises(LoaderError):
+        Loader().load_rooms([ROOMS[0], {**ROOMS[0], 'capacity': '40'}])
+
+def test_statistics_rows_per_second() -> None:
+    assert LoadStatistics(1000, 0.5).rows_per_second == 2000.0
+    assert LoadStatistics().rows_per_second == 0.0
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from scheduler.solver.model import Model, ModelError
+from scheduler.types.course import Course
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_shift
+
+def make_students() -> list[Student]:
+    algebra = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.MONDAY, 9, 11, None),
+        make_shift('TP1', Weekday.TUESDAY, 9, 11, 1),
+        make_shift('TP2', Weekday.TUESDAY, 14, 16, 1)
+    ])
+    calculus = Course('Cálculo', [
+        make_shift('T1', Weekday.MONDAY, 10, 12, None),
+        make_shift('T2', Weekday.WEDNESDAY, 10, 12, None)
+    ])
+
+    return [
+        Student('A100', [algebra, calculus]),
+        Student('A101', [algebra])
+    ]
+
+def test_dimensions() -> None:
+    model = Model(make_students())
+
+    # Variables: 3 + 2 for A100, 3 for A101
+    # Constraints: 3 + 2 type rows, 2 capacity rows, 1 overlap row (A100, Monday 10:00)
+    assert model.constraints.shape == (8, 8)
+    assert len(model.objective) == 8
+    assert list(model.variable_students) == [0, 0, 0, 0, 0, 1, 1, 1]
+    assert list(model.variable_courses) == [0, 0, 0, 1, 1, 0, 0, 0]
+    assert list(model.variable_shifts) == [0, 1, 2, 3, 4, 0, 1, 2]
+
+def test_empty() -> None:
+    model = Model([])
+
+    assert model.constraints.shape == (0, 0)
+    assert model.solve() == {}
+
+def test_solve() -> None:
+    assignment = Model(make_students()).solve()
+
+    assert assignment['A100']['Álgebra Linear'][0] == 'T1'
+    assert assignment['A100']['Cálculo'] == ['T2']
+    assert assignment['A101']['Álgebra Linear'][0] == 'T1'
+    assert {assignment['A100']['Álgebra Linear'][1], assignment['A101']['Álgebra Linear'][1]} == {
+        'TP1',
+        'TP2'
+    }
+
+def test_solve_infeasible_capacity() -> None:
+    students = make_students()
+    students.append(Student('A102', [students[1].courses['Álgebra Linear']]))
+
+    with pytest.raises(ModelError):
+        Model(students).solve()
+
+def test_solve_infeasible_overlap() -> None:
+    students = make_students()
+    students[0].courses['Cálculo'].shifts['T2'].timeslots[0].room.capacity = None
+    students.append(Student('A102', [
+        Course('Lógica', [make_shift('PL1', Weekday.MONDAY, 9, 10, None)]),
+        students[0].courses['Álgebra Linear']
+    ]))
+
+    with pytest.raises(ModelError):
+        Model(students[1:]).solve()
+
+def test_solve_soft_overlaps() -> None:
+    course = Course('Lógica', [make_shift('PL1', Weekday.MONDAY, 9, 10, None)])
+    students = make_students()
+    students.append(Student('A102', [course, students[0].courses['Cálculo']]))
+    students.append(Student('A103', [course, students[0].courses['Álgebra Linear']]))
+
+    with pytest.raises(ModelError):
+        Model(students[2:]).solve()
+
+    model = Model(students[2:], soft_overlaps=True)
+    assignment = model.solve()
+    assert assignment['A102']['Lógica'] == ['PL1']
+    assert assignment['A103']['Álgebra Linear'][0] == 'T1'
+
+def test_same_type_overlaps_skipped() -> None:
+    course = Course('Lógica', [
+        make_shift('PL1', Weekday.MONDAY, 9, 11, None),
+        make_shift('PL2', Weekday.MONDAY, 9, 11, None)
+    ])
+    model = Model([Student('A100', [course])])
+
+    assert model.constraints.shape == (1, 2)
+
+def test_decode_invalid() -> None:
+    with pytest.raises(ModelError):
+        Model(make_students()).decode(np.zeros(3))
@@ -0,0 +1,112 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from scheduler.solver.assignment import assigned_shifts
+from scheduler.solver.model import ModelError
+from scheduler.solver.patterns import PatternCache, PatternError, PatternModel, enumerate_patterns
+from scheduler.types.course import Course
+from scheduler.types.shift import ShiftType
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_courses, make_shift
+
+def test_enumerate() -> None:
+    algebra, calculus = make_courses()
+    patterns = enumerate_patterns([calculus, algebra])
+
+    assert patterns.groups == [
+        (calculus, ShiftType.T),
+        (calculus, ShiftType.TP),
+        (algebra, ShiftType.T),
+        (algebra, ShiftType.TP)
+    ]
+    assert sorted(
+        tuple(shift.name for shift in pattern[1::2]) for pattern in patterns.patterns
+    ) == [('TP1', 'TP2'), ('TP2', 'TP1'), ('TP2', 'TP2')]
+
+    for pattern in patterns.patterns:
+        assert not any(a.overlaps(b) for a, b in itertools.combinations(pattern, 2))
+
+def test_enumerate_empty() -> None:
+    assert enumerate_patterns([]).patterns == [()]
+    assert enumerate_patterns([Course('Empty')]).patterns == [()]
+
+def test_enumerate_infeasible() -> None:
+    course1 = Course('A', [make_shift('T1', Weekday.MONDAY, 9, 11, None)])
+    course2 = Course('B', [make_shift('T1', Weekday.MONDAY, 10, 12, None)])
+    assert len(enumerate_patterns([course1, course2])) == 0
+
+def test_enumerate_limit() -> None:
+    algebra, calculus = make_courses()
+
+    with pytest.raises(PatternError):
+        enumerate_patterns([algebra, calculus], 2)
+
+def test_cache() -> None:
+    algebra, calculus = make_courses()
+    cache = PatternCache()
+
+    patterns = cache.patterns([algebra, calculus])
+    assert cache.patterns([calculus, algebra]) is patterns
+    assert cache.patterns([algebra]) is not patterns
+    assert len(cache) == 2
+
+def test_cache_no_shifts() -> None:
+    # Courses without shifts aren't referenced by their patterns, but must still keep their ids
+    cache = PatternCache()
+    for _ in range(10):
+        cache.patterns([Course('Álgebra Linear', [])])
+
+    assert len(cache) == 10
+
+def test_model() -> None:
+    algebra, calculus = make_courses()
+    students = [Student(f'A{i}', [algebra, calculus]) for i in range(5)] + [
+        Student('A5', [calculus]),
+        Student('A6', [calculus, algebra])
+    ]
+
+    model = PatternModel(students)
+    assert len(model.classes) == 2
+    assignment = model.solve()
+    assert set(assignment) == {student.number for student in students}
+
+    occupation: dict[int, int] = {}
+    for student in students:
+        shifts = [shift for _, shift in assigned_shifts(assignment, [student])]
+        assert len(shifts) == 2 * len(student.courses)
+        assert not any(a.overlaps(b) for a, b in itertools.combinations(shifts, 2))
+
+        for shift in shifts:
+            occupation[id(shift)] = occupation.get(id(shift), 0) + 1
+
+    for course in (algebra, calculus):
+        for shift in course.shifts.values():
+            assert shift.capacity is None or occupation.get(id(shift), 0) <= shift.capacity
+
+def test_model_infeasible() -> None:
+    algebra, calculus = make_courses()
+    students = [Student(f'A{i}', [algebra, calculus]) for i in range(9)]
+
+    with pytest.raises(ModelError):
+        PatternModel(students).solve()
+
+def test_model_no_patterns() -> None:
+    course1 = Course('A', [make_shift('T1', Weekday.MONDAY, 9, 11, None)])
+    course2 = Course('B', [make_shift('T1', Weekday.MONDAY, 10, 12, None)])
+
+    with pytest.raises(ModelError):
+        PatternModel([Student('A1', [course1, course2])]).solve()
+
+def test_model_empty() -> None:
+    assert PatternModel([]).solve() == {}
+    assert PatternModel([Student('A1')]).solve() == {'A1': {}}
+
+def test_expand_wrong_size() -> None:
+    algebra, calculus = make_courses()
+    model = PatternModel([Student('A1', [algebra])])
+
+    with pytest.raises(ModelError):
+        model.expand(np.zeros(model.constraints.shape[1] + 1))
@@ -1,4 +1,5 @@
 import copy
+import pickle
 
 import pytest
 
@@ -111,3 +112,10 @@ def test_repr_valid_capacity() -> None:
 def test_repr_invalid_capacity() -> None:
     room = Room('Ed 7', '1.04')
     assert repr(room) == 'Room(building=\'Ed 7\', name_in_building=\'1.04\', capacity=None)'
+
+def test_slots() -> None:
+    assert not hasattr(Room('Ed 7', '1.04'), '__dict__')
+
+def test_pickle() -> None:
+    room = Room('Ed 7', '1.04', 15)
+    assert pickle.loads(pickle.dumps(room)) == room
@@ -0,0 +1,125 @@
+import pytest
+
+from scheduler.solver.assignment import Assignment
+from scheduler.solver.heuristic import solve_heuristic
+from scheduler.solver.search import LocalSearch, LocalSearchError
+from scheduler.types.course import Course
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_shift
+
+def make_students() -> list[Student]:
+    algebra = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.MONDAY, 9, 11, None),
+        make_shift('TP1', Weekday.TUESDAY, 9, 11, 2),
+        make_shift('TP2', Weekday.WEDNESDAY, 9, 11, 2)
+    ])
+    calculus = Course('Cálculo', [
+        make_shift('T1', Weekday.MONDAY, 14, 16, None),
+        make_shift('TP1', Weekday.TUESDAY, 10, 12, 3),
+        make_shift('TP2', Weekday.THURSDAY, 9, 11, 1)
+    ])
+
+    return [
+        Student('A1', [algebra, calculus]),
+        Student('A2', [algebra, calculus]),
+        Student('A3', [algebra, calculus]),
+        Student('A4', [calculus])
+    ]
+
+def make_assignment() -> Assignment:
+    return {
+        'A1': {'Álgebra Linear': ['T1', 'TP2'], 'Cálculo': ['T1', 'TP1']},
+        'A2': {'Álgebra Linear': ['T1', 'TP1'], 'Cálculo': ['T1', 'TP1']},
+        'A3': {'Álgebra Linear': ['T1', 'TP1'], 'Cálculo': ['T1', 'TP1']},
+        'A4': {'Cálculo': ['T1', 'TP2']}
+    }
+
+def test_cost() -> None:
+    assert LocalSearch(make_students(), make_assignment()).cost == 2
+
+def test_assignment_unchanged() -> None:
+    assignment = make_assignment()
+    assert LocalSearch(make_students(), assignment).assignment == assignment
+
+def test_run_swap() -> None:
+    students = make_students()
+    search = LocalSearch(students, make_assignment())
+    search.run()
+
+    assert search.cost == 0
+    assignment = search.assignment
+    assert sorted(assignment[s]['Álgebra Linear'][1] for s in ('A1', 'A2', 'A3')) == [
+        'TP1',
+        'TP2',
+        'TP2'
+    ]
+    assert assignment['A4']['Cálculo'] == ['T1', 'TP1']
+
+def test_run_after_heuristic() -> None:
+    students = make_students()
+    search = LocalSearch(students, solve_heuristic(students), seed=1)
+    search.run(iterations=100)
+
+    assert search.cost == 0
+
+def test_run_iterations_zero() -> None:
+    search = LocalSearch(make_students(), make_assignment())
+    search.run(iterations=0)
+
+    assert search.cost == 2
+
+def test_invalid_incomplete() -> None:
+    assignment = make_assignment()
+    assignment['A4'] = {}
+
+    with pytest.raises(LocalSearchError):
+        LocalSearch(make_students(), assignment)
+
+def test_invalid_unknown_shift() -> None:
+    assignment = make_assignment()
+    assignment['A4'] = {'Cálculo': ['T1', 'TP5']}
+
+    with pytest.raises(LocalSearchError):
+        LocalSearch(make_students(), assignment)
+
+def test_invalid_capacity() -> None:
+    assignment = make_assignment()
+    assignment['A1']['Cálculo'] = ['T1', 'TP2']
+
+    with pytest.raises(LocalSearchError):
+        LocalSearch(make_students(), assignment)
+
+def test_run_rejected_repair() -> None:
+    # A1's overlap on Monday can't be avoided, so repairs that move it to overlapping practical
+    # shifts are rejected and must restore each student's own shifts
+    algebra = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.MONDAY, 9, 11, None),
+        make_shift('TP1', Weekday.TUESDAY, 9, 11, 1),
+        make_shift('TP2', Weekday.WEDNESDAY, 9, 11, 1)
+    ])
+    calculus = Course('Cálculo', [
+        make_shift('T1', Weekday.MONDAY, 10, 12, None),
+        make_shift('TP1', Weekday.TUESDAY, 10, 12, 1),
+        make_shift('TP2', Weekday.WEDNESDAY, 10, 12, 1)
+    ])
+    students = [
+        Student('A1', [algebra, calculus]),
+        Student('A2', [algebra]),
+        Student('A3', [calculus])
+    ]
+    assignment: Assignment = {
+        'A1': {'Álgebra Linear': ['T1', 'TP1'], 'Cálculo': ['T1', 'TP2']},
+        'A2': {'Álgebra Linear': ['T1', 'TP2']},
+        'A3': {'Cálculo': ['T1', 'TP1']}
+    }
+
+    search = LocalSearch(students, assignment)
+    search.run(iterations=20)
+
+    assert search.cost == 1
+    assert {number: list(courses) for number, courses in search.assignment.items()} == {
+        'A1': ['Álgebra Linear', 'Cálculo'],
+        'A2': ['Álgebra Linear'],
+        'A3': ['Cálculo']
+    }
@@ -0,0 +1,159 @@
+import asyncio
+import datetime
+import json
+import socket
+
+import pytest
+
+from scheduler.service import QueryService, QueryServiceError, serve
+from scheduler.solver.assignment import Assignment
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.student import Student
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+def build_service(cache_size: int = 1024) -> QueryService:
+    room_1 = Room('CP1', '0.08', 30)
+    room_2 = Room('CP2', '1.01')
+    lógica = Course('Lógica', [
+        Shift(ShiftType.T, 1, [
+            Timeslot(Weekday.MONDAY, datetime.time(14, 0), datetime.time(16, 0), room_1),
+            Timeslot(Weekday.FRIDAY, datetime.time(9, 0), datetime.time(10, 0), room_2)
+        ]),
+        Shift(ShiftType.TP, 1, [
+            Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), room_1)
+        ]),
+        Shift(ShiftType.TP, 2, [
+            Timeslot(Weekday.TUESDAY, datetime.time(9, 0), datetime.time(11, 0), room_1)
+        ])
+    ])
+
+    students = [Student('A1', [lógica]), Student('A2', [lógica]), Student('A3', [lógica])]
+    assignment: Assignment = {
+        'A1': {'Lógica': ['T1', 'TP1']},
+        'A2': {'Lógica': ['T1', 'TP2']},
+        'A3': {'Lógica': ['T1', 'TP1']}
+    }
+    return QueryService(students, assignment, datetime.date(2025, 9, 15), cache_size)
+
+def test_student_shifts() -> None:
+    service = build_service()
+    assert service.student_shifts('A2') == {'Lógica': ['T1', 'TP2']}
+
+    with pytest.raises(QueryServiceError):
+        service.student_shifts('A4')
+
+def test_shift_students() -> None:
+    service = build_service()
+    assert service.shift_students('Lógica', 'T1') == ['A1', 'A2', 'A3']
+    assert service.shift_students('Lógica', 'TP1') == ['A1', 'A3']
+
+    with pytest.raises(QueryServiceError):
+        service.shift_students('Lógica', 'PL1')
+
+def test_room_classes() -> None:
+    service = build_service()
+    assert [cls[1] for cls in service.room_classes('CP1 0.08')] == ['TP1', 'T1', 'TP2']
+    assert [cls[1] for cls in service.room_classes('CP1 0.08', Weekday.MONDAY)] == ['TP1', 'T1']
+    assert service.room_classes('CP1 0.08', Weekday.MONDAY, datetime.time(14, 0)) == [
+        ('Lógica', 'T1', Weekday.MONDAY, datetime.time(14, 0), datetime.time(16, 0), 'CP1 0.08')
+    ]
+    assert service.room_classes('CP1 0.08', Weekday.MONDAY, datetime.time(16, 0)) == []
+
+    with pytest.raises(QueryServiceError):
+        service.room_classes('CP3 0.01')
+
+def test_timetable_cache() -> None:
+    service = build_service(cache_size=1)
+    timetable = service.timetable('A1', 'csv')
+
+    assert service.timetable('A1', 'csv') is timetable
+    service.timetable('A2', 'csv')
+    assert service.timetable('A1', 'csv') is not timetable
+    assert service.timetable('A1', 'csv') == timetable
+
+    with pytest.raises(QueryServiceError):
+        service.timetable('A1', 'pdf')
+    with pytest.raises(QueryServiceError):
+        service.timetable('A4')
+
+def test_invalid_cache_size() -> None:
+    with pytest.raises(QueryServiceError):
+        build_service(cache_size=0)
+
+def test_handle() -> None:
+    service = build_service()
+
+    assert service.handle('/students/A1') == \
+        (200, 'application/json', '{"Lógica": ["T1", "TP1"]}')
+    assert service.handle('/courses/L%C3%B3gica/shifts/TP2') == \
+        (200, 'application/json', '["A2"]')
+    assert json.loads(service.handle('/rooms/CP2%201.01?day=Friday&time=09:30')[2]) == [
+        {'course': 'Lógica', 'shift': 'T1', 'day': 'Friday', 'start': '09:00', 'end': '10:00'}
+    ]
+    assert service.handle('/students/A1/timetable?format=ics')[1] == 'text/calendar'
+    assert service.handle('/students/A1/timetable?format=pdf')[0] == 400
+    assert service.handle('/students/A4')[0] == 404
+    assert service.handle('/rooms/CP2%201.01?day=Sunday')[0] == 400
+    assert service.handle('/teachers/A1')[0] == 404
+
+def serve_requests(*requests: bytes) -> bytes:
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+        port = sock.getsockname()[1]
+
+    async def query() -> bytes:
+        task = asyncio.create_task(serve(build_service(), 'localhost', port))
+        for _ in range(100):
+            try:
+                reader, writer = await asyncio.open_connection('localhost', port)
+                break
+            except OSError:
+                await asyncio.sleep(0.01)
+
+        for request in requests:
+            writer.write(request)
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+
+        task.cancel()
+        return response
+
+    return asyncio.run(query())
+
+def test_serve() -> None:
+    response = serve_requests(
+        b'GET /students/A1 HTTP/1.1\r\nHost: localhost\r\n\r\n',
+        b'POST /students/A1 HTTP/1.1\r\nConnection: close\r\n\r\n'
+    )
+    assert response.startswith(b'HTTP/1.1 200 OK\r\n')
+    assert '{"Lógica": ["T1", "TP1"]}'.encode('utf-8') in response
+    assert b'HTTP/1.1 405 Method Not Allowed\r\n' in response
+
+def test_serve_http_1_0() -> None:
+    response = serve_requests(b'GET /students/A1 HTTP/1.0\r\n\r\n')
+    assert response.startswith(b'HTTP/1.1 200 OK\r\n')
+    assert b'Connection: close\r\n' in response
+
+    response = serve_requests(
+        b'GET /students/A1 HTTP/1.0\r\nConnection: keep-alive\r\n\r\n',
+        b'GET /students/A2 HTTP/1.0\r\n\r\n'
+    )
+    assert response.count(b'HTTP/1.1 200 OK\r\n') == 2
+
+def test_serve_body() -> None:
+    response = serve_requests(
+        b'POST /students/A1 HTTP/1.1\r\nContent-Length: 14\r\n\r\nGET / HTTP/1.1',
+        b'GET /students/A1 HTTP/1.1\r\nConnection: close\r\n\r\n'
+    )
+    assert response.startswith(b'HTTP/1.1 405 Method Not Allowed\r\n')
+    assert response.count(b'HTTP/1.1 ') == 2
+    assert b'HTTP/1.1 200 OK\r\n' in response
+
+    response = serve_requests(
+        b'POST /students/A1 HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n'
+    )
+    assert response.startswith(b'HTTP/1.1 400 Bad Request\r\n')
+    assert b'Connection: close\r\n' in response
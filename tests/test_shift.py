@@ -1,5 +1,6 @@
 import copy
 import datetime
+import pickle
 import typing
 
 import pytest
@@ -164,6 +165,23 @@ def test_parse_name_invalid() -> None:
     with pytest.raises(ShiftError):
         Shift.parse_name('2')
 
+    with pytest.raises(ShiftError):
+        Shift.parse_name('T1x')
+
+def test_parse_names_valid() -> None:
+    types, numbers = Shift.parse_names(['T2', 'TP1', 'PL10', 'OT5'])
+    assert [list(ShiftType)[t] for t in types] == list(ShiftType)
+    assert numbers.tolist() == [2, 1, 10, 5]
+
+def test_parse_names_empty() -> None:
+    types, numbers = Shift.parse_names([])
+    assert len(types) == len(numbers) == 0
+
+def test_parse_names_invalid() -> None:
+    for name in ('T', 'TL2', '2', 'T2x', 'PT1'):
+        with pytest.raises(ShiftError):
+            Shift.parse_names(['T1', name])
+
 def test_eq_none() -> None:
     assert Shift(ShiftType.T, 1, []) != None
 
@@ -235,3 +253,116 @@ def test_repr() -> None:
     shift = Shift(ShiftType.TP, 2, [slot])
 
     assert repr(shift) == f'Shift(shift_type=ShiftType.TP, number=2, timeslots=[{slot!r}])'
+
+def test_add_timeslot_valid_unordered() -> None:
+    slot1 = Timeslot(Weekday.MONDAY, datetime.time(14, 0), datetime.time(16, 0), Room('Ed 7', 'A1'))
+    slot2 = Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), Room('Ed 7', 'A1'))
+    slot3 = Timeslot(Weekday.MONDAY, datetime.time(11, 0), datetime.time(14, 0), Room('Ed 7', 'A1'))
+    shift = Shift(ShiftType.PL, 1, [slot1, slot2, slot3])
+
+    assert shift.timeslots == [slot1, slot2, slot3]
+
+def test_add_timeslot_invalid_between() -> None:
+    slot1 = Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), Room('Ed 7', 'A1'))
+    slot2 = Timeslot(Weekday.MONDAY, datetime.time(14, 0), datetime.time(16, 0), Room('Ed 7', 'A1'))
+    slot3 = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(15, 0), Room('Ed 7', 'A1'))
+    shift = Shift(ShiftType.PL, 1, [slot1, slot2])
+
+    with pytest.raises(ShiftError):
+        shift.add_timeslot(slot3)
+
+    assert shift.timeslots == [slot1, slot2]
+
+def test_overlaps_multiple_same_day_interleaved() -> None:
+    room = Room('Ed 7', 'A1')
+    slot1 = Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(10, 0), room)
+    slot2 = Timeslot(Weekday.MONDAY, datetime.time(12, 0), datetime.time(13, 0), room)
+    slot3 = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(12, 0), room)
+    slot4 = Timeslot(Weekday.MONDAY, datetime.time(13, 0), datetime.time(14, 0), room)
+    slot5 = Timeslot(Weekday.MONDAY, datetime.time(12, 30), datetime.time(15, 0), room)
+
+    shift1 = Shift(ShiftType.PL, 1, [slot2, slot1])
+    shift2 = Shift(ShiftType.T, 1, [slot4, slot3])
+    shift3 = Shift(ShiftType.T, 2, [slot5])
+
+    assert not shift1.overlaps(shift2)
+    assert not shift2.overlaps(shift1)
+    assert shift1.overlaps(shift3)
+    assert shift3.overlaps(shift1)
+
+def test_slots() -> None:
+    assert not hasattr(Shift(ShiftType.TP, 2), '__dict__')
+
+def test_capacity_room_changed() -> None:
+    room1 = Room('Ed 7', 'A1', 50)
+    room2 = Room('Ed 7', 'A2', 60)
+    slot1 = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(13, 0), room1)
+    slot2 = Timeslot(Weekday.FRIDAY, datetime.time(14, 0), datetime.time(16, 0), room2)
+    shift = Shift(ShiftType.OT, 2, [slot1, slot2])
+    assert shift.capacity == 50
+
+    room2.capacity = 40
+    assert shift.capacity == 40
+
+    room1.capacity = None
+    assert shift.capacity is None
+
+def test_capacity_timeslot_added() -> None:
+    slot1 = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(13, 0), Room('A', '1', 50))
+    slot2 = Timeslot(Weekday.FRIDAY, datetime.time(14, 0), datetime.time(16, 0), Room('A', '2', 20))
+    shift = Shift(ShiftType.OT, 2, [slot1])
+    assert shift.capacity == 50
+
+    shift.add_timeslot(slot2)
+    assert shift.capacity == 20
+
+def test_pickle() -> None:
+    room = Room('Ed 7', 'A1', 50)
+    slot = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(13, 0), room)
+    shift = pickle.loads(pickle.dumps(Shift(ShiftType.OT, 2, [slot])))
+    assert shift == Shift(ShiftType.OT, 2, [slot])
+
+    shift.timeslots[0].room.capacity = 10
+    assert shift.capacity == 10
+
+def test_freeze() -> None:
+    room = Room('Ed 7', 'A1', 50)
+    slot = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(13, 0), room)
+    shift = Shift(ShiftType.OT, 2, [slot])
+    frozen = shift.freeze()
+
+    assert not shift.frozen
+    assert frozen.frozen
+    assert frozen == shift
+    assert hash(frozen) == hash(shift)
+    assert frozen.freeze() is frozen
+    assert frozen.overlaps(shift)
+
+    other_slot = Timeslot(Weekday.FRIDAY, datetime.time(10, 0), datetime.time(13, 0), room)
+    assert frozen != Shift(ShiftType.OT, 2, [other_slot]).freeze()
+
+def test_freeze_immutable() -> None:
+    frozen = Shift(ShiftType.OT, 2).freeze()
+    slot = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(13, 0), Room('CP1', '1'))
+
+    with pytest.raises(ShiftError):
+        frozen.add_timeslot(slot)
+
+def test_freeze_capacity() -> None:
+    room = Room('Ed 7', 'A1', 50)
+    slot = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(13, 0), room)
+    shift = Shift(ShiftType.OT, 2, [slot])
+    frozen = shift.freeze()
+
+    room.capacity = 10
+    assert shift.capacity == 10
+    assert frozen.capacity == 50
+
+def test_pickle_frozen() -> None:
+    room = Room('Ed 7', 'A1', 50)
+    slot = Timeslot(Weekday.MONDAY, datetime.time(10, 0), datetime.time(13, 0), room)
+    shift = pickle.loads(pickle.dumps(Shift(ShiftType.OT, 2, [slot]).freeze()))
+
+    assert shift.frozen
+    assert shift == Shift(ShiftType.OT, 2, [slot]).freeze()
+    assert shift.capacity == 50
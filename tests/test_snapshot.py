@@ -0,0 +1,79 @@
+import datetime
+import pathlib
+
+import pytest
+
+from scheduler.io.snapshot import SnapshotError, read_snapshot, write_snapshot
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.student import Student
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+def build_graph() -> tuple[list[Student], Course]:
+    room_1 = Room('CP1', '0.08', 30)
+    room_2 = Room('CP2', '1.01')
+
+    lógica = Course('Lógica', [
+        Shift(ShiftType.T, 1, [
+            Timeslot(Weekday.FRIDAY, datetime.time(9, 0), datetime.time(10, 0), room_2),
+            Timeslot(Weekday.MONDAY, datetime.time(14, 0), datetime.time(16, 0), room_1),
+            Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0, 30), room_1)
+        ]),
+        Shift(ShiftType.TP, 2)
+    ])
+    álgebra = Course('Álgebra Linear', [
+        Shift(ShiftType.PL, 1, [
+            Timeslot(Weekday.TUESDAY, datetime.time(9, 0), datetime.time(11, 0), room_1)
+        ])
+    ])
+    empty = Course('Empty')
+
+    return [Student('A100', [lógica]), Student('A101', [lógica, álgebra])], empty
+
+def test_round_trip(tmp_path: pathlib.Path) -> None:
+    students, empty = build_graph()
+    write_snapshot(tmp_path / 'graph.snapshot', students, [empty])
+    loaded_students, loaded_courses = read_snapshot(tmp_path / 'graph.snapshot')
+
+    assert loaded_students == students
+    assert [course.name for course in loaded_courses] == ['Lógica', 'Álgebra Linear', 'Empty']
+
+def test_shared_objects(tmp_path: pathlib.Path) -> None:
+    students, _ = build_graph()
+    write_snapshot(tmp_path / 'graph.snapshot', students)
+    loaded_students, _ = read_snapshot(tmp_path / 'graph.snapshot')
+
+    assert loaded_students[0].courses['Lógica'] is loaded_students[1].courses['Lógica']
+
+    timeslots = loaded_students[1].courses['Lógica'].shifts['T1'].timeslots
+    assert timeslots[1].room is timeslots[2].room
+
+def test_loaded_shifts(tmp_path: pathlib.Path) -> None:
+    students, _ = build_graph()
+    write_snapshot(tmp_path / 'graph.snapshot', students)
+    loaded_students, _ = read_snapshot(tmp_path / 'graph.snapshot')
+
+    shifts = loaded_students[1].courses['Lógica'].shifts
+    assert shifts['T1'].capacity is None
+    assert shifts['T1'].overlaps(shifts['T1'])
+    assert not shifts['T1'].overlaps(shifts['TP2'])
+
+    room = shifts['T1'].timeslots[1].room
+    room.capacity = 20
+    assert loaded_students[1].courses['Álgebra Linear'].shifts['PL1'].capacity == 20
+
+def test_invalid_magic(tmp_path: pathlib.Path) -> None:
+    (tmp_path / 'graph.snapshot').write_bytes(b'student,course\n')
+    with pytest.raises(SnapshotError):
+        read_snapshot(tmp_path / 'graph.snapshot')
+
+def test_truncated(tmp_path: pathlib.Path) -> None:
+    students, _ = build_graph()
+    write_snapshot(tmp_path / 'graph.snapshot', students)
+
+    data = (tmp_path / 'graph.snapshot').read_bytes()
+    (tmp_path / 'graph.snapshot').write_bytes(data[:len(data) // 2])
+    with pytest.raises(SnapshotError):
+        read_snapshot(tmp_path / 'graph.snapshot')
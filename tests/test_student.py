@@ -1,4 +1,5 @@
 import copy
+import pickle
 
 import pytest
 
@@ -142,3 +143,37 @@ def test_repr() -> None:
     student = Student('A100', [course])
     assert repr(student) == \
         f'Student(number=\'A100\', courses={{\'Computação Paralela\': {course}}})'
+
+def test_slots() -> None:
+    assert not hasattr(Student('A100'), '__dict__')
+
+def test_freeze() -> None:
+    course = Course('Computação Paralela', [Shift(ShiftType.T, 1)])
+    student = Student('A100', [course])
+    frozen = student.freeze()
+
+    assert not student.frozen
+    assert frozen.frozen
+    assert frozen.courses['Computação Paralela'].frozen
+    assert frozen == student
+    assert frozen.freeze() is frozen
+    assert frozen != Student('A100').freeze()
+
+    with pytest.raises(StudentError):
+        frozen.add_course(Course('Lógica'))
+
+def test_freeze_memo() -> None:
+    course = Course('Computação Paralela', [Shift(ShiftType.T, 1)])
+    memo: dict[int, object] = {}
+
+    student1 = Student('A100', [course]).freeze(memo)
+    student2 = Student('A101', [course]).freeze(memo)
+    assert student1.courses['Computação Paralela'] is student2.courses['Computação Paralela']
+
+def test_pickle_frozen() -> None:
+    students = [Student('A100', [Course('Lógica')]), Student('A101', [Course('Lógica')])]
+    memo: dict[int, object] = {}
+    frozen = pickle.loads(pickle.dumps([student.freeze(memo) for student in students]))
+
+    assert all(student.frozen for student in frozen)
+    assert frozen == students
@@ -0,0 +1,60 @@
+import datetime
+
+import pytest
+
+from scheduler.index.symbols import GraphSymbols, SymbolTable, SymbolTableError
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.student import Student
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+def test_symbol_table() -> None:
+    room_1 = Room('CP1', '0.08')
+    room_2 = Room('CP2', '1.01')
+    table = SymbolTable([room_1, room_2])
+
+    assert table.add(room_1) == 0
+    assert table.id_of(room_2) == 1
+    assert table[1] is room_2
+    assert list(table) == [room_1, room_2]
+    assert len(table) == 2
+
+def test_symbol_table_identity() -> None:
+    room_1 = Room('CP1', '0.08')
+    room_2 = Room('CP1', '0.08')
+    table = SymbolTable([room_1])
+
+    assert room_1 == room_2
+    assert room_2 not in table
+    assert table.add(room_2) == 1
+
+    with pytest.raises(SymbolTableError):
+        SymbolTable[Room]().id_of(room_1)
+
+def test_graph_symbols() -> None:
+    room_1 = Room('CP1', '0.08')
+    room_2 = Room('CP2', '1.01')
+    t1 = Shift(ShiftType.T, 1, [
+        Timeslot(Weekday.MONDAY, datetime.time(9), datetime.time(11), room_1),
+        Timeslot(Weekday.FRIDAY, datetime.time(9), datetime.time(11), room_2)
+    ])
+    tp1 = Shift(ShiftType.TP, 1, [
+        Timeslot(Weekday.MONDAY, datetime.time(14), datetime.time(16), room_1)
+    ])
+    t1_other = Shift(ShiftType.T, 1)
+    lógica = Course('Lógica', [t1, tp1])
+    cálculo = Course('Cálculo', [t1_other])
+
+    students = [Student('A100', [lógica]), Student('A101', [cálculo, lógica])]
+    symbols = GraphSymbols(students)
+
+    assert list(symbols.students) == students
+    assert list(symbols.courses) == [lógica, cálculo]
+    assert [id(shift) for shift in symbols.shifts] == [id(t1), id(tp1), id(t1_other)]
+    assert list(symbols.rooms) == [room_1, room_2]
+
+    student = Student('A102', [cálculo])
+    assert symbols.add_student(student) == 2
+    assert len(symbols.courses) == 2
@@ -34,6 +34,10 @@ def test_init_invalid_start_equals_end() -> None:
     with pytest.raises(TimeslotError):
         Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(9, 0), room_1)
 
+def test_init_invalid_start_equals_end_seconds() -> None:
+    with pytest.raises(TimeslotError):
+        Timeslot(Weekday.MONDAY, datetime.time(9, 0, 10), datetime.time(9, 0, 50), room_1)
+
 def test_overlaps_same() -> None:
     timeslot = Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), room_1)
     assert timeslot.overlaps(timeslot)
@@ -170,3 +174,21 @@ def test_repr() -> None:
         'end=datetime.time(11, 0), '
         f'room={room_1!r})'
     )
+
+def test_minutes() -> None:
+    timeslot = Timeslot(Weekday.WEDNESDAY, datetime.time(9, 30), datetime.time(11, 0), room_1)
+
+    assert timeslot.start_minute == 2 * 24 * 60 + 9 * 60 + 30
+    assert timeslot.end_minute == 2 * 24 * 60 + 11 * 60
+
+def test_overlaps_same_time_different_day() -> None:
+    timeslot1 = Timeslot(Weekday.MONDAY, datetime.time(0, 0), datetime.time(23, 59), room_1)
+    timeslot2 = Timeslot(Weekday.TUESDAY, datetime.time(0, 0), datetime.time(23, 59), room_1)
+
+    assert not timeslot1.overlaps(timeslot2)
+    assert not timeslot2.overlaps(timeslot1)
+
+def test_slots() -> None:
+    timeslot = Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), room_1)
+
+    assert not hasattr(timeslot, '__dict__')
@@ -0,0 +1,130 @@
+import datetime
+import pathlib
+
+import pytest
+
+from scheduler.io.timetable import (
+    TimetableError,
+    export_timetables,
+    format_timetable,
+    timetables,
+    write_timetable
+)
+from scheduler.solver.assignment import Assignment
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import Shift, ShiftType
+from scheduler.types.student import Student
+from scheduler.types.timeslot import Timeslot
+from scheduler.types.weekday import Weekday
+
+WEEK = datetime.date(2025, 9, 15)
+
+def build_graph() -> tuple[list[Student], Assignment]:
+    room = Room('CP1', '0.08', 30)
+    lógica = Course('Lógica', [
+        Shift(ShiftType.T, 1, [
+            Timeslot(Weekday.FRIDAY, datetime.time(9, 0), datetime.time(10, 0), room),
+            Timeslot(Weekday.MONDAY, datetime.time(14, 0), datetime.time(16, 0), room)
+        ]),
+        Shift(ShiftType.TP, 2, [
+            Timeslot(Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), room)
+        ])
+    ])
+
+    students = [Student(f'A{i}', [lógica]) for i in range(10)]
+    assignment = {student.number: {'Lógica': ['T1', 'TP2']} for student in students}
+    return students, assignment
+
+def test_timetables() -> None:
+    students, assignment = build_graph()
+    number, classes = next(timetables(assignment, students))
+
+    assert number == 'A0'
+    assert classes == [
+        ('Lógica', 'TP2', Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), 'CP1 0.08'),
+        ('Lógica', 'T1', Weekday.MONDAY, datetime.time(14, 0), datetime.time(16, 0), 'CP1 0.08'),
+        ('Lógica', 'T1', Weekday.FRIDAY, datetime.time(9, 0), datetime.time(10, 0), 'CP1 0.08')
+    ]
+
+def test_timetables_missing() -> None:
+    students, _ = build_graph()
+    assert next(timetables({}, students)) == ('A0', [])
+
+def test_format_csv() -> None:
+    students, assignment = build_graph()
+    number, classes = next(timetables(assignment, students))
+
+    assert format_timetable(number, classes, 'csv', WEEK).splitlines() == [
+        'course,shift,day,start,end,room',
+        'Lógica,TP2,Monday,09:00,11:00,CP1 0.08',
+        'Lógica,T1,Monday,14:00,16:00,CP1 0.08',
+        'Lógica,T1,Friday,09:00,10:00,CP1 0.08'
+    ]
+
+def test_format_html() -> None:
+    classes = [('<b>', 'T1', Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), 'CP1')]
+    html = format_timetable('A0', classes, 'html', WEEK)
+
+    assert '<td>&lt;b&gt;</td>' in html
+    assert '<b>' not in html
+
+def test_format_ics() -> None:
+    students, assignment = build_graph()
+    number, classes = next(timetables(assignment, students))
+    ics = format_timetable(number, classes, 'ics', WEEK, 14)
+    lines = ics.split('\r\n')
+
+    assert lines[0] == 'BEGIN:VCALENDAR'
+    assert lines[-2:] == ['END:VCALENDAR', '']
+    assert lines.count('BEGIN:VEVENT') == 3
+    assert 'DTSTART:20250915T090000' in lines
+    assert 'DTEND:20250919T100000' in lines
+    assert 'RRULE:FREQ=WEEKLY;COUNT=14' in lines
+    assert 'SUMMARY:Lógica (TP2)' in lines
+
+def test_format_ics_folding() -> None:
+    classes = [('a,' * 100, 'T1', Weekday.MONDAY, datetime.time(9, 0), datetime.time(11, 0), 'CP1')]
+    lines = format_timetable('A0', classes, 'ics', WEEK).split('\r\n')
+
+    assert all(len(line.encode('utf-8')) <= 75 for line in lines)
+    summary = next(i for i, line in enumerate(lines) if line.startswith('SUMMARY:'))
+    assert lines[summary + 1].startswith(' ')
+    assert 'SUMMARY:a\\,a\\,' in lines[summary]
+
+def test_format_unknown() -> None:
+    with pytest.raises(TimetableError):
+        format_timetable('A0', [], 'pdf', WEEK)
+
+def test_write_invalid_number(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(TimetableError):
+        write_timetable(tmp_path, '../A0', [], 'csv', WEEK)
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_export(tmp_path: pathlib.Path, max_workers: int) -> None:
+    students, assignment = build_graph()
+    written = export_timetables(
+        tmp_path / 'timetables',
+        assignment,
+        students,
+        'csv',
+        WEEK,
+        max_workers=max_workers,
+        batch_size=3
+    )
+
+    assert written == 10
+    assert sorted(path.name for path in (tmp_path / 'timetables').iterdir()) == \
+        sorted(f'A{i}.csv' for i in range(10))
+
+    number, classes = list(timetables(assignment, students))[5]
+    contents = (tmp_path / 'timetables' / 'A5.csv').read_text(encoding='utf-8')
+    assert contents == format_timetable(number, classes, 'csv', WEEK)
+
+def test_export_invalid(tmp_path: pathlib.Path) -> None:
+    students, assignment = build_graph()
+
+    with pytest.raises(TimetableError):
+        export_timetables(tmp_path, assignment, students, 'pdf')
+    with pytest.raises(TimetableError):
+        export_timetables(tmp_path, assignment, students, batch_size=0)
@@ -0,0 +1,93 @@
+from collections.abc import Iterator
+import json
+import pathlib
+import tracemalloc
+
+import pytest
+
+from scheduler.tracing import Tracer, TracerError, count, get_tracer, set_tracer, span, traced
+
+@pytest.fixture
+def tracer() -> Iterator[Tracer]:
+    tracer = Tracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
+
+def test_disabled() -> None:
+    assert get_tracer() is None
+    with span('load'):
+        count('rows', 10)
+
+def test_span(tracer: Tracer) -> None:
+    with span('load'):
+        pass
+
+    assert [s.name for s in tracer.spans] == ['load']
+    assert tracer.spans[0].wall_time >= 0
+    assert tracer.spans[0].cpu_time >= 0
+    assert tracer.spans[0].peak_memory is None
+
+def test_span_exception(tracer: Tracer) -> None:
+    with pytest.raises(ValueError):
+        with span('load'):
+            raise ValueError()
+
+    assert [s.name for s in tracer.spans] == ['load']
+
+def test_nested_spans(tracer: Tracer) -> None:
+    with span('solve'):
+        with span('model build'):
+            pass
+
+    assert [(s.name, s.depth) for s in tracer.spans] == [('model build', 1), ('solve', 0)]
+    assert [s['name'] for s in tracer.to_json()['spans']] == ['solve', 'model build']
+
+def test_traced(tracer: Tracer) -> None:
+    @traced('validate')
+    def function(value: int) -> int:
+        return value + 1
+
+    assert function(1) == 2
+    assert [s.name for s in tracer.spans] == ['validate']
+
+def test_counters(tracer: Tracer) -> None:
+    count('rows', 10)
+    count('rows', 5)
+    count('variables')
+
+    assert tracer.counters == {'rows': 15, 'variables': 1}
+
+def test_memory() -> None:
+    tracer = Tracer(memory=True)
+    with tracer.span('outer'):
+        with tracer.span('inner'):
+            data = bytearray(1000000)
+            del data
+
+    inner, outer = tracer.spans
+    assert inner.peak_memory is not None and inner.peak_memory >= 1000000
+    assert outer.peak_memory is not None and outer.peak_memory >= inner.peak_memory
+    assert not tracemalloc.is_tracing()
+
+def test_chrome_trace(tracer: Tracer) -> None:
+    with span('load'):
+        count('rows', 10)
+
+    events = tracer.to_chrome_trace()['traceEvents']
+    assert [(e['name'], e['ph']) for e in events] == [('load', 'X'), ('rows', 'C')]
+    assert events[1]['args'] == {'rows': 10}
+
+def test_write(tracer: Tracer, tmp_path: pathlib.Path) -> None:
+    with span('load'):
+        pass
+
+    tracer.write(tmp_path / 'trace.json')
+    assert json.loads((tmp_path / 'trace.json').read_text())['spans'][0]['name'] == 'load'
+
+    tracer.write(tmp_path / 'trace.json', 'chrome')
+    assert 'traceEvents' in json.loads((tmp_path / 'trace.json').read_text())
+
+def test_write_unknown_format(tracer: Tracer, tmp_path: pathlib.Path) -> None:
+    with pytest.raises(TracerError):
+        tracer.write(tmp_path / 'trace.json', 'xml')
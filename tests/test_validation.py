@@ -0,0 +1,101 @@
+from scheduler.solver.assignment import Assignment
+from scheduler.solver.validation import validate
+from scheduler.types.course import Course
+from scheduler.types.room import Room
+from scheduler.types.shift import ShiftType
+from scheduler.types.student import Student
+from scheduler.types.weekday import Weekday
+from tests.helpers import make_shift
+
+def make_students() -> list[Student]:
+    room1 = Room('CP1', '0.08', 2)
+    room2 = Room('CP1', '0.04')
+    room3 = Room('CP2', '0.01')
+
+    algebra = Course('Álgebra Linear', [
+        make_shift('T1', Weekday.MONDAY, 9, 11, room=room2),
+        make_shift('TP1', Weekday.TUESDAY, 9, 11, room=room1),
+        make_shift('TP2', Weekday.TUESDAY, 10, 12, room=room3),
+        make_shift('TP3', Weekday.TUESDAY, 10, 12, room=room1)
+    ])
+    calculus = Course('Cálculo', [
+        make_shift('T1', Weekday.MONDAY, 10, 12, room=room3),
+        make_shift('T2', Weekday.WEDNESDAY, 10, 12, room=room1)
+    ])
+
+    return [
+        Student('A1', [algebra, calculus]),
+        Student('A2', [algebra]),
+        Student('A3', [calculus])
+    ]
+
+def make_assignment() -> Assignment:
+    return {
+        'A1': {'Álgebra Linear': ['T1', 'TP2'], 'Cálculo': ['T1']},
+        'A2': {'Álgebra Linear': ['T1', 'TP1']},
+        'A3': {'Cálculo': ['T1']}
+    }
+
+def test_valid() -> None:
+    assert validate(make_students(), {
+        'A1': {'Álgebra Linear': ['T1', 'TP1'], 'Cálculo': ['T2']},
+        'A2': {'Álgebra Linear': ['T1', 'TP2']},
+        'A3': {'Cálculo': ['T1']}
+    }).valid
+
+def test_valid_empty() -> None:
+    assert validate([], {}).valid
+
+def test_valid_complete() -> None:
+    report = validate(make_students(), make_assignment())
+
+    assert report.unknown == []
+    assert report.missing == []
+    assert report.repeated == []
+    assert report.over_capacity == []
+    assert report.double_booked == []
+    assert report.overlaps == [('A1', ('Álgebra Linear', 'T1'), ('Cálculo', 'T1'))]
+
+def test_unknown() -> None:
+    assignment = make_assignment()
+    assignment['A2']['Cálculo'] = ['T1']
+    assignment['A3']['Cálculo'].append('TP7')
+
+    assert validate(make_students(), assignment).unknown == [
+        ('A2', 'Cálculo', 'T1'),
+        ('A3', 'Cálculo', 'TP7')
+    ]
+
+def test_missing_and_repeated() -> None:
+    assignment = make_assignment()
+    assignment['A1']['Álgebra Linear'] = ['T1']
+    assignment['A2']['Álgebra Linear'] = ['T1', 'TP1', 'TP2']
+    del assignment['A3']
+
+    report = validate(make_students(), assignment)
+    assert report.missing == [
+        ('A1', 'Álgebra Linear', ShiftType.TP),
+        ('A3', 'Cálculo', ShiftType.T)
+    ]
+    assert report.repeated == [('A2', 'Álgebra Linear', ShiftType.TP)]
+
+def test_over_capacity() -> None:
+    students = make_students()
+    students.append(Student('A4', [students[1].courses['Álgebra Linear']]))
+    assignment = make_assignment()
+    assignment['A1']['Álgebra Linear'] = ['T1', 'TP1']
+    assignment['A4'] = {'Álgebra Linear': ['T1', 'TP1']}
+
+    assert validate(students, assignment).over_capacity == [('Álgebra Linear', 'TP1', 3, 2)]
+
+def test_double_booked() -> None:
+    students = make_students()
+    assignment = make_assignment()
+    assignment['A1']['Álgebra Linear'] = ['T1', 'TP3']
+
+    report = validate(students, assignment)
+    algebra = students[0].courses['Álgebra Linear']
+
+    assert report.double_booked == [
+        ('CP1 0.08', algebra.shifts['TP1'].timeslots[0], algebra.shifts['TP3'].timeslots[0])
+    ]
@@ -1,7 +1,11 @@
-from scheduler.types.weekday import Weekday
+from scheduler.types.weekday import WEEKDAY_INDICES, WEEKDAYS, Weekday
 
 def test_repr() -> None:
     assert repr(Weekday.WEDNESDAY) == 'Weekday.WEDNESDAY'
 
 def test_str() -> None:
     assert str(Weekday.MONDAY) == 'Monday'
+
+def test_indices() -> None:
+    assert WEEKDAYS[0] == Weekday.MONDAY
+    assert all(WEEKDAYS[WEEKDAY_INDICES[day]] == day for day in Weekday)